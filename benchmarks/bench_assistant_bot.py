@@ -0,0 +1,68 @@
+import contextlib
+import os
+import sys
+from typing import List, Optional
+
+# Add project root directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from benchmarks.harness import Scenario, run_scenario
+from src.assistant_bot import (
+    ContactStore,
+    Instrumentation,
+    buffered_stdout,
+    handle_command,
+    make_command_handlers,
+    parse_input,
+    print_reply,
+    run_batch,
+)
+
+CONTACTS = 20_000
+COMMANDS = (
+    [f"add user{i} {1000000000 + i}" for i in range(CONTACTS)]
+    + [f"phone user{i}" for i in range(CONTACTS)]
+    + [f"change user{i} {2000000000 + i}" for i in range(0, CONTACTS, 2)]
+    + [f"find user{i}" for i in range(0, CONTACTS, 100)]
+    + ["phone nobody", "bogus command"] * 100
+)
+
+
+def run_interactive(lines: List[str]) -> None:
+    """The interactive loop: colored output, one unbuffered print per result."""
+    command_handlers = make_command_handlers(ContactStore())
+    with open(os.devnull, "w", buffering=1) as devnull:
+        with contextlib.redirect_stdout(devnull):
+            for line in lines:
+                command, args = parse_input(line)
+                print_reply(handle_command(command_handlers, command, args))
+
+
+def run_batch_mode(
+    lines: List[str], instrumentation: Optional[Instrumentation] = None
+) -> None:
+    """Batch mode: plain output through one buffered writer."""
+    command_handlers = make_command_handlers(ContactStore(), instrumentation)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        with buffered_stdout():
+            run_batch(lines, command_handlers, colored=False)
+
+
+def run_batch_instrumented(lines: List[str]) -> None:
+    """Batch mode recording the command statistics."""
+    run_batch_mode(lines, Instrumentation(True))
+
+
+def main():
+    for name, runner in (
+        ("interactive loop", run_interactive),
+        ("batch mode", run_batch_mode),
+        ("batch mode with command statistics", run_batch_instrumented),
+    ):
+        scenario = Scenario(name, lambda runner=runner: lambda: runner(COMMANDS))
+        result = run_scenario(scenario, memory=False)
+        commands_per_second = len(COMMANDS) / (result.median_ms / 1000)
+        print(f"{name.ljust(40, '.')}: {commands_per_second:>12,.0f} commands/s")
+
+
+if __name__ == "__main__":
+    main()
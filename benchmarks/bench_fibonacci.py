@@ -0,0 +1,35 @@
+import os
+import random
+import sys
+from typing import List
+
+# Add project root directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from benchmarks.harness import Scenario, format_result, run_scenario
+from src.caching_fibonacci import caching_fibonacci, fib_many, fib_range
+
+
+def per_call(indices: List[int]) -> List[int]:
+    """Computes every index through a fresh caching_fibonacci closure."""
+    fib = caching_fibonacci()
+    return [fib(n) for n in indices]
+
+
+def main():
+    consecutive = list(range(10_000, 20_000))
+    scattered = random.Random(5).sample(range(100_000), 2_000)
+
+    cases = [
+        ("consecutive, per call", lambda: per_call(consecutive)),
+        ("consecutive, fib_range", lambda: list(fib_range(10_000, 20_000))),
+        ("consecutive, fib_many", lambda: fib_many(consecutive)),
+        ("scattered, per call", lambda: per_call(scattered)),
+        ("scattered, fib_many", lambda: fib_many(scattered)),
+    ]
+    for name, func in cases:
+        scenario = Scenario(name, lambda func=func: func)
+        print(format_result(run_scenario(scenario, memory=False)))
+
+
+if __name__ == "__main__":
+    main()
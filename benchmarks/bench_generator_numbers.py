@@ -0,0 +1,60 @@
+import os
+import sys
+from typing import Dict, List
+
+# Add project root directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from benchmarks.harness import Scenario, run_scenario
+from src.generator_numbers import (
+    NUMBER_PATTERN_BYTES,
+    generator_numbers,
+    scan_numbers,
+    sum_profit,
+)
+
+INCOME_SENTENCE = "Income of 1000.01 as the main part, plus 27,45 and 324 dollars. "
+TEXT = INCOME_SENTENCE * (10 * 2**20 // len(INCOME_SENTENCE))
+DATA = TEXT.encode()
+WINDOW_SIZE = 1 << 20
+
+
+def scan_numbers_findall(buffer: bytes) -> Dict[int, List[int]]:
+    """The previous scanner: one ``findall`` list per 1 MiB window."""
+    by_scale: Dict[int, List[int]] = {}
+    start, end = 0, len(buffer)
+    while start < end:
+        stop = end
+        if end - start > WINDOW_SIZE:
+            space = buffer.rfind(b" ", start + 1, start + WINDOW_SIZE)
+            if space != -1:
+                stop = space + 1
+        groups: Dict[int, List[bytes]] = {}
+        for int_part, fraction in NUMBER_PATTERN_BYTES.findall(buffer, start, stop):
+            groups.setdefault(len(fraction), []).append(int_part + fraction)
+        for scale, digits in groups.items():
+            values = list(map(int, digits))
+            stats = by_scale.setdefault(scale, [0, min(values), max(values)])
+            stats[0] += sum(values)
+            stats[1] = min(stats[1], *values)
+            stats[2] = max(stats[2], *values)
+        start = stop - 1 if stop < end else stop
+    return by_scale
+
+
+def main():
+    for name, func in (
+        ("sum_profit over str", lambda: sum_profit(TEXT, generator_numbers)),
+        ("findall scanner (previous)", lambda: scan_numbers_findall(DATA)),
+        ("scan_numbers over bytes", lambda: scan_numbers(DATA)),
+        ("scan_numbers over memoryview", lambda: scan_numbers(memoryview(DATA))),
+    ):
+        result = run_scenario(Scenario(name, lambda func=func: func))
+        megabytes_per_second = len(DATA) / 2**20 / (result.median_ms / 1000)
+        print(
+            f"{name.ljust(40, '.')}: {megabytes_per_second:>8,.1f} MB/s, "
+            f"peak {result.peak_kb:>10,.1f} KB"
+        )
+
+
+if __name__ == "__main__":
+    main()
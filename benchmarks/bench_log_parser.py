@@ -0,0 +1,57 @@
+import contextlib
+import os
+import sys
+from typing import List, Optional
+
+# Add project root directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from benchmarks.harness import Scenario, run_scenario
+from src.log_analyzer import (
+    LOG_LEVELS,
+    LogEntry,
+    _parse_datetime_strptime,
+    parse_log_line,
+)
+
+LINES = [
+    "2024-01-22 08:30:01 INFO User logged in successfully.",
+    "2024-01-22 08:45:23 DEBUG Attempting to connect to the database.",
+    "2024-01-22 09:00:45 ERROR Database connection failed.",
+    "2024-01-22 10:30:55 WARNING Disk usage above 80%.",
+] * 50_000
+
+
+def parse_log_line_strptime(line: str) -> Optional[LogEntry]:
+    """The previous parser: two ``datetime.strptime`` calls per line."""
+    parts = line.split(" ", 3)
+    if len(parts) < 4:
+        return None
+    try:
+        log_date, log_time = _parse_datetime_strptime(parts[0], parts[1])
+    except ValueError:
+        return None
+    log_level = parts[2].upper()
+    if log_level not in LOG_LEVELS:
+        return None
+    return LogEntry(log_date, log_time, log_level, parts[3].strip())
+
+
+def parse_all(parser, lines: List[str]) -> None:
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for line in lines:
+            parser(line)
+
+
+def main():
+    for name, parser in (
+        ("strptime parser", parse_log_line_strptime),
+        ("fixed-offset parser", parse_log_line),
+    ):
+        scenario = Scenario(name, lambda parser=parser: lambda: parse_all(parser, LINES))
+        result = run_scenario(scenario, memory=False)
+        lines_per_second = len(LINES) / (result.median_ms / 1000)
+        print(f"{name.ljust(40, '.')}: {lines_per_second:>12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+
+class Result(NamedTuple):
+    name: str
+    repeat: int
+    min_ms: float
+    median_ms: float
+    mean_ms: float
+    stdev_ms: float
+    peak_kb: float
+
+
+class Scenario(NamedTuple):
+    name: str
+    # Prepares the input data (not timed) and returns the function to time
+    setup: Callable[[], Callable[[], object]]
+
+
+def measure_time(
+    func: Callable[[], object], warmup: int = 1, repeat: int = 5
+) -> List[int]:
+    """
+    Times a function with ``perf_counter_ns`` after a few warm-up rounds.
+
+    The garbage collector is disabled while a round runs so its pauses do
+    not land in random samples.
+
+    Parameters
+    ----------
+    func : Callable[[], object]
+        The function to measure.
+    warmup : int, optional
+        The number of untimed rounds run first (default is 1).
+    repeat : int, optional
+        The number of timed rounds (default is 5).
+
+    Returns
+    -------
+    List[int]
+        The duration of every timed round in nanoseconds.
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter_ns()
+            func()
+            samples.append(time.perf_counter_ns() - start)
+            gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+
+def measure_memory(func: Callable[[], object]) -> int:
+    """
+    Runs a function once under tracemalloc and returns its peak allocation.
+
+    This is a separate run, because tracing every allocation slows the code
+    down and would distort the timings.
+
+    Parameters
+    ----------
+    func : Callable[[], object]
+        The function to measure.
+
+    Returns
+    -------
+    int
+        The peak traced memory in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_scenario(
+    scenario: Scenario, warmup: int = 1, repeat: int = 5, memory: bool = True
+) -> Result:
+    """
+    Prepares a scenario, times it and measures its peak memory.
+
+    Parameters
+    ----------
+    scenario : Scenario
+        The scenario to run.
+    warmup : int, optional
+        The number of untimed rounds (default is 1).
+    repeat : int, optional
+        The number of timed rounds (default is 5).
+    memory : bool, optional
+        Whether to measure the peak memory in an extra run (default is True).
+
+    Returns
+    -------
+    Result
+        The timing statistics in milliseconds and the peak memory in KB.
+    """
+    func = scenario.setup()
+    samples = [ns / 1e6 for ns in measure_time(func, warmup, repeat)]
+    peak = measure_memory(func) if memory else 0
+    return Result(
+        name=scenario.name,
+        repeat=repeat,
+        min_ms=min(samples),
+        median_ms=statistics.median(samples),
+        mean_ms=statistics.mean(samples),
+        stdev_ms=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        peak_kb=peak / 1024,
+    )
+
+
+def format_result(result: Result) -> str:
+    """Formats a result as one aligned report line."""
+    return (
+        f"{result.name.ljust(40, '.')}: "
+        f"median {result.median_ms:>10.3f} ms; min {result.min_ms:>10.3f} ms; "
+        f"stdev {result.stdev_ms:>8.3f} ms; peak {result.peak_kb:>12.1f} KB"
+    )
+
+
+def save_results(results: List[Result], path: str) -> None:
+    """
+    Writes results to a JSON file together with a description of the machine.
+
+    Parameters
+    ----------
+    results : List[Result]
+        The benchmark results.
+    path : str
+        The path to the JSON file.
+    """
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "results": [result._asdict() for result in results],
+    }
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Result]:
+    """
+    Reads results written by ``save_results``.
+
+    Parameters
+    ----------
+    path : str
+        The path to the JSON file.
+
+    Returns
+    -------
+    Dict[str, Result]
+        The results keyed by scenario name.
+    """
+    with open(path) as file:
+        document = json.load(file)
+    return {item["name"]: Result(**item) for item in document["results"]}
+
+
+def find_regressions(
+    results: List[Result], baseline: Dict[str, Result], threshold: float
+) -> List[str]:
+    """
+    Compares median timings with a baseline.
+
+    Parameters
+    ----------
+    results : List[Result]
+        The current results.
+    baseline : Dict[str, Result]
+        The baseline results keyed by scenario name.
+    threshold : float
+        The allowed relative slowdown, e.g. 0.1 for 10%.
+
+    Returns
+    -------
+    List[str]
+        A description of every scenario slower than the baseline allows.
+    """
+    regressions = []
+    for result in results:
+        reference: Optional[Result] = baseline.get(result.name)
+        if reference is None or reference.median_ms <= 0:
+            continue
+        change = result.median_ms / reference.median_ms - 1
+        if change > threshold:
+            regressions.append(
+                f"{result.name}: {reference.median_ms:.3f} ms -> "
+                f"{result.median_ms:.3f} ms (+{change:.1%})"
+            )
+    return regressions
@@ -0,0 +1,134 @@
+import argparse
+import asyncio
+import contextlib
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import deque
+from time import perf_counter
+from typing import Iterator, List
+
+# Add project root directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.assistant_bot import SERVER_HOST
+
+BOT_SCRIPT = os.path.join(os.path.dirname(__file__), "..", "src", "assistant_bot.py")
+
+
+def client_commands(client: int, count: int) -> List[str]:
+    """A mix of 20% adds, 10% changes, 10% finds and 60% phone lookups."""
+    commands = []
+    for i in range(count):
+        name = f"c{client}u{i % 1000}"
+        kind = i % 10
+        if kind < 2:
+            commands.append(f"add {name} {1000000 + i}")
+        elif kind < 3:
+            commands.append(f"change {name} {2000000 + i}")
+        elif kind < 4:
+            commands.append(f"find c{client}u{i % 100}")
+        else:
+            commands.append(f"phone {name}")
+    return commands
+
+
+async def run_client(
+    host: str, port: int, commands: List[str], depth: int, latencies: List[float]
+) -> None:
+    """Send the commands with up to ``depth`` in flight, timing each reply."""
+    reader, writer = await asyncio.open_connection(host, port)
+    sent_at: deque = deque()
+    window = asyncio.Semaphore(depth)
+
+    async def send() -> None:
+        for command in commands:
+            await window.acquire()
+            sent_at.append(perf_counter())
+            writer.write(f"{command}\n".encode())
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for _ in commands:
+        status = await reader.readline()
+        for _ in range(int(status.split()[-1])):
+            await reader.readline()
+        latencies.append(perf_counter() - sent_at.popleft())
+        window.release()
+    await sender
+    writer.close()
+    await writer.wait_closed()
+
+
+async def load_test(host: str, port: int, clients: int, commands: int, depth: int):
+    latencies: List[float] = []
+    start = perf_counter()
+    await asyncio.gather(
+        *(
+            run_client(host, port, client_commands(client, commands), depth, latencies)
+            for client in range(clients)
+        )
+    )
+    seconds = perf_counter() - start
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"{clients} clients x {commands:,} commands, pipeline depth {depth}")
+    rate = len(latencies) / seconds
+    print(f"{'throughput'.ljust(40, '.')}: {rate:>12,.0f} commands/s")
+    print(f"{'p50 latency'.ljust(40, '.')}: {percentiles[49] * 1000:>12.3f} ms")
+    print(f"{'p99 latency'.ljust(40, '.')}: {percentiles[98] * 1000:>12.3f} ms")
+
+
+@contextlib.contextmanager
+def local_server(host: str) -> Iterator[int]:
+    """Run an in-memory bot server in a subprocess and yield its port."""
+    with socket.socket() as probe:
+        probe.bind((host, 0))
+        port = probe.getsockname()[1]
+    process = subprocess.Popen(
+        [sys.executable, BOT_SCRIPT, "--memory", "--serve", str(port), "--host", host],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        while True:
+            try:
+                socket.create_connection((host, port), timeout=1).close()
+                break
+            except OSError:
+                if process.poll() is not None:
+                    raise RuntimeError("The server did not start.")
+                time.sleep(0.05)
+        yield port
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the assistant bot server.")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument(
+        "--port", type=int, help="use a running server (default: start one)"
+    )
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--commands", type=int, default=2000, help="per client")
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=16,
+        help="commands in flight per client (also measured with 1)",
+    )
+    args = parser.parse_args()
+
+    with contextlib.ExitStack() as stack:
+        port = args.port
+        if port is None:
+            port = stack.enter_context(local_server(args.host))
+        for depth in sorted({1, args.depth}):
+            asyncio.run(load_test(args.host, port, args.clients, args.commands, depth))
+            print()
+
+
+if __name__ == "__main__":
+    main()
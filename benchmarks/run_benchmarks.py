@@ -0,0 +1,186 @@
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+from typing import Callable, List
+
+# Add project root directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from benchmarks.harness import (
+    Scenario,
+    find_regressions,
+    format_result,
+    load_results,
+    run_scenario,
+    save_results,
+)
+from src.caching_fibonacci import caching_fibonacci
+from src.generator_numbers import generator_numbers, scan_numbers, sum_profit
+from src.log_analyzer import count_logs_by_level, filter_logs_by_level, load_logs
+
+LOG_TEMPLATES = [
+    "2024-01-22 08:30:01 INFO User logged in successfully.",
+    "2024-01-22 08:45:23 DEBUG Attempting to connect to the database.",
+    "2024-01-22 09:00:45 ERROR Database connection failed.",
+    "2024-01-22 10:30:55 WARNING Disk usage above 80%.",
+]
+INCOME_SENTENCE = "Income of 1000.01 as the main part, plus 27,45 and 324 dollars. "
+
+
+def fibonacci_scenario(n: int) -> Scenario:
+    """Cold computation of F(n) with a fresh cache every round."""
+
+    def setup() -> Callable[[], object]:
+        return lambda: caching_fibonacci()(n)
+
+    return Scenario(f"caching_fibonacci fib({n})", setup)
+
+
+def sum_profit_scenario(size: int) -> Scenario:
+    """sum_profit over an in-memory text of about ``size`` bytes."""
+
+    def setup() -> Callable[[], object]:
+        text = INCOME_SENTENCE * (size // len(INCOME_SENTENCE) + 1)
+        return lambda: sum_profit(text, generator_numbers)
+
+    return Scenario(f"sum_profit {size // 2**20} MB text", setup)
+
+
+def scan_numbers_scenario(size: int) -> Scenario:
+    """scan_numbers over the same text as bytes, for comparison."""
+
+    def setup() -> Callable[[], object]:
+        text = INCOME_SENTENCE * (size // len(INCOME_SENTENCE) + 1)
+        data = text.encode()
+        return lambda: scan_numbers(data)
+
+    return Scenario(f"scan_numbers {size // 2**20} MB text", setup)
+
+
+def log_analyzer_scenario(lines: int, directory: str) -> Scenario:
+    """Loading, counting and filtering a log file of ``lines`` lines."""
+
+    def setup() -> Callable[[], object]:
+        path = os.path.join(directory, "bench.log")
+        with open(path, "w") as file:
+            batch = "\n".join(LOG_TEMPLATES) + "\n"
+            for _ in range(lines // len(LOG_TEMPLATES)):
+                file.write(batch)
+
+        def run() -> object:
+            logs = load_logs(path)
+            return count_logs_by_level(logs), filter_logs_by_level(logs, "error")
+
+        return run
+
+    return Scenario(f"log_analyzer {lines:,} lines", setup)
+
+
+def assistant_bot_scenario(contacts_count: int) -> Scenario:
+    """Adding ``contacts_count`` contacts and looking each of them up."""
+
+    def setup() -> Callable[[], object]:
+        from src.assistant_bot import add_contact, show_phone
+
+        names = [f"user{i}" for i in range(contacts_count)]
+
+        def run() -> object:
+            contacts = {}
+            with open(os.devnull, "w") as devnull:
+                with contextlib.redirect_stdout(devnull):
+                    for i, name in enumerate(names):
+                        add_contact(contacts, name, str(1000000000 + i))
+                    for name in names:
+                        show_phone(contacts, name)
+            return contacts
+
+        return run
+
+    return Scenario(f"assistant_bot {contacts_count:,} contacts", setup)
+
+
+def contact_store_scenario(contacts_count: int, directory: str) -> Scenario:
+    """Opening a persisted store of ``contacts_count`` contacts (snapshot + journal)."""
+
+    def setup() -> Callable[[], object]:
+        from src.assistant_bot import ContactStore
+
+        path = os.path.join(directory, "contacts")
+        with ContactStore(path) as contacts:
+            contacts.update(
+                (f"user{i}", str(1000000000 + i)) for i in range(contacts_count)
+            )
+            contacts.snapshot()
+            for i in range(0, contacts_count, 100):
+                contacts[f"user{i}"] = str(2000000000 + i)
+
+        def run() -> object:
+            with ContactStore(path) as contacts:
+                return len(contacts)
+
+        return run
+
+    return Scenario(f"assistant_bot load {contacts_count:,} contacts", setup)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the project benchmarks.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiplier for the input sizes (e.g. 0.01 for a quick run)",
+    )
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip the tracemalloc run"
+    )
+    parser.add_argument("--only", help="run only scenarios containing this text")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with results from this file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="allowed relative slowdown against the baseline (default 0.10)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        scenarios: List[Scenario] = [
+            fibonacci_scenario(max(int(100_000 * args.scale), 2)),
+            sum_profit_scenario(max(int(2**30 * args.scale), 2**20)),
+            scan_numbers_scenario(max(int(2**30 * args.scale), 2**20)),
+            log_analyzer_scenario(max(int(10_000_000 * args.scale), 4), directory),
+            assistant_bot_scenario(max(int(1_000_000 * args.scale), 1)),
+            contact_store_scenario(max(int(1_000_000 * args.scale), 1), directory),
+        ]
+        if args.only:
+            scenarios = [s for s in scenarios if args.only in s.name]
+
+        results = []
+        for scenario in scenarios:
+            result = run_scenario(
+                scenario, args.warmup, args.repeat, memory=not args.no_memory
+            )
+            print(format_result(result))
+            results.append(result)
+
+    if args.output:
+        save_results(results, args.output)
+    if args.baseline:
+        regressions = find_regressions(
+            results, load_results(args.baseline), args.threshold
+        )
+        if regressions:
+            print("\nRegressions against the baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("\nNo regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
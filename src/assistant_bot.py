@@ -1,35 +1,725 @@
+import argparse
+import asyncio
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
 import sys
-from typing import Callable, Dict, List, Optional
+from bisect import bisect_left, insort
+from time import monotonic, perf_counter, perf_counter_ns, time
+from types import SimpleNamespace
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 from colorama import Fore, Style, init
 
+# Contact storage: default data directory, the batched fsync policy (every
+# SYNC_EVERY journal records or SYNC_INTERVAL seconds; every record is
+# flushed at once) and the journal size that triggers a snapshot
+DEFAULT_DATA_DIR = os.path.join(os.path.expanduser("~"), ".assistant_bot")
+SYNC_EVERY = 64
+SYNC_INTERVAL = 1.0
+SNAPSHOT_MIN_RECORDS = 10_000
+SNAPSHOT_MAGIC = b"CONTACTS1"
+# Contact search: the most contacts listed by "find" and the largest edit
+# distance of its suggestions
+FIND_LIMIT = 20
+FUZZY_MAX_DISTANCE = 2
+# Batch mode: stdout buffer size and the most failed line numbers reported
+BATCH_BUFFER_SIZE = 1 << 20
+BATCH_FAILED_LINES = 10
+# Server mode: the default address and the longest command line accepted
+SERVER_HOST = "127.0.0.1"
+SERVER_MAX_LINE = 64 * 1024
+# Instrumentation: latency buckets (powers of two of microseconds), the
+# name unknown commands are counted under, the seconds between JSON dumps
+# and the functions shown by the profiler
+LATENCY_BUCKETS = 24
+UNKNOWN_COMMAND = "?"
+STATS_DUMP_INTERVAL = 60.0
+PROFILE_TOP = 20
+# Sorts after every character, so prefix + _MAX_CHAR bounds a prefix range
+_MAX_CHAR = "\U0010ffff"
+
+
+class ContactIndex:
+    """Search indexes over contacts: name prefixes, phone numbers and typos.
+
+    Names are kept in a sorted list, so the names with a given prefix form
+    a contiguous range found by binary search. A reverse index maps every
+    phone number to its names (a single name is stored unwrapped to save
+    memory). Fuzzy search walks the sorted names as an implicit trie: the
+    edit distance rows of a shared prefix are computed once, and a prefix
+    whose best row value already exceeds the limit is skipped as a whole.
+    The indexes are updated in place by ``add``, ``change`` and ``remove``.
+
+    Parameters
+    ----------
+    contacts : Optional[Dict[str, str]]
+        The contacts to index (default is None, no contacts).
+    """
+
+    def __init__(self, contacts: Optional[Dict[str, str]] = None):
+        contacts = contacts or {}
+        self.names: List[str] = sorted(contacts)
+        self.phones: Dict[str, Union[str, List[str]]] = {}
+        for name, phone in contacts.items():
+            self._add_phone(phone, name)
+
+    def _add_phone(self, phone: str, name: str):
+        names = self.phones.get(phone)
+        if names is None:
+            self.phones[phone] = name
+        elif isinstance(names, str):
+            self.phones[phone] = [names, name]
+        else:
+            names.append(name)
+
+    def _remove_phone(self, phone: str, name: str):
+        names = self.phones[phone]
+        if isinstance(names, str):
+            del self.phones[phone]
+            return
+        names.remove(name)
+        if len(names) == 1:
+            self.phones[phone] = names[0]
+
+    def add(self, name: str, phone: str):
+        """Index a new contact."""
+        insort(self.names, name)
+        self._add_phone(phone, name)
+
+    def change(self, name: str, old_phone: str, new_phone: str):
+        """Update the phone number of an indexed contact."""
+        self._remove_phone(old_phone, name)
+        self._add_phone(new_phone, name)
+
+    def remove(self, name: str, phone: str):
+        """Remove a contact from the indexes."""
+        del self.names[bisect_left(self.names, name)]
+        self._remove_phone(phone, name)
+
+    def _prefix_range(self, prefix: str) -> Tuple[int, int]:
+        start = bisect_left(self.names, prefix)
+        return start, bisect_left(self.names, prefix + _MAX_CHAR, start)
+
+    def count_prefix(self, prefix: str) -> int:
+        """Count the names that start with a prefix."""
+        start, end = self._prefix_range(prefix)
+        return end - start
+
+    def prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """List the names that start with a prefix, in sorted order.
+
+        Parameters
+        ----------
+        prefix : str
+            The beginning of the names.
+        limit : Optional[int]
+            The most names to return (default is None, all).
+
+        Returns
+        -------
+        List[str]
+            The matching names.
+        """
+        start, end = self._prefix_range(prefix)
+        if limit is not None:
+            end = min(end, start + limit)
+        return self.names[start:end]
+
+    def by_phone(self, phone: str) -> List[str]:
+        """List the names with a phone number."""
+        names = self.phones.get(phone, [])
+        return [names] if isinstance(names, str) else list(names)
+
+    def fuzzy(self, query: str, max_distance: int) -> List[Tuple[int, str]]:
+        """Find the names within an edit distance of a query.
+
+        Parameters
+        ----------
+        query : str
+            The name as typed.
+        max_distance : int
+            The largest Levenshtein distance (insertions, deletions and
+            substitutions) of a match.
+
+        Returns
+        -------
+        List[Tuple[int, str]]
+            The distances and the names, closest first.
+        """
+        names = self.names
+        # rows[depth] is the edit distance row of the first depth characters
+        # of the current name against every prefix of the query
+        rows = [list(range(len(query) + 1))]
+        previous = ""
+        matches = []
+        index = 0
+        while index < len(names):
+            name = names[index]
+            shared = 0
+            limit = min(len(name), len(previous), len(rows) - 1)
+            while shared < limit and name[shared] == previous[shared]:
+                shared += 1
+            del rows[shared + 1 :]
+
+            pruned = False
+            for depth in range(shared, len(name)):
+                above = rows[-1]
+                row = [above[0] + 1]
+                for column, char in enumerate(query, 1):
+                    row.append(
+                        min(
+                            row[column - 1] + 1,
+                            above[column] + 1,
+                            above[column - 1] + (char != name[depth]),
+                        )
+                    )
+                rows.append(row)
+                if min(row) > max_distance:
+                    pruned = True
+                    break
+
+            previous = name
+            if pruned:
+                # No name with this prefix can come within the distance
+                prefix = name[: len(rows) - 1]
+                index = bisect_left(names, prefix + _MAX_CHAR, index + 1)
+                continue
+            if rows[-1][-1] <= max_distance:
+                matches.append((rows[-1][-1], name))
+            index += 1
+        matches.sort()
+        return matches
+
+
+class ContactStore(dict):
+    """A contacts dictionary persisted to a directory.
+
+    Every assignment (and deletion) is appended to the journal and flushed
+    to the operating system at once, so it survives the process; the fsync
+    that makes it survive a power loss is batched, every ``sync_every``
+    records or ``sync_interval`` seconds, and on ``sync`` and ``close``.
+    Callers that may sit idle call ``sync`` when ``unsynced`` is not zero.
+    Once the journal holds more records than the store has contacts (and at
+    least ``snapshot_min_records``), a compact snapshot replaces it: all
+    names and all phones as two newline-joined blocks, which load in one
+    pass. At startup the snapshot is loaded and the journal replayed on top
+    of it.
+
+    Without a directory the store is a plain in-memory dictionary. Reads are
+    those of ``dict``; only ``[]=``, ``del`` and ``update`` may modify it.
+    The search ``index`` is built on first use and then kept up to date by
+    every change.
+
+    Parameters
+    ----------
+    directory : Optional[str]
+        The data directory, created if missing (default is None, in memory).
+    sync_every : int
+        The number of journal records between fsyncs (default is SYNC_EVERY).
+    sync_interval : float
+        The maximum seconds between fsyncs (default is SYNC_INTERVAL).
+    snapshot_min_records : int
+        The smallest journal that is compacted (default is SNAPSHOT_MIN_RECORDS).
+    """
+
+    SNAPSHOT_NAME = "contacts.snapshot"
+    JOURNAL_NAME = "contacts.journal"
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        sync_every: int = SYNC_EVERY,
+        sync_interval: float = SYNC_INTERVAL,
+        snapshot_min_records: int = SNAPSHOT_MIN_RECORDS,
+    ):
+        super().__init__()
+        self.directory = directory
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.snapshot_min_records = snapshot_min_records
+        self._journal = None
+        self._journal_records = 0
+        self._unsynced = 0
+        self._last_sync = monotonic()
+        self._index: Optional[ContactIndex] = None
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._load_snapshot()
+            self._replay_journal()
+            self._journal = open(self._path(self.JOURNAL_NAME), "ab")
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _load_snapshot(self):
+        try:
+            with open(self._path(self.SNAPSHOT_NAME), "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return
+        header, _, body = data.partition(b"\n")
+        magic, count, names_size = header.split()
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a contacts snapshot.")
+        if int(count):
+            names = body[: int(names_size)].decode("utf-8").split("\n")
+            phones = body[int(names_size) :].decode("utf-8").split("\n")
+            dict.update(self, zip(names, phones))
+
+    def _replay_journal(self):
+        path = self._path(self.JOURNAL_NAME)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            # Drop a record torn by a crash in the middle of a write
+            with open(path, "r+b") as file:
+                file.truncate(end)
+        records = data[:end].decode("utf-8").split("\n")[:-1]
+        for record in records:
+            name, tab, phone = record.partition("\t")
+            if tab:
+                dict.__setitem__(self, name, phone)
+            else:
+                dict.pop(self, name, None)
+        self._journal_records = len(records)
+
+    def _append(self, record: str):
+        if self._journal is None:
+            return
+        self._journal.write(record.encode("utf-8"))
+        self._journal.flush()
+        self._journal_records += 1
+        self._unsynced += 1
+        if (
+            self._unsynced >= self.sync_every
+            or monotonic() - self._last_sync >= self.sync_interval
+        ):
+            self.sync()
+        if self._journal_records >= max(self.snapshot_min_records, len(self)):
+            self.snapshot()
+
+    @property
+    def unsynced(self) -> int:
+        """The number of journal records flushed but not yet fsynced."""
+        return self._unsynced
+
+    @property
+    def index(self) -> ContactIndex:
+        """The search indexes of the contacts."""
+        if self._index is None:
+            self._index = ContactIndex(self)
+        return self._index
+
+    def __setitem__(self, name: str, phone: str):
+        if "\t" in name or "\n" in name or "\n" in phone:
+            raise ValueError("Names and phone numbers cannot contain tabs or line breaks.")
+        old_phone = self.get(name)
+        super().__setitem__(name, phone)
+        if self._index is not None:
+            if old_phone is None:
+                self._index.add(name, phone)
+            else:
+                self._index.change(name, old_phone, phone)
+        self._append(f"{name}\t{phone}\n")
+
+    def __delitem__(self, name: str):
+        phone = self[name]
+        super().__delitem__(name)
+        if self._index is not None:
+            self._index.remove(name, phone)
+        self._append(f"{name}\n")
+
+    def update(self, *args, **kwargs):
+        for name, phone in dict(*args, **kwargs).items():
+            self[name] = phone
+
+    def _not_journaled(self, *args, **kwargs):
+        raise TypeError("This operation is not supported by ContactStore.")
+
+    pop = popitem = setdefault = clear = __ior__ = _not_journaled
+
+    def sync(self):
+        """Flush the journal and fsync it to disk."""
+        if self._journal is not None:
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+        self._unsynced = 0
+        self._last_sync = monotonic()
+
+    def snapshot(self):
+        """Write all contacts to a new snapshot and empty the journal."""
+        if self._journal is None:
+            return
+        names = "\n".join(self.keys()).encode("utf-8")
+        phones = "\n".join(self.values()).encode("utf-8")
+        path = self._path(self.SNAPSHOT_NAME)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(b"%s %d %d\n" % (SNAPSHOT_MAGIC, len(self), len(names)))
+            file.write(names)
+            file.write(phones)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+        # Replaying the old journal over the new snapshot changes nothing,
+        # so a crash before the truncation below loses no data
+        self._journal.truncate(0)
+        self._journal_records = 0
+        self.sync()
+
+    def close(self):
+        """Sync the journal and close the store."""
+        if self._journal is not None:
+            self.sync()
+            self._journal.close()
+            self._journal = None
+
+    def __enter__(self) -> "ContactStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CommandCounters:
+    """The calls, errors and latencies of one command."""
+
+    __slots__ = ("calls", "errors", "total_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors: Dict[str, int] = {}
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * LATENCY_BUCKETS
+
+    def percentile(self, fraction: float) -> int:
+        """The upper bound in microseconds of the bucket holding the percentile."""
+        rank = fraction * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return 1 << bucket
+        return 0
+
+
+class CommandStats:
+    """Call counts, errors by exception type and latencies of the commands.
+
+    Every command gets its own ``CommandCounters``; an unknown command is
+    counted as UNKNOWN_COMMAND. Latencies go to power-of-two buckets of
+    microseconds, where bucket ``b`` holds the calls faster than ``2**b``
+    microseconds (the last bucket holds all slower calls), so recording a
+    call costs a few integer operations. Percentiles are the upper bounds
+    of their buckets.
+
+    With a ``dump_path``, the statistics are written there as JSON at
+    most every ``dump_interval`` seconds, when a command completes, and
+    by ``dump``.
+
+    Parameters
+    ----------
+    dump_path : Optional[str]
+        The JSON file for the periodic dumps (default is None, no dumps).
+    dump_interval : float
+        The seconds between dumps (default is STATS_DUMP_INTERVAL).
+    """
+
+    def __init__(
+        self,
+        dump_path: Optional[str] = None,
+        dump_interval: float = STATS_DUMP_INTERVAL,
+    ):
+        self.dump_path = dump_path
+        self.dump_interval = dump_interval
+        self.commands: Dict[str, CommandCounters] = {}
+        self.started = time()
+        self._next_dump_ns = perf_counter_ns() + int(dump_interval * 1e9)
+
+    def record(self, command: str, error: Optional[str], start_ns: int, end_ns: int):
+        """Count one call of a command.
+
+        Parameters
+        ----------
+        command : str
+            The command name.
+        error : Optional[str]
+            The exception type name if the command failed.
+        start_ns, end_ns : int
+            The ``perf_counter_ns`` readings before and after the command.
+        """
+        counters = self.commands.get(command)
+        if counters is None:
+            counters = self.commands[command] = CommandCounters()
+        elapsed = end_ns - start_ns
+        counters.calls += 1
+        counters.total_ns += elapsed
+        if elapsed > counters.max_ns:
+            counters.max_ns = elapsed
+        counters.buckets[min((elapsed // 1000).bit_length(), LATENCY_BUCKETS - 1)] += 1
+        if error is not None:
+            counters.errors[error] = counters.errors.get(error, 0) + 1
+        if end_ns >= self._next_dump_ns:
+            self.dump_if_due(end_ns)
+
+    def reset(self):
+        """Forget all the counts."""
+        self.commands.clear()
+        self.started = time()
+
+    def to_dict(self) -> dict:
+        """Return the statistics as a JSON-serializable dictionary."""
+        commands = {}
+        for command, counters in sorted(self.commands.items()):
+            histogram = {}
+            for bucket, count in enumerate(counters.buckets):
+                if count:
+                    label = (
+                        f"<{1 << bucket}"
+                        if bucket < LATENCY_BUCKETS - 1
+                        else f">={1 << (bucket - 1)}"
+                    )
+                    histogram[label] = count
+            commands[command] = {
+                "calls": counters.calls,
+                "errors": dict(sorted(counters.errors.items())),
+                "mean_us": round(counters.total_ns / counters.calls / 1000, 3),
+                "p50_us": counters.percentile(0.5),
+                "p99_us": counters.percentile(0.99),
+                "max_us": round(counters.max_ns / 1000, 3),
+                "histogram_us": histogram,
+            }
+        return {
+            "time": time(),
+            "uptime_seconds": round(time() - self.started, 3),
+            "commands": commands,
+        }
+
+    def dump_if_due(self, now_ns: Optional[int] = None):
+        """Dump the statistics if ``dump_interval`` has passed since the last dump.
+
+        Parameters
+        ----------
+        now_ns : Optional[int]
+            A current ``perf_counter_ns`` reading (default is None, read it).
+        """
+        if now_ns is None:
+            now_ns = perf_counter_ns()
+        if now_ns >= self._next_dump_ns:
+            self.dump()
+
+    def dump(self):
+        """Write the statistics to ``dump_path``, if set, replacing the file."""
+        self._next_dump_ns = perf_counter_ns() + int(self.dump_interval * 1e9)
+        if self.dump_path is None:
+            return
+        temp_path = f"{self.dump_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+            file.write("\n")
+        os.replace(temp_path, self.dump_path)
+
+
+def _without_codes(codes: object) -> SimpleNamespace:
+    """Stand-in for colorama's ``Fore`` or ``Style`` with every code empty."""
+    return SimpleNamespace(**dict.fromkeys(vars(codes), ""))
+
+
+_PLAIN_FORE = _without_codes(Fore)
+_PLAIN_STYLE = _without_codes(Style)
+
+
+def color_codes(colored: bool) -> Tuple[object, object]:
+    """Return the codes messages are colored with.
+
+    Parameters
+    ----------
+    colored : bool
+        Whether to emit ANSI color codes.
+
+    Returns
+    -------
+    Tuple[object, object]
+        colorama's ``Fore`` and ``Style``, or stand-ins with every code
+        empty.
+    """
+    if colored:
+        return Fore, Style
+    return _PLAIN_FORE, _PLAIN_STYLE
+
+
+class Line(NamedTuple):
+    """One line of a reply.
+
+    ``color`` is the name of a ``Fore`` color ('' for the default). A line
+    with ``values`` has a format string as its ``text``; the values fill its
+    fields and are highlighted when colors are on.
+    """
+
+    color: str
+    text: str
+    values: Tuple[object, ...] = ()
+
+
+class Reply(NamedTuple):
+    """The result of a command, rendered by the interface that ran it.
+
+    ``error`` is the name of the exception type if the command failed, and
+    ``close`` asks the interface to end the session.
+    """
+
+    lines: List[Line]
+    error: Optional[str] = None
+    close: bool = False
+
+
+def reply_text(reply: Reply) -> List[str]:
+    """Return the lines of a reply as plain text.
+
+    Parameters
+    ----------
+    reply : Reply
+        The reply of a command.
+
+    Returns
+    -------
+    List[str]
+        The text lines, without color codes.
+    """
+    return [
+        line.text.format(*line.values) if line.values else line.text
+        for line in reply.lines
+    ]
+
+
+def render_reply(reply: Reply, colored: bool = True) -> str:
+    """Return a reply as text, in colors or plain.
+
+    Parameters
+    ----------
+    reply : Reply
+        The reply of a command.
+    colored : bool
+        Whether to emit ANSI color codes (default is True).
+
+    Returns
+    -------
+    str
+        The lines of the reply joined by line breaks.
+    """
+    fore, style = color_codes(colored)
+    rendered = []
+    for color, text, values in reply.lines:
+        base = getattr(fore, color) if color else ""
+        if values:
+            text = text.format(*[f"{fore.CYAN}{value}{base}" for value in values])
+        rendered.append(f"{base}{text}{style.RESET_ALL}")
+    return "\n".join(rendered)
+
+
+def print_reply(reply: Reply, colored: bool = True) -> None:
+    """Print a reply, in colors unless ``colored`` is False."""
+    if reply.lines:
+        print(render_reply(reply, colored))
+
+
+def _error_reply(title: str, error: Exception) -> Reply:
+    return Reply(
+        [Line("RED", title), Line("MAGENTA", str(error))], type(error).__name__
+    )
+
+
+class Instrumentation:
+    """The command statistics and the profiler of a set of command handlers.
+
+    The calls are recorded in ``stats`` while ``enabled`` is set, and the
+    handlers run under ``profiler`` while it is not None; the stats and
+    profile commands change both.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether to record the commands (default is False).
+    dump_path : Optional[str]
+        The JSON file for the periodic dumps (default is None, no dumps).
+    dump_interval : float
+        The seconds between dumps (default is STATS_DUMP_INTERVAL).
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        dump_path: Optional[str] = None,
+        dump_interval: float = STATS_DUMP_INTERVAL,
+    ):
+        self.stats = CommandStats(dump_path, dump_interval)
+        self.enabled = enabled
+        self.profiler: Optional[cProfile.Profile] = None
+
+
+class CommandHandlers(dict):
+    """The handlers of the commands by name, with their instrumentation.
+
+    A dictionary mapping commands to their handlers, as built by
+    ``make_command_handlers``, that also carries the ``Instrumentation``
+    ``handle_command`` records their calls with.
+
+    Parameters
+    ----------
+    handlers : Dict[str, Callable[[Optional[List[str]]], Reply]]
+        The handlers by command name.
+    instrumentation : Instrumentation
+        The statistics and the profiler of the calls.
+    """
+
+    def __init__(
+        self,
+        handlers: Dict[str, Callable[[Optional[List[str]]], Reply]],
+        instrumentation: Instrumentation,
+    ):
+        super().__init__(handlers)
+        self.instrumentation = instrumentation
+
 
 def input_error(handler: Callable) -> Callable:
-    """Decorator for handling errors in command functions."""
+    """Decorator for handling errors in command functions.
+
+    An error is turned into a reply that describes it, with the exception
+    type as its ``error``.
+    """
 
     def wrapper(*args, **kwargs):
         try:
             return handler(*args, **kwargs)
         except TypeError as e:
-            print(
-                f"{Fore.RED}Error: Incorrect command.\n{Fore.MAGENTA}{e}{Style.RESET_ALL}"
-            )
-            help_command()
+            return _error_reply("Error: Incorrect command.", e)
         except ValueError as e:
-            print(
-                f"{Fore.RED}Error: Incorrect arguments.\n{Fore.MAGENTA}{e}{Style.RESET_ALL}"
-            )
+            return _error_reply("Error: Incorrect arguments.", e)
         except KeyError as e:
-            print(
-                f"{Fore.RED}Error: Contact not found.\n{Fore.MAGENTA}{e}{Style.RESET_ALL}"
-            )
+            return _error_reply("Error: Contact not found.", e)
         except IndexError as e:
-            print(
-                f"{Fore.RED}Error: Index out of range.\n{Fore.MAGENTA}{e}{Style.RESET_ALL}"
-            )
+            return _error_reply("Error: Index out of range.", e)
         except Exception as e:
-            print(
-                f"{Fore.RED}An unexpected error occurred:\n{Fore.MAGENTA}{e}{Style.RESET_ALL}"
-            )
+            return _error_reply("An unexpected error occurred:", e)
 
     return wrapper
 
@@ -54,38 +744,73 @@ def parse_input(user_input: str) -> tuple[str, List[str]]:
 
 
 @input_error
+def _run_command(
+    command_handlers: Dict[str, Callable[[Optional[List[str]]], Reply]],
+    command: str,
+    args: Optional[List[str]],
+) -> Reply:
+    if command in command_handlers:
+        if args is None:
+            args = []  # Use an empty list if no arguments are provided
+        return command_handlers[command](args)
+    else:
+        raise TypeError(f"Unknown command '{command}'")
+
+
 def handle_command(
-    command_handlers: Dict[str, Callable[[Optional[List[str]]], None]],
+    command_handlers: Dict[str, Callable[[Optional[List[str]]], Reply]],
     command: str,
     args: Optional[List[str]],
-) -> None:
+) -> Reply:
     """Handle the given command using the appropriate handler.
 
+    If the handlers are ``CommandHandlers``, the call is recorded in their
+    command statistics while these are on, and the handler runs under their
+    profiler while profiling.
+
     Parameters
     ----------
-    command_handlers : Dict[str, Callable[[Optional[List[str]]], None]]
+    command_handlers : Dict[str, Callable[[Optional[List[str]]], Reply]]
         A dictionary mapping commands to their handlers.
     command : str
         The command to handle.
     args : Optional[List[str]]
         The arguments for the command.
+
+    Returns
+    -------
+    Reply
+        The result of the command.
     """
-    if command in command_handlers:
-        if args is None:
-            args = []  # Use an empty list if no arguments are provided
-        command_handlers[command](args)
-    else:
-        raise TypeError(f"Unknown command '{command}'")
+    instrumentation = getattr(command_handlers, "instrumentation", None)
+    if instrumentation is None or (
+        not instrumentation.enabled and instrumentation.profiler is None
+    ):
+        return _run_command(command_handlers, command, args)
+
+    profiler = instrumentation.profiler
+
+    if profiler is not None:
+        profiler.enable()
+    start_ns = perf_counter_ns()
+    reply = _run_command(command_handlers, command, args)
+    end_ns = perf_counter_ns()
+    if profiler is not None:
+        profiler.disable()
+    if instrumentation.enabled:
+        name = command if command in command_handlers else UNKNOWN_COMMAND
+        instrumentation.stats.record(name, reply.error, start_ns, end_ns)
+    return reply
 
 
 @input_error
-def hello() -> None:
+def hello() -> Reply:
     """Greet the user."""
-    print(f"{Fore.CYAN}How can I help you?{Style.RESET_ALL}")
+    return Reply([Line("CYAN", "How can I help you?")])
 
 
 @input_error
-def add_contact(contacts: Dict[str, str], *args: str) -> None:
+def add_contact(contacts: Dict[str, str], *args: str) -> Reply:
     """Add a new contact.
 
     Parameters
@@ -94,29 +819,49 @@ def add_contact(contacts: Dict[str, str], *args: str) -> None:
         The dictionary of contacts.
     args : str
         The name and phone number of the new contact.
+
+    Returns
+    -------
+    Reply
+        The result of the command.
     """
     if len(args) != 2:
         raise ValueError("Usage: add [name] [phone number]")
     name, phone = args
     if name in contacts:
         if contacts[name] == phone:
-            print(
-                f'{Fore.YELLOW}Contact "{Fore.CYAN}{name}{Fore.YELLOW}" with phone number "{Fore.CYAN}{phone}{Fore.YELLOW}" already exists.{Style.RESET_ALL}'
+            return Reply(
+                [
+                    Line(
+                        "YELLOW",
+                        'Contact "{}" with phone number "{}" already exists.',
+                        (name, phone),
+                    )
+                ]
             )
-        else:
-            current_phone = contacts[name]
-            print(
-                f'{Fore.YELLOW}Contact "{Fore.CYAN}{name}{Fore.YELLOW}" is already added with the number "{Fore.CYAN}{current_phone}{Fore.YELLOW}".\nTo change the number, use the "{Style.RESET_ALL}change{Fore.YELLOW}" command.{Style.RESET_ALL}'
-            )
-    else:
-        contacts[name] = phone
-        print(
-            f'{Fore.GREEN}Contact "{Fore.CYAN}{name}{Fore.GREEN}" added with phone number "{Fore.CYAN}{phone}{Fore.GREEN}".{Style.RESET_ALL}'
+        current_phone = contacts[name]
+        return Reply(
+            [
+                Line(
+                    "YELLOW",
+                    'Contact "{}" is already added with the number "{}".',
+                    (name, current_phone),
+                ),
+                Line(
+                    "YELLOW",
+                    'To change the number, use the "{}" command.',
+                    ("change",),
+                ),
+            ]
         )
+    contacts[name] = phone
+    return Reply(
+        [Line("GREEN", 'Contact "{}" added with phone number "{}".', (name, phone))]
+    )
 
 
 @input_error
-def change_contact(contacts: Dict[str, str], *args: str) -> None:
+def change_contact(contacts: Dict[str, str], *args: str) -> Reply:
     """Change an existing contact's phone number.
 
     Parameters
@@ -125,6 +870,11 @@ def change_contact(contacts: Dict[str, str], *args: str) -> None:
         The dictionary of contacts.
     args : str
         The name and new phone number of the contact.
+
+    Returns
+    -------
+    Reply
+        The result of the command.
     """
     if len(args) != 2:
         raise ValueError("Usage: change [name] [new phone number]")
@@ -132,20 +882,31 @@ def change_contact(contacts: Dict[str, str], *args: str) -> None:
     if name in contacts:
         current_phone = contacts[name]
         if new_phone == current_phone:
-            print(
-                f'{Fore.YELLOW}Contact "{Fore.CYAN}{name}{Fore.YELLOW}" already has this phone number: "{Fore.CYAN}{new_phone}{Fore.YELLOW}". No changes were made.{Style.RESET_ALL}'
-            )
-        else:
-            contacts[name] = new_phone
-            print(
-                f'{Fore.GREEN}For user {Fore.CYAN}"{name}"{Fore.GREEN}, the phone has been changed from "{Fore.CYAN}{current_phone}{Fore.GREEN}" to "{Fore.CYAN}{new_phone}{Fore.GREEN}".{Style.RESET_ALL}'
+            return Reply(
+                [
+                    Line(
+                        "YELLOW",
+                        'Contact "{}" already has this phone number: "{}". No changes were made.',
+                        (name, new_phone),
+                    )
+                ]
             )
+        contacts[name] = new_phone
+        return Reply(
+            [
+                Line(
+                    "GREEN",
+                    'For user "{}", the phone has been changed from "{}" to "{}".',
+                    (name, current_phone, new_phone),
+                )
+            ]
+        )
     else:
         raise KeyError(f"Name '{name}' not found.")
 
 
 @input_error
-def show_phone(contacts: Dict[str, str], *args: str) -> None:
+def show_phone(contacts: Dict[str, str], *args: str) -> Reply:
     """Show the phone number of a contact.
 
     Parameters
@@ -154,81 +915,650 @@ def show_phone(contacts: Dict[str, str], *args: str) -> None:
         The dictionary of contacts.
     args : str
         The name of the contact.
+
+    Returns
+    -------
+    Reply
+        The result of the command.
     """
     if len(args) != 1:
         raise ValueError("Usage: phone [name]")
     name = args[0]
     if name in contacts:
-        print(
-            f'{Fore.GREEN}Phone number of "{Fore.CYAN}{name}{Fore.GREEN}": {Fore.CYAN}{contacts[name]}{Style.RESET_ALL}'
+        return Reply(
+            [Line("GREEN", 'Phone number of "{}": {}', (name, contacts[name]))]
         )
     else:
         raise KeyError(f"Name '{name}' not found.")
 
 
+def _contact_lines(contacts: Dict[str, str], names: Iterable[str]) -> List[Line]:
+    return [Line("GREEN", "{}: {}", (name, contacts[name])) for name in names]
+
+
 @input_error
-def show_all_contacts(contacts: Dict[str, str]) -> None:
+def show_all_contacts(contacts: Dict[str, str]) -> Reply:
     """Show all contacts.
 
     Parameters
     ----------
     contacts : Dict[str, str]
         The dictionary of contacts.
+
+    Returns
+    -------
+    Reply
+        The result of the command.
     """
     if contacts:
-        for name, phone in contacts.items():
-            print(f"{Fore.GREEN}{name}: {Fore.CYAN}{phone}{Style.RESET_ALL}")
+        return Reply(_contact_lines(contacts, contacts))
     else:
         raise IndexError("No contacts available.")
 
 
-def handle_exit() -> None:
-    """Exit the program."""
-    print(f"{Fore.GREEN}{Style.BRIGHT}Good bye!{Style.RESET_ALL}")
-    sys.exit()
+@input_error
+def find_contacts(contacts: Dict[str, str], *args: str) -> Reply:
+    """Find contacts by the beginning of the name or by phone number.
 
+    If nothing matches, names within a small edit distance are suggested.
 
-def help_command():
-    """Display the help information with available commands."""
-    print(f"{Fore.GREEN}This bot helps you manage your contacts.{Style.RESET_ALL}")
-    print(f"{Fore.GREEN}You can use the following commands:{Style.RESET_ALL}")
-    print(f"hello{Fore.GREEN} - Greets the user.{Style.RESET_ALL}")
-    print(
-        f"add [name] [phone number]{Fore.GREEN} - Adds a new contact.{Style.RESET_ALL}"
-    )
-    print(
-        f"change [name] [new phone number]{Fore.GREEN} - Changes the phone number of an existing contact.{Style.RESET_ALL}"
-    )
-    print(
-        f"phone [name]{Fore.GREEN} - Shows the phone number of a contact.{Style.RESET_ALL}"
-    )
-    print(f"all{Fore.GREEN} - Shows all contacts.{Style.RESET_ALL}")
-    print(f"close, exit, quit{Fore.GREEN} - Exits the program.{Style.RESET_ALL}")
-    print(f"help{Fore.GREEN} - Displays a list of available commands.{Style.RESET_ALL}")
-    print()
-    print(f"{Fore.CYAN}Example usage:{Style.RESET_ALL}")
-    print(
-        f"add John 1234567890{Fore.GREEN} - Adds a contact named {Fore.CYAN}John{Fore.GREEN} with phone number {Fore.CYAN}1234567890.{Style.RESET_ALL}"
-    )
-    print(
-        f"phone John{Fore.GREEN} - Shows the phone number of {Fore.CYAN}John.{Style.RESET_ALL}\n"
-    )
+    Parameters
+    ----------
+    contacts : Dict[str, str]
+        The dictionary of contacts.
+    args : str
+        The beginning of a name, or a phone number.
 
+    Returns
+    -------
+    Reply
+        The result of the command.
+    """
+    if len(args) != 1:
+        raise ValueError("Usage: find [name prefix or phone number]")
+    query = args[0]
+    if isinstance(contacts, ContactStore):
+        index = contacts.index
+    else:
+        index = ContactIndex(contacts)
 
-def main() -> None:
-    """Main function that runs the command line interface for an assistant bot."""
-    contacts: Dict[str, str] = {}
-    command_handlers: Dict[str, Callable[[Optional[List[str]]], None]] = {
+    names = index.by_phone(query)
+    names += [name for name in index.prefix(query, FIND_LIMIT) if name not in names]
+    if names:
+        lines = _contact_lines(contacts, names)
+        hidden = index.count_prefix(query) - FIND_LIMIT
+        if hidden > 0:
+            lines.append(Line("YELLOW", "...and {} more.", (hidden,)))
+        return Reply(lines)
+
+    suggestions = index.fuzzy(query, min(FUZZY_MAX_DISTANCE, len(query) // 3 + 1))
+    if not suggestions:
+        raise KeyError(f"No contacts match '{query}'.")
+    lines = [Line("YELLOW", 'No contacts match "{}". Did you mean:', (query,))]
+    lines += _contact_lines(contacts, (name for _, name in suggestions[:FIND_LIMIT]))
+    return Reply(lines)
+
+
+@input_error
+def show_stats(instrumentation: Instrumentation, *args: str) -> Reply:
+    """Show the command statistics, or turn the instrumentation on or off.
+
+    Parameters
+    ----------
+    instrumentation : Instrumentation
+        The instrumentation of the command handlers.
+    args : str
+        Nothing to show the statistics, or one of 'on', 'off' and 'reset'.
+
+    Returns
+    -------
+    Reply
+        The result of the command.
+    """
+    stats = instrumentation.stats
+    if args in (("on",), ("off",)):
+        instrumentation.enabled = args[0] == "on"
+        return Reply([Line("GREEN", "Command statistics are {}.", (args[0],))])
+    if args == ("reset",):
+        stats.reset()
+        return Reply([Line("GREEN", "Command statistics have been reset.")])
+    if args:
+        raise ValueError("Usage: stats [on | off | reset]")
+
+    if not instrumentation.enabled:
+        lines = [Line("YELLOW", 'Command statistics are off; use "{}".', ("stats on",))]
+    elif not stats.commands:
+        lines = [Line("YELLOW", "No commands have been recorded yet.")]
+    else:
+        lines = [
+            Line(
+                "CYAN",
+                f"{'Command':<10}{'Calls':>10}{'Errors':>8}"
+                f"{'Mean µs':>11}{'p50 µs':>10}{'p99 µs':>10}{'Max µs':>11}",
+            )
+        ]
+        for command, counters in stats.to_dict()["commands"].items():
+            errors = sum(counters["errors"].values())
+            lines.append(
+                Line(
+                    "GREEN",
+                    f"{command:<10}{counters['calls']:>10}{errors:>8}"
+                    f"{counters['mean_us']:>11.1f}{counters['p50_us']:>10}"
+                    f"{counters['p99_us']:>10}{counters['max_us']:>11.1f}",
+                )
+            )
+            for error, count in counters["errors"].items():
+                lines.append(Line("MAGENTA", f"  {error}: {count}"))
+    return Reply(lines)
+
+
+@input_error
+def profile_command(instrumentation: Instrumentation, *args: str) -> Reply:
+    """Start or stop profiling the commands with cProfile.
+
+    Parameters
+    ----------
+    instrumentation : Instrumentation
+        The instrumentation of the command handlers.
+    args : str
+        'on' to start profiling, or 'off' to stop it and show the functions
+        with the most cumulative time.
+
+    Returns
+    -------
+    Reply
+        The result of the command.
+    """
+    if args == ("on",):
+        if instrumentation.profiler is None:
+            instrumentation.profiler = cProfile.Profile()
+        return Reply([Line("GREEN", "Profiling the commands.")])
+    if args != ("off",):
+        raise ValueError("Usage: profile [on | off]")
+    if instrumentation.profiler is None:
+        raise ValueError("Profiling is not on.")
+
+    profiler, instrumentation.profiler = instrumentation.profiler, None
+    profiler.disable()
+    output = io.StringIO()
+    try:
+        stats = pstats.Stats(profiler, stream=output)
+    except TypeError:  # nothing was profiled
+        return Reply([Line("YELLOW", "No commands were profiled.")])
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP)
+    text = output.getvalue().strip("\n")
+    return Reply([Line("", line) for line in text.split("\n")])
+
+
+def handle_exit() -> Reply:
+    """Say good bye and end the session."""
+    return Reply([Line("GREEN", "Good bye!")], close=True)
+
+
+HELP_LINES = [
+    Line("GREEN", "This bot helps you manage your contacts."),
+    Line("GREEN", "You can use the following commands:"),
+    Line("GREEN", "{} - Greets the user.", ("hello",)),
+    Line("GREEN", "{} - Adds a new contact.", ("add [name] [phone number]",)),
+    Line(
+        "GREEN",
+        "{} - Changes the phone number of an existing contact.",
+        ("change [name] [new phone number]",),
+    ),
+    Line("GREEN", "{} - Shows the phone number of a contact.", ("phone [name]",)),
+    Line("GREEN", "{} - Shows all contacts.", ("all",)),
+    Line(
+        "GREEN",
+        "{} - Finds contacts, suggesting similar names if none match.",
+        ("find [name prefix or phone]",),
+    ),
+    Line(
+        "GREEN",
+        "{} - Shows the command statistics, or turns them on or off.",
+        ("stats [on|off|reset]",),
+    ),
+    Line(
+        "GREEN",
+        "{} - Starts or stops profiling the commands.",
+        ("profile [on|off]",),
+    ),
+    Line("GREEN", "{} - Exits the program.", ("close, exit, quit",)),
+    Line("GREEN", "{} - Displays a list of available commands.", ("help",)),
+    Line("", ""),
+    Line("CYAN", "Example usage:"),
+    Line(
+        "GREEN",
+        "{} - Adds a contact named {} with phone number {}.",
+        ("add John 1234567890", "John", "1234567890"),
+    ),
+    Line("GREEN", "{} - Shows the phone number of {}.", ("phone John", "John")),
+    Line("", ""),
+]
+
+
+def help_command() -> Reply:
+    """Return the help information with available commands."""
+    return Reply(HELP_LINES)
+
+
+def make_command_handlers(
+    contacts: Dict[str, str], instrumentation: Optional[Instrumentation] = None
+) -> CommandHandlers:
+    """Map the command names to their handlers over a contacts dictionary.
+
+    Parameters
+    ----------
+    contacts : Dict[str, str]
+        The dictionary of contacts the commands work on.
+    instrumentation : Optional[Instrumentation]
+        The statistics and the profiler of the commands (default is None,
+        new ones with the statistics off).
+
+    Returns
+    -------
+    CommandHandlers
+        A dictionary mapping commands to their handlers.
+    """
+    instrumentation = instrumentation or Instrumentation()
+    handlers = {
         "hello": lambda _: hello(),
         "add": lambda args: add_contact(contacts, *args),
         "change": lambda args: change_contact(contacts, *args),
         "phone": lambda args: show_phone(contacts, *args),
         "all": lambda _: show_all_contacts(contacts),
+        "find": lambda args: find_contacts(contacts, *args),
         "close": lambda _: handle_exit(),
         "exit": lambda _: handle_exit(),
         "quit": lambda _: handle_exit(),
+        "stats": lambda args: show_stats(instrumentation, *args),
+        "profile": lambda args: profile_command(instrumentation, *args),
         "help": lambda _: help_command(),
     }
+    return CommandHandlers(handlers, instrumentation)
+
+
+@contextlib.contextmanager
+def buffered_stdout(buffer_size: int = BATCH_BUFFER_SIZE) -> Iterator[TextIO]:
+    """Send stdout through one writer that is flushed in large blocks.
+
+    Parameters
+    ----------
+    buffer_size : int
+        The buffer size in bytes (default is BATCH_BUFFER_SIZE).
+
+    Yields
+    ------
+    TextIO
+        The buffered writer, which is also ``sys.stdout`` meanwhile.
+    """
+    previous = sys.stdout
+    try:
+        fileno = previous.fileno()
+    except (AttributeError, OSError, ValueError):
+        yield previous  # not a real file, e.g. captured output
+        return
+    previous.flush()
+    writer = io.TextIOWrapper(
+        open(fileno, "wb", buffering=buffer_size, closefd=False),
+        encoding=previous.encoding,
+        errors=previous.errors,
+    )
+    sys.stdout = writer
+    try:
+        yield writer
+    finally:
+        try:
+            writer.flush()
+        finally:
+            sys.stdout = previous
+
+
+class BatchReport(NamedTuple):
+    """The outcome of a batch of commands."""
+
+    commands: int
+    failures: int
+    failed_lines: List[int]
+    seconds: float
+
+    @property
+    def commands_per_second(self) -> float:
+        return self.commands / self.seconds if self.seconds else 0.0
+
+
+def run_batch(
+    lines: Iterable[str],
+    command_handlers: Dict[str, Callable[[Optional[List[str]]], Reply]],
+    colored: bool = True,
+) -> BatchReport:
+    """Run commands one per line, without prompts.
+
+    Empty lines and lines starting with '#' are skipped; an exit command
+    ends the batch. Incorrect commands are reported without the help text.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The command lines.
+    command_handlers : Dict[str, Callable[[Optional[List[str]]], Reply]]
+        A dictionary mapping commands to their handlers.
+    colored : bool
+        Whether to print the replies in colors (default is True).
+
+    Returns
+    -------
+    BatchReport
+        The number of commands and failures, the first failed line numbers
+        and the elapsed time.
+    """
+    commands = failures = 0
+    failed_lines: List[int] = []
+    start = perf_counter()
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        commands += 1
+        command, args = parse_input(line)
+        reply = handle_command(command_handlers, command, args)
+        print_reply(reply, colored)
+        if reply.error is not None:
+            failures += 1
+            if len(failed_lines) < BATCH_FAILED_LINES:
+                failed_lines.append(number)
+        if reply.close:
+            break
+    return BatchReport(commands, failures, failed_lines, perf_counter() - start)
+
+
+def run_batch_mode(
+    source: str, command_handlers: Dict[str, Callable[[Optional[List[str]]], Reply]]
+) -> int:
+    """Run a batch from a file or stdin and report the totals on stderr.
+
+    Colors are used only when stdout is a terminal, and all results go
+    through one buffered writer.
+
+    Parameters
+    ----------
+    source : str
+        The path to the command file, or '-' for stdin.
+    command_handlers : Dict[str, Callable[[Optional[List[str]]], Reply]]
+        A dictionary mapping commands to their handlers.
+
+    Returns
+    -------
+    int
+        The exit status: 1 if any command failed, 0 otherwise.
+    """
+    with contextlib.ExitStack() as stack:
+        lines = sys.stdin if source == "-" else stack.enter_context(open(source))
+        stack.enter_context(buffered_stdout())
+        report = run_batch(lines, command_handlers, sys.stdout.isatty())
+
+    summary = (
+        f"Processed {report.commands} commands in {report.seconds:.2f} s "
+        f"({report.commands_per_second:,.0f} commands/s), {report.failures} failed"
+    )
+    if report.failed_lines:
+        more = ", ..." if report.failures > len(report.failed_lines) else ""
+        summary += f" (lines {', '.join(map(str, report.failed_lines))}{more})"
+    print(summary + ".", file=sys.stderr)
+    return 1 if report.failures else 0
+
+
+def encode_reply(reply: Reply) -> bytes:
+    """Frame a reply for the network.
+
+    A status line, ``OK <n>`` or ``ERROR <exception type> <n>``, is followed
+    by the ``n`` plain text lines of the reply.
+
+    Parameters
+    ----------
+    reply : Reply
+        The reply of a command.
+
+    Returns
+    -------
+    bytes
+        The framed reply, ending with a line break.
+    """
+    lines = [part for line in reply_text(reply) for part in line.split("\n")]
+    status = "OK" if reply.error is None else f"ERROR {reply.error}"
+    lines.insert(0, f"{status} {len(lines)}")
+    lines.append("")
+    return "\n".join(lines).encode("utf-8")
+
+
+class CommandProtocol(asyncio.Protocol):
+    """One client connection of the command server.
+
+    Every line received is a command, and every command gets one reply, in
+    order, so a client may send many commands without waiting for the
+    replies (pipelining). Commands run one at a time on the event loop
+    thread, so concurrent clients never see the shared contacts half
+    changed and need no locks. The replies to all complete lines of a chunk
+    are written at once; when a client does not read them and the
+    transport's buffer fills up, reading from that client pauses until the
+    buffer drains (backpressure). An ``exit`` command closes the connection.
+
+    Parameters
+    ----------
+    command_handlers : Dict[str, Callable[[Optional[List[str]]], Reply]]
+        A dictionary mapping commands to their handlers.
+    """
+
+    def __init__(
+        self, command_handlers: Dict[str, Callable[[Optional[List[str]]], Reply]]
+    ):
+        self.command_handlers = command_handlers
+        self.transport: Optional[asyncio.Transport] = None
+        self.pending = b""
+
+    def connection_made(self, transport: asyncio.Transport):
+        self.transport = transport
+
+    def data_received(self, data: bytes):
+        *lines, self.pending = (self.pending + data).split(b"\n")
+        replies = []
+        for line in lines:
+            command, args = parse_input(line.decode("utf-8", "replace"))
+            reply = handle_command(self.command_handlers, command, args)
+            replies.append(encode_reply(reply))
+            if reply.close:
+                break
+        else:
+            if len(self.pending) <= SERVER_MAX_LINE:
+                if replies:
+                    self.transport.write(b"".join(replies))
+                return
+            error = ValueError(f"Commands are limited to {SERVER_MAX_LINE} bytes.")
+            reply = _error_reply("Error: Incorrect command.", error)
+            replies.append(encode_reply(reply))
+        self.transport.write(b"".join(replies))
+        self.transport.close()
+
+    def pause_writing(self):
+        self.transport.pause_reading()
+
+    def resume_writing(self):
+        self.transport.resume_reading()
+
+
+async def serve(
+    contacts: Dict[str, str],
+    host: str = SERVER_HOST,
+    port: int = 0,
+    instrumentation: Optional[Instrumentation] = None,
+) -> asyncio.AbstractServer:
+    """Start serving the commands over TCP.
+
+    Parameters
+    ----------
+    contacts : Dict[str, str]
+        The dictionary of contacts shared by all clients.
+    host : str
+        The address to listen on (default is SERVER_HOST).
+    port : int
+        The port to listen on (default is 0, any free port).
+    instrumentation : Optional[Instrumentation]
+        The statistics and the profiler shared by all clients (default is
+        None, new ones with the statistics off).
+
+    Returns
+    -------
+    asyncio.AbstractServer
+        The server, already accepting connections.
+    """
+    command_handlers = make_command_handlers(contacts, instrumentation)
+    loop = asyncio.get_running_loop()
+    return await loop.create_server(
+        lambda: CommandProtocol(command_handlers), host, port
+    )
+
+
+async def run_server(
+    contacts: ContactStore,
+    host: str,
+    port: int,
+    instrumentation: Instrumentation,
+    colored: bool = True,
+) -> None:
+    """Serve the commands until cancelled, syncing the journal when idle.
+
+    Parameters
+    ----------
+    contacts : ContactStore
+        The contacts shared by all clients.
+    host : str
+        The address to listen on.
+    port : int
+        The port to listen on.
+    instrumentation : Instrumentation
+        The statistics and the profiler of the commands.
+    colored : bool
+        Whether to print the address in colors (default is True).
+    """
+    server = await serve(contacts, host, port, instrumentation)
+    host, port = server.sockets[0].getsockname()[:2]
+    fore, style = color_codes(colored)
+    print(f"{fore.GREEN}Serving contacts on {fore.CYAN}{host}:{port}{style.RESET_ALL}")
+    async with server:
+        while True:
+            await asyncio.sleep(contacts.sync_interval)
+            # The journal is otherwise synced, and the statistics dumped,
+            # only when the next command runs
+            if contacts.unsynced:
+                contacts.sync()
+            instrumentation.stats.dump_if_due()
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """Parse the command-line arguments.
+
+    Parameters
+    ----------
+    argv : List[str]
+        The arguments without the program name.
+
+    Returns
+    -------
+    argparse.Namespace
+        The data directory (None to keep the contacts in memory only), the
+        batch command file or the server port and address, if any, and the
+        instrumentation options.
+    """
+    parser = argparse.ArgumentParser(
+        prog="assistant_bot.py", description="Manage your contacts."
+    )
+    parser.add_argument(
+        "--data",
+        default=DEFAULT_DATA_DIR,
+        metavar="DIR",
+        help=f"directory where the contacts are kept (default: {DEFAULT_DATA_DIR})",
+    )
+    parser.add_argument(
+        "--memory",
+        dest="data",
+        action="store_const",
+        const=None,
+        help="keep the contacts in memory only",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--batch",
+        nargs="?",
+        const="-",
+        metavar="FILE",
+        help="run the commands in FILE (default: stdin) without prompts",
+    )
+    mode.add_argument(
+        "--serve",
+        type=int,
+        metavar="PORT",
+        help="serve the commands to many clients over TCP on PORT",
+    )
+    parser.add_argument(
+        "--host",
+        default=SERVER_HOST,
+        help=f"address the server listens on (default: {SERVER_HOST})",
+    )
+    parser.add_argument(
+        "--no-stats",
+        dest="stats",
+        action="store_false",
+        help="do not record the command statistics",
+    )
+    parser.add_argument(
+        "--stats-file",
+        metavar="FILE",
+        help="dump the command statistics to FILE as JSON periodically",
+    )
+    parser.add_argument(
+        "--stats-interval",
+        type=float,
+        default=STATS_DUMP_INTERVAL,
+        metavar="SECONDS",
+        help=f"seconds between the dumps (default: {STATS_DUMP_INTERVAL:g})",
+    )
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    """Main function that runs the command line interface for an assistant bot."""
+    options = parse_arguments(sys.argv[1:])
+    contacts = ContactStore(options.data)
+    instrumentation = Instrumentation(
+        options.stats, options.stats_file, options.stats_interval
+    )
+    command_handlers = make_command_handlers(contacts, instrumentation)
+    stats = instrumentation.stats
+
+    if options.batch is not None:
+        try:
+            status = run_batch_mode(options.batch, command_handlers)
+        finally:
+            contacts.close()
+            stats.dump()
+        sys.exit(status)
+
+    if options.serve is not None:
+        try:
+            asyncio.run(
+                run_server(
+                    contacts,
+                    options.host,
+                    options.serve,
+                    instrumentation,
+                    sys.stdout.isatty(),
+                )
+            )
+        except KeyboardInterrupt:
+            pass
+        finally:
+            contacts.close()
+            stats.dump()
+        return
 
     init(autoreset=True)  # Initialize colorama
 
@@ -246,12 +1576,25 @@ def main() -> None:
         f"{Fore.CYAN}{Style.BRIGHT}Welcome to the Assistant Bot v.2!{Style.RESET_ALL}"
     )
     print()
-    help_command()
+    print_reply(help_command())
 
-    while True:
-        user_input = input(f"{Fore.YELLOW}Enter a command: {Style.RESET_ALL}").strip()
-        command, args = parse_input(user_input)
-        handle_command(command_handlers, command, args)
+    try:
+        while True:
+            if contacts.unsynced:
+                contacts.sync()  # before waiting for the user, maybe for long
+            user_input = input(
+                f"{Fore.YELLOW}Enter a command: {Style.RESET_ALL}"
+            ).strip()
+            command, args = parse_input(user_input)
+            reply = handle_command(command_handlers, command, args)
+            print_reply(reply)
+            if reply.error == "TypeError":
+                print_reply(help_command())
+            if reply.close:
+                break
+    finally:
+        contacts.close()
+        stats.dump()
 
 
 if __name__ == "__main__":
@@ -1,16 +1,779 @@
-from typing import Callable, Dict
+import mmap
+import os
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for fib_mod_array
+    np = None
 
-def caching_fibonacci() -> Callable[[int], int]:
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; appends are then unlocked
+    fcntl = None
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+    nbytes: int
+
+
+class _LRUCache:
+    """
+    A least-recently-used cache bounded by entry count and/or by bytes.
+
+    The byte size of an entry is the ``sys.getsizeof`` of its big-int value,
+    which grows by roughly 0.7 bits per Fibonacci index.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._data: "OrderedDict[int, int]" = OrderedDict()
+
+    def get(self, n: int) -> Optional[int]:
+        value = self._data.get(n)
+        if value is not None:
+            self._data.move_to_end(n)
+        return value
+
+    def __setitem__(self, n: int, value: int) -> None:
+        if n in self._data:
+            self.nbytes -= sys.getsizeof(self._data.pop(n))
+        self._data[n] = value
+        self.nbytes += sys.getsizeof(value)
+        # Evict the least recently used entries until both limits hold
+        while self._data and (
+            (self.maxsize is not None and len(self._data) > self.maxsize)
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            _, evicted = self._data.popitem(last=False)
+            self.nbytes -= sys.getsizeof(evicted)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.nbytes = 0
+
+
+class _CheckpointCache:
+    """
+    A cache that keeps only the pairs (F(c), F(c + 1)) for every k-th index c.
+
+    Any other value is rebuilt on demand by stepping forward from the nearest
+    checkpoint below it, which costs at most k - 1 big-int additions.
+    """
+
+    def __init__(
+        self, step: int, store: Union[Dict[int, int], _LRUCache, "FibonacciStore"]
+    ):
+        self.step = step
+        self._store = store
+
+    def get(self, n: int) -> Optional[int]:
+        offset = n % self.step
+        if offset <= 1:
+            return self._store.get(n)
+        base = n - offset
+        a = self._store.get(base)
+        b = self._store.get(base + 1)
+        if a is None or b is None:
+            return None
+        for _ in range(offset - 1):
+            a, b = b, a + b
+        return b
+
+    def __setitem__(self, n: int, value: int) -> None:
+        if n % self.step <= 1:
+            self._store[n] = value
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @property
+    def nbytes(self) -> int:
+        return _cache_nbytes(self._store)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+
+class FibonacciStore:
+    """
+    An append-only on-disk cache of Fibonacci numbers shared across processes.
+
+    The file starts with a magic header followed by records of the form
+    ``<index: uint64><length: uint32><value: little-endian bytes>``. Readers
+    map the file with mmap and decode values straight from the mapping; an
+    in-memory offset index is built by scanning record headers only. Appends
+    are serialized with an exclusive ``flock`` where available, and a record
+    cut short by a crash is ignored by readers and truncated by the next
+    writer.
+
+    Parameters
+    ----------
+    path : str
+        The path to the cache file; it is created if it does not exist.
+    """
+
+    MAGIC = b"FIBCACHE\x01"
+    _HEADER = struct.Struct("<QI")
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd = -1
+        self._map: Optional[mmap.mmap] = None
+        self._index: Dict[int, Tuple[int, int]] = {}
+        self._scanned = 0  # offset just past the last complete record
+        self._open()
+
+    def _open(self) -> None:
+        """Opens (creating if needed) the cache file and resets the index."""
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self._index.clear()
+        self._scanned = len(self.MAGIC)
+        with self._locked():
+            if os.fstat(self._fd).st_size == 0:
+                os.write(self._fd, self.MAGIC)
+        self._refresh()
+
+    def _unmap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _replaced(self) -> bool:
+        """Checks whether the path now points to a different file (see clear)."""
+        try:
+            return os.stat(self.path).st_ino != os.fstat(self._fd).st_ino
+        except FileNotFoundError:
+            return True
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Holds an exclusive lock on the file for the duration of a write."""
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _refresh(self) -> None:
+        """Remaps the file if it grew and indexes any new complete records."""
+        if self._replaced():
+            self.close()
+            self._open()
+            return
+        size = os.fstat(self._fd).st_size
+        if self._map is not None and len(self._map) == size:
+            return
+        self._unmap()
+        if size <= len(self.MAGIC):
+            return
+
+        self._map = mmap.mmap(self._fd, size, access=mmap.ACCESS_READ)
+        if self._map[: len(self.MAGIC)] != self.MAGIC:
+            raise ValueError(f"{self.path} is not a Fibonacci cache file.")
+
+        offset = self._scanned
+        header_size = self._HEADER.size
+        while offset + header_size <= size:
+            n, length = self._HEADER.unpack_from(self._map, offset)
+            start = offset + header_size
+            if start + length > size:
+                break  # a truncated tail: the record is incomplete
+            self._index[n] = (start, length)
+            offset = start + length
+        self._scanned = offset
+
+    def _read(self, n: int) -> Optional[int]:
+        location = self._index.get(n)
+        if location is None or self._map is None:
+            return None
+        start, length = location
+        with memoryview(self._map)[start : start + length] as view:
+            return int.from_bytes(view, "little")
+
+    def get(self, n: int) -> Optional[int]:
+        value = self._read(n)
+        if value is None:
+            # Another process may have appended it since the last scan
+            self._refresh()
+            value = self._read(n)
+        return value
+
+    def __setitem__(self, n: int, value: int) -> None:
+        if n in self._index:
+            return
+        payload = value.to_bytes((value.bit_length() + 7) // 8, "little")
+        record = self._HEADER.pack(n, len(payload)) + payload
+        while True:
+            self._refresh()
+            with self._locked():
+                if self._replaced():
+                    continue  # cleared meanwhile: retry on the new file
+                self._refresh()
+                if n in self._index:
+                    return
+                if os.fstat(self._fd).st_size > self._scanned:
+                    # Drop a record left incomplete by a crashed writer
+                    self._unmap()
+                    os.ftruncate(self._fd, self._scanned)
+                os.write(self._fd, record)
+                break
+        self._refresh()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def nbytes(self) -> int:
+        return self._scanned
+
+    def clear(self) -> None:
+        """
+        Replaces the file with an empty one for all processes sharing it.
+
+        The old file is swapped out atomically, so processes that still have
+        it mapped keep reading valid values until they notice the change.
+        """
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(self.MAGIC)
+        with self._locked():
+            os.replace(temp_path, self.path)
+        self._refresh()
+
+    def close(self) -> None:
+        """Unmaps and closes the cache file."""
+        self._unmap()
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> "FibonacciStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _LockedCache:
+    """Serializes every operation on the wrapped cache with a lock."""
+
+    def __init__(self, cache: "_Cache", lock: threading.RLock):
+        self._cache = cache
+        self._lock = lock
+
+    def get(self, n: int) -> Optional[int]:
+        with self._lock:
+            return self._cache.get(n)
+
+    def __setitem__(self, n: int, value: int) -> None:
+        with self._lock:
+            self._cache[n] = value
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return _cache_nbytes(self._cache)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+_Cache = Union[
+    Dict[int, int], _LRUCache, _CheckpointCache, FibonacciStore, _LockedCache
+]
+
+
+def _cache_nbytes(cache: _Cache) -> int:
+    """Returns the memory held by the cached big-int values, in bytes."""
+    if isinstance(cache, dict):
+        return sum(sys.getsizeof(value) for value in cache.values())
+    return cache.nbytes
+
+
+def _validate_index(n: int) -> int:
+    """
+    Validates a Fibonacci index and normalizes it to an ``int``.
+
+    Parameters
+    ----------
+    n : int
+        The position in the Fibonacci sequence.
+
+    Returns
+    -------
+    int
+        The validated index.
+
+    Raises
+    ------
+    ValueError
+        If the input is negative or a float with a fractional part.
+    TypeError
+        If the input is not a number.
+    """
+    if isinstance(n, float):
+        if not n.is_integer():
+            raise ValueError("Input must be a non-negative integer.")
+        n = int(n)
+    elif not isinstance(n, int):
+        raise TypeError(f"Input must be an integer, not {type(n).__name__}.")
+    if n < 0:
+        raise ValueError("Input must be a non-negative integer.")
+    return n
+
+
+def _fib_pair(n: int, cache: _Cache) -> Tuple[int, int]:
+    """
+    Computes the pair (F(n), F(n + 1)) using the fast doubling method.
+
+    Uses the identities F(2k) = F(k) * (2F(k + 1) - F(k)) and
+    F(2k + 1) = F(k)^2 + F(k + 1)^2, so only O(log n) big-int
+    multiplications are needed. The recursion depth is log2(n).
+
+    Parameters
+    ----------
+    n : int
+        A non-negative position in the Fibonacci sequence.
+    cache : _Cache
+        Previously computed values; it is consulted first and updated with
+        every value computed along the way.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The nth and (n + 1)th Fibonacci numbers.
+    """
+    a = cache.get(n)
+    if a is not None:
+        b = cache.get(n + 1)
+        if b is not None:
+            return a, b
+    if n == 0:
+        return 0, 1
+
+    a, b = _fib_pair(n >> 1, cache)  # F(k), F(k + 1) with k = n // 2
+    c = a * ((b << 1) - a)  # F(2k)
+    d = a * a + b * b  # F(2k + 1)
+    if n & 1:
+        c, d = d, c + d
+
+    cache[n] = c
+    cache[n + 1] = d
+    return c, d
+
+
+# Gaps up to this size are walked with additions instead of a fresh seek
+_SEEK_THRESHOLD = 128
+
+
+def fib_range(start: int, stop: int) -> Generator[int, None, None]:
+    """
+    Yields the Fibonacci numbers F(start), F(start + 1), ..., F(stop - 1).
+
+    Seeks to ``start`` with fast doubling and then walks the sequence with one
+    big-int addition per value, keeping only the current pair in memory.
+
+    Parameters
+    ----------
+    start : int
+        The first index to yield (inclusive).
+    stop : int
+        The index to stop at (exclusive).
+
+    Yields
+    ------
+    int
+        The consecutive Fibonacci numbers.
+
+    Raises
+    ------
+    ValueError
+        If an index is negative or a non-integer float.
+    TypeError
+        If an index is not a number.
+    """
+    start = _validate_index(start)
+    stop = _validate_index(stop)
+    if stop <= start:
+        return
+    a, b = _fib_pair(start, {})
+    for _ in range(stop - start):
+        yield a
+        a, b = b, a + b
+
+
+def fib_many(indices: Iterable[int]) -> List[int]:
+    """
+    Computes the Fibonacci numbers for many indices in one sorted sweep.
+
+    The distinct indices are visited in ascending order; short gaps are
+    walked with additions and long gaps are jumped with fast doubling.
+
+    Parameters
+    ----------
+    indices : Iterable[int]
+        The positions in the Fibonacci sequence, in any order.
+
+    Returns
+    -------
+    List[int]
+        The Fibonacci numbers in the same order as ``indices``.
+
+    Raises
+    ------
+    ValueError
+        If an index is negative or a non-integer float.
+    TypeError
+        If an index is not a number.
+    """
+    requested = [_validate_index(n) for n in indices]
+    values: Dict[int, int] = {}
+    position, a, b = 0, 0, 1  # a = F(position), b = F(position + 1)
+    for n in sorted(set(requested)):
+        gap = n - position
+        if gap > _SEEK_THRESHOLD:
+            a, b = _fib_pair(n, {})
+        else:
+            for _ in range(gap):
+                a, b = b, a + b
+        position = n
+        values[n] = a
+    return [values[n] for n in requested]
+
+
+def _split_by_cost(indices: List[int], parts: int) -> List[List[int]]:
+    """
+    Splits sorted indices into contiguous chunks of roughly equal cost.
+
+    The cost of an index is taken as proportional to the index itself, since
+    F(n) has about 0.7n bits and that size drives the big-int arithmetic.
+    """
+    target = sum(n + 1 for n in indices) / max(parts, 1)
+    chunks: List[List[int]] = []
+    chunk: List[int] = []
+    cost = 0
+    for n in indices:
+        chunk.append(n)
+        cost += n + 1
+        if cost >= target and len(chunks) < parts - 1:
+            chunks.append(chunk)
+            chunk, cost = [], 0
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def fib_many_parallel(
+    indices: Iterable[int], max_workers: Optional[int] = None
+) -> List[int]:
+    """
+    Computes the Fibonacci numbers for many indices across CPU cores.
+
+    The distinct indices are sorted and cut into contiguous chunks of similar
+    cost; every chunk is answered by ``fib_many`` in a worker process.
+
+    Parameters
+    ----------
+    indices : Iterable[int]
+        The positions in the Fibonacci sequence, in any order.
+    max_workers : Optional[int], optional
+        The number of worker processes (default is None, one per CPU).
+
+    Returns
+    -------
+    List[int]
+        The Fibonacci numbers in the same order as ``indices``.
+
+    Raises
+    ------
+    ValueError
+        If an index is negative or a non-integer float.
+    TypeError
+        If an index is not a number.
+    """
+    requested = [_validate_index(n) for n in indices]
+    workers = max_workers or os.cpu_count() or 1
+    chunks = _split_by_cost(sorted(set(requested)), workers)
+    if len(chunks) <= 1:
+        return fib_many(requested)
+
+    values: Dict[int, int] = {}
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        for chunk, results in zip(chunks, executor.map(fib_many, chunks)):
+            values.update(zip(chunk, results))
+    return [values[n] for n in requested]
+
+
+# Products of two residues below 2**32 still fit into uint64
+_MAX_VECTOR_MODULUS = 2**32
+
+
+def _validate_modulus(m: int) -> int:
+    """Validates a modulus: it must be a positive integer."""
+    if not isinstance(m, int):
+        raise TypeError(f"Modulus must be an integer, not {type(m).__name__}.")
+    if m < 1:
+        raise ValueError("Modulus must be a positive integer.")
+    return m
+
+
+def fib_mod(n: int, m: int) -> int:
+    """
+    Computes F(n) mod m with 2x2 matrix exponentiation.
+
+    All intermediate values stay below m ** 2, so no big Fibonacci numbers
+    are ever built.
+
+    Parameters
+    ----------
+    n : int
+        The position in the Fibonacci sequence.
+    m : int
+        The modulus.
+
+    Returns
+    -------
+    int
+        The nth Fibonacci number modulo m.
+
+    Raises
+    ------
+    ValueError
+        If n is negative or a non-integer float, or m is less than 1.
+    TypeError
+        If n or m is not a number.
+    """
+    n = _validate_index(n)
+    m = _validate_modulus(m)
+    # Powers of Q = [[1, 1], [1, 0]] are symmetric, so (a, b, c) stands
+    # for [[a, b], [b, c]] = [[F(k + 1), F(k)], [F(k), F(k - 1)]]
+    ra, rb, rc = 1 % m, 0, 1 % m
+    qa, qb, qc = 1 % m, 1 % m, 0
+    while n:
+        if n & 1:
+            ra, rb, rc = (
+                (ra * qa + rb * qb) % m,
+                (ra * qb + rb * qc) % m,
+                (rb * qb + rc * qc) % m,
+            )
+        qa, qb, qc = (
+            (qa * qa + qb * qb) % m,
+            (qa * qb + qb * qc) % m,
+            (qb * qb + qc * qc) % m,
+        )
+        n >>= 1
+    return rb
+
+
+def fib_mod_array(indices: "np.ndarray", m: int) -> "np.ndarray":
+    """
+    Computes F(n) mod m for every index of a NumPy array at once.
+
+    The powers Q^(2^k) are shared by all indices, so each bit position costs
+    one vectorized matrix product over the whole array in uint64 arithmetic.
+
+    Parameters
+    ----------
+    indices : np.ndarray
+        An array of non-negative integer indices of any shape.
+    m : int
+        The modulus, at most 2**32.
+
+    Returns
+    -------
+    np.ndarray
+        A uint64 array of residues with the same shape as ``indices``.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    ValueError
+        If an index is negative or m is outside [1, 2**32].
+    TypeError
+        If the indices are not integers or m is not an integer.
+    """
+    if np is None:
+        raise ImportError("fib_mod_array requires NumPy: pip install numpy")
+    m = _validate_modulus(m)
+    if m > _MAX_VECTOR_MODULUS:
+        raise ValueError(f"Modulus must not exceed {_MAX_VECTOR_MODULUS}.")
+
+    n = np.asarray(indices)
+    if n.dtype.kind not in "iu":
+        raise TypeError(f"Indices must be integers, not {n.dtype}.")
+    if n.size and n.min() < 0:
+        raise ValueError("Input must be a non-negative integer.")
+
+    mod = np.uint64(m)
+    one = np.uint64(1)
+    remaining = n.astype(np.uint64)
+    ra = np.full(n.shape, 1 % m, dtype=np.uint64)
+    rb = np.zeros(n.shape, dtype=np.uint64)
+    rc = ra.copy()
+    qa, qb, qc = 1 % m, 1 % m, 0
+
+    while remaining.any():
+        odd = (remaining & one).astype(bool)
+        a, b, c = np.uint64(qa), np.uint64(qb), np.uint64(qc)
+        # Reduce every product before adding so the sums cannot overflow
+        ra, rb, rc = (
+            np.where(odd, (ra * a % mod + rb * b % mod) % mod, ra),
+            np.where(odd, (ra * b % mod + rb * c % mod) % mod, rb),
+            np.where(odd, (rb * b % mod + rc * c % mod) % mod, rc),
+        )
+        qa, qb, qc = (
+            (qa * qa + qb * qb) % m,
+            (qa * qb + qb * qc) % m,
+            (qb * qb + qc * qc) % m,
+        )
+        remaining >>= one
+    return rb
+
+
+def caching_fibonacci(
+    maxsize: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    checkpoint: Optional[int] = None,
+    path: Optional[str] = None,
+    thread_safe: bool = False,
+) -> Callable[[int], int]:
     """
     Creates a Fibonacci function that uses a cache to store computed values.
 
+    Without arguments the cache is unbounded. The returned function exposes
+    ``cache_info()`` and ``cache_clear()`` like ``functools.lru_cache``.
+
+    Parameters
+    ----------
+    maxsize : Optional[int], optional
+        The maximum number of cached entries; the least recently used
+        entries are evicted first (default is None, no limit).
+    max_bytes : Optional[int], optional
+        The memory budget for the cached big-int values in bytes; evicts
+        in LRU order (default is None, no limit).
+    checkpoint : Optional[int], optional
+        If set to k, only the values at every k-th index (and their
+        successors) are kept, and the rest are rebuilt on demand
+        (default is None, every value is kept).
+    path : Optional[str], optional
+        The path to a persistent ``FibonacciStore`` file shared by all
+        processes that open it; cannot be combined with maxsize or max_bytes
+        (default is None, an in-memory cache).
+    thread_safe : bool, optional
+        If True, the cache is guarded by a lock and concurrent calls for the
+        same n wait for a single computation instead of repeating it
+        (default is False).
+
     Returns
     -------
     Callable[[int], int]
         A function that computes the nth Fibonacci number using a cache.
+
+    Raises
+    ------
+    ValueError
+        If a limit is negative, the checkpoint step is less than 1, or a
+        persistent store is combined with a size limit.
     """
-    cache: Dict[int, int] = {}
+    if maxsize is not None and maxsize < 0:
+        raise ValueError("maxsize must be a non-negative integer.")
+    if max_bytes is not None and max_bytes < 0:
+        raise ValueError("max_bytes must be a non-negative integer.")
+    if checkpoint is not None and checkpoint < 1:
+        raise ValueError("checkpoint must be a positive integer.")
+    if path is not None and (maxsize is not None or max_bytes is not None):
+        raise ValueError("A persistent cache cannot be limited in size.")
+
+    cache: _Cache = {}
+    if path is not None:
+        cache = FibonacciStore(path)
+    elif maxsize is not None or max_bytes is not None:
+        cache = _LRUCache(maxsize, max_bytes)
+    if checkpoint is not None:
+        cache = _CheckpointCache(checkpoint, cache)
+    lock: Optional[threading.RLock] = None
+    in_flight: Dict[int, Future] = {}
+    if thread_safe:
+        lock = threading.RLock()
+        cache = _LockedCache(cache, lock)
+    guard = lock if lock is not None else nullcontext()
+    hits = misses = 0
+
+    def compute(n: int) -> int:
+        """Computes F(n) on a cache miss and stores it in the cache."""
+        if checkpoint is not None:
+            # Compute the checkpoint pair below n and step forward from it
+            _fib_pair(n - n % checkpoint, cache)
+            value = cache.get(n)
+            if value is not None:
+                return value
+        # Fast doubling stores F(n) and the intermediate values in cache
+        return _fib_pair(n, cache)[0]
+
+    def coalesced(n: int) -> int:
+        """Computes F(n) once even if several threads ask for it at a time."""
+        nonlocal hits, misses
+        with lock:
+            value = cache.get(n)
+            if value is not None:
+                hits += 1
+                return value
+            future = in_flight.get(n)
+            owner = future is None
+            if owner:
+                misses += 1
+                future = in_flight[n] = Future()
+            else:
+                hits += 1
+        if not owner:
+            return future.result()
+
+        try:
+            value = compute(n)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with lock:
+                del in_flight[n]
+        future.set_result(value)
+        return value
 
     def fibonacci(n: int) -> int:
         """
@@ -30,19 +793,41 @@ def caching_fibonacci() -> Callable[[int], int]:
         Raises
         ------
         ValueError
-            If the input is a negative integer.
+            If the input is a negative integer or a non-integer float.
+        TypeError
+            If the input is not a number.
         """
-        if n < 0:
-            raise ValueError("Input must be a non-negative integer.")
+        nonlocal hits, misses
+        n = _validate_index(n)
         if n == 0:
             return 0
         if n == 1:
             return 1
-        if n not in cache:
-            # Store the computed value in cache to avoid redundant calculations
-            cache[n] = fibonacci(n - 1) + fibonacci(n - 2)
-        return cache[n]
+        if lock is not None:
+            return coalesced(n)
+        value = cache.get(n)
+        if value is not None:
+            hits += 1
+            return value
+        misses += 1
+        return compute(n)
+
+    def cache_info() -> CacheInfo:
+        """Reports cache statistics in the style of ``functools.lru_cache``."""
+        with guard:
+            return CacheInfo(
+                hits, misses, maxsize, len(cache), _cache_nbytes(cache)
+            )
+
+    def cache_clear() -> None:
+        """Clears the cache and its statistics."""
+        nonlocal hits, misses
+        with guard:
+            cache.clear()
+            hits = misses = 0
 
+    fibonacci.cache_info = cache_info  # type: ignore[attr-defined]
+    fibonacci.cache_clear = cache_clear  # type: ignore[attr-defined]
     return fibonacci
 
 
@@ -1,5 +1,42 @@
+import mmap
+import os
 import re
-from typing import Callable, Generator
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from decimal import MAX_PREC, Decimal, localcontext
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# Numbers with an optional comma or period as decimal separator, delimited by spaces.
+# The trailing space is only looked ahead at and not consumed, so adjacent
+# numbers such as " 10 20 " share the space between them
+NUMBER_PATTERN = re.compile(r" \d+(?:[.,]\d+)?(?= )")
+NUMBER_PATTERN_BYTES = re.compile(rb" (\d+)(?:[.,](\d+))?(?= )")
+# What the start of a number split by a chunk boundary can look like
+PARTIAL_NUMBER_PATTERN_BYTES = re.compile(rb" \d*(?:[.,]\d*)?")
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+MIN_SHARD_SIZE = 16 << 20
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class NumberAggregate(NamedTuple):
+    total: Decimal
+    count: int
+    minimum: Optional[Decimal]
+    maximum: Optional[Decimal]
 
 
 def generator_numbers(text: str) -> Generator[float, None, None]:
@@ -16,12 +53,263 @@ def generator_numbers(text: str) -> Generator[float, None, None]:
     float
         The valid numbers found in the text.
     """
-    # Regular expression to find numbers with optional comma or period as decimal separator
-    pattern = re.compile(r" \d+(?:[.,]\d+)? ")
+    for match in NUMBER_PATTERN.finditer(text):
+        # Replace commas with periods for float conversion
+        yield float(match.group().replace(",", "."))
+
+
+class _NumberAccumulator:
+    """
+    Accumulates the numbers of a text as scaled integers.
+
+    A number with k fractional digits is kept as the integer value * 10**k;
+    the sum, minimum and maximum are tracked per k, so no number is ever
+    rounded. Every window is matched with a single ``findall`` and its
+    digits are converted and aggregated per k in bulk, which keeps the work
+    done per number in C; the windows are small enough for the lists of a
+    window to stay in the CPU cache.
+    """
+
+    # Buffers are scanned in windows of about this size, split at spaces
+    WINDOW_SIZE = 1 << 16
+
+    def __init__(self):
+        self.count = 0
+        # Fractional digits -> [sum, minimum, maximum] of the scaled values
+        self.by_scale: Dict[int, List[int]] = {}
+
+    def scan(self, buffer: Buffer, start: int = 0, end: int = sys.maxsize) -> None:
+        """Adds the numbers found in ``buffer[start:end]``."""
+        end = min(end, len(buffer))
+        if isinstance(buffer, memoryview):
+            # A memoryview cannot be searched for spaces, so its windows are
+            # copied one at a time and split like the chunks of a stream
+            size = self.WINDOW_SIZE
+            windows = (
+                bytes(buffer[offset : min(offset + size, end)])
+                for offset in range(start, end, size)
+            )
+            for window, stop in _complete_buffers(windows):
+                self._scan_window(window, 0, stop)
+            return
+
+        while start < end:
+            stop = end
+            if end - start > self.WINDOW_SIZE:
+                # A number never contains a space, so a window that ends just
+                # after one (its delimiter) and a window that starts at it
+                # (the leading space of the next number) split no number
+                space = buffer.rfind(b" ", start + 1, start + self.WINDOW_SIZE)
+                if space == -1:
+                    space = buffer.find(b" ", start + self.WINDOW_SIZE, end)
+                if space != -1:
+                    stop = space + 1
+            self._scan_window(buffer, start, stop)
+            start = stop - 1 if stop < end else stop
+
+    def _scan_window(self, buffer: Buffer, start: int, stop: int) -> None:
+        # The integer and fractional digits of a number joined together are
+        # its value scaled by 10**k, where k is the length of the fraction
+        groups: Dict[int, List[bytes]] = defaultdict(list)
+        for int_part, fraction in NUMBER_PATTERN_BYTES.findall(buffer, start, stop):
+            groups[len(fraction)].append(int_part + fraction)
+        by_scale = self.by_scale
+        for scale, digits in groups.items():
+            values = list(map(int, digits))
+            self.count += len(values)
+            total, low, high = sum(values), min(values), max(values)
+            stats = by_scale.get(scale)
+            if stats is None:
+                by_scale[scale] = [total, low, high]
+            else:
+                stats[0] += total
+                if low < stats[1]:
+                    stats[1] = low
+                if high > stats[2]:
+                    stats[2] = high
+
+    def result(self) -> NumberAggregate:
+        """Converts the scaled integers into exact Decimal values."""
+        with localcontext() as context:
+            context.prec = MAX_PREC  # additions of finite decimals stay exact
+            total = Decimal(0)
+            minimum = maximum = None
+            for scale, (subtotal, low, high) in self.by_scale.items():
+                total += Decimal(subtotal).scaleb(-scale)
+                low, high = Decimal(low).scaleb(-scale), Decimal(high).scaleb(-scale)
+                minimum = low if minimum is None else min(minimum, low)
+                maximum = high if maximum is None else max(maximum, high)
+            return NumberAggregate(total, self.count, minimum, maximum)
+
+
+def _merge_aggregates(aggregates: Iterable[NumberAggregate]) -> NumberAggregate:
+    """Combines the aggregates of consecutive parts of a text exactly."""
+    with localcontext() as context:
+        context.prec = MAX_PREC
+        total, count = Decimal(0), 0
+        minimum = maximum = None
+        for aggregate in aggregates:
+            total += aggregate.total
+            count += aggregate.count
+            if aggregate.count:
+                if minimum is None or aggregate.minimum < minimum:
+                    minimum = aggregate.minimum
+                if maximum is None or aggregate.maximum > maximum:
+                    maximum = aggregate.maximum
+        return NumberAggregate(total, count, minimum, maximum)
+
+
+def scan_numbers(buffer: Buffer) -> NumberAggregate:
+    """
+    Aggregates the valid numbers of a bytes-like buffer without copying it.
+
+    Parameters
+    ----------
+    buffer : Buffer
+        The text as bytes, a bytearray, a memoryview or an mmap.
+
+    Returns
+    -------
+    NumberAggregate
+        The exact total, the count, the minimum and the maximum of the
+        numbers; the minimum and maximum are None if there are none.
+    """
+    accumulator = _NumberAccumulator()
+    accumulator.scan(buffer)
+    return accumulator.result()
+
+
+def _complete_buffers(
+    chunks: Iterable[bytes],
+) -> Generator[Tuple[bytes, int], None, None]:
+    """
+    Joins a chunked text into buffers whose numbers are all complete.
+
+    Yields every buffer with the offset its scan must stop at. Only a number
+    that may continue in the next chunk (a space followed by digits at the
+    very end of the buffer) is carried over, together with the space before
+    it, which keeps the memory use bounded by the chunk size.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        The consecutive pieces of the text.
+
+    Yields
+    ------
+    Tuple[bytes, int]
+        A buffer and the end offset for the scan.
+    """
+    carry = b""
+    for chunk in chunks:
+        buffer = carry + chunk if carry else chunk
+        start = buffer.rfind(b" ")
+        if start != -1 and PARTIAL_NUMBER_PATTERN_BYTES.fullmatch(buffer, start):
+            # The space is scanned as the delimiter of the number before it
+            # and carried as the delimiter of the number after it
+            yield buffer, start + 1
+            carry = buffer[start:]
+        else:
+            yield buffer, len(buffer)
+            carry = b""
+
+
+def _read_chunks(stream: BinaryIO, chunk_size: int) -> Generator[bytes, None, None]:
+    """Reads a binary stream in chunks of at most ``chunk_size`` bytes."""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _map_stream(stream: BinaryIO) -> Optional[mmap.mmap]:
+    """Maps a stream read-only if it is a non-empty regular file."""
+    try:
+        return mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        # Not a mappable file (a pipe, an in-memory stream or an empty file)
+        return None
+
+
+def generator_numbers_stream(
+    source: Union[str, os.PathLike, BinaryIO], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Generator[float, None, None]:
+    """
+    Finds the valid numbers in a file or binary stream without loading it whole.
+
+    A regular file is memory-mapped and scanned in place; other streams are
+    read in fixed-size chunks, and a number split between two chunks is
+    still matched exactly once. Digits are matched as ASCII bytes.
+
+    Parameters
+    ----------
+    source : Union[str, os.PathLike, BinaryIO]
+        The path to a file or a binary stream opened for reading.
+    chunk_size : int, optional
+        The number of bytes read at a time (default is 1 MiB).
+
+    Yields
+    ------
+    float
+        The valid numbers found in the text.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
 
-    for match in pattern.finditer(text):
-        # Replace commas with periods for float conversion and strip any surrounding spaces
-        yield float(match.group().replace(",", ".").strip())
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            yield from generator_numbers_stream(file, chunk_size)
+        return
+
+    mapped = _map_stream(source)
+    if mapped is None:
+        for buffer, end in _complete_buffers(_read_chunks(source, chunk_size)):
+            for match in NUMBER_PATTERN_BYTES.finditer(buffer, 0, end):
+                yield float(match.group().replace(b",", b"."))
+        return
+
+    with mapped:
+        # The regular expression scans the mapping directly; pages are
+        # loaded on demand and released by the OS
+        for match in NUMBER_PATTERN_BYTES.finditer(mapped):
+            yield float(match.group().replace(b",", b"."))
+
+
+def aggregate_numbers_stream(
+    source: Union[str, os.PathLike, BinaryIO], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> NumberAggregate:
+    """
+    Aggregates the valid numbers of a file or binary stream exactly.
+
+    Parameters
+    ----------
+    source : Union[str, os.PathLike, BinaryIO]
+        The path to a file or a binary stream opened for reading.
+    chunk_size : int, optional
+        The number of bytes read at a time (default is 1 MiB).
+
+    Returns
+    -------
+    NumberAggregate
+        The exact total, the count, the minimum and the maximum.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            return aggregate_numbers_stream(file, chunk_size)
+
+    accumulator = _NumberAccumulator()
+    mapped = _map_stream(source)
+    if mapped is None:
+        for buffer, end in _complete_buffers(_read_chunks(source, chunk_size)):
+            accumulator.scan(buffer, 0, end)
+    else:
+        with mapped:
+            accumulator.scan(mapped)
+    return accumulator.result()
 
 
 def sum_profit(text: str, func: Callable[[str], Generator[float, None, None]]) -> float:
@@ -43,6 +331,123 @@ def sum_profit(text: str, func: Callable[[str], Generator[float, None, None]]) -
     return sum(func(text))
 
 
+def sum_profit_stream(
+    source: Union[str, os.PathLike, BinaryIO], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> float:
+    """
+    Calculates the total sum of the numbers in a file or binary stream.
+
+    Parameters
+    ----------
+    source : Union[str, os.PathLike, BinaryIO]
+        The path to a file or a binary stream opened for reading.
+    chunk_size : int, optional
+        The number of bytes read at a time (default is 1 MiB).
+
+    Returns
+    -------
+    float
+        The total sum of the valid numbers in the text.
+    """
+    return float(aggregate_numbers_stream(source, chunk_size).total)
+
+
+def _shard_bounds(mapped: mmap.mmap, shards: int) -> List[Tuple[int, int]]:
+    """
+    Splits a mapped text into byte ranges that can be scanned independently.
+
+    Neighbouring ranges overlap by one space: it ends the first range as the
+    delimiter of a number before it and starts the next range as the leading
+    space of a number after it. A number never contains a space, so the
+    matches of all ranges are exactly the matches of the whole text.
+
+    Parameters
+    ----------
+    mapped : mmap.mmap
+        The mapped text.
+    shards : int
+        The desired number of ranges.
+
+    Returns
+    -------
+    List[Tuple[int, int]]
+        The (start, end) offsets of the ranges, in order.
+    """
+    size = len(mapped)
+    bounds = []
+    start = 0
+    for i in range(1, shards):
+        space = mapped.find(b" ", max(size * i // shards, start + 1))
+        if space == -1:
+            break
+        bounds.append((start, space + 1))
+        start = space
+    bounds.append((start, size))
+    return bounds
+
+
+def _aggregate_shard(path: str, start: int, end: int) -> NumberAggregate:
+    """Aggregates the numbers of one byte range of a file (a pool worker)."""
+    accumulator = _NumberAccumulator()
+    with open(path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        accumulator.scan(mapped, start, end)
+    return accumulator.result()
+
+
+def sum_profit_parallel(
+    path: Union[str, os.PathLike],
+    max_workers: Optional[int] = None,
+    min_shard_size: int = MIN_SHARD_SIZE,
+) -> float:
+    """
+    Calculates the total sum of the numbers in a file using several processes.
+
+    The file is split at whitespace boundaries into shards; every worker maps
+    the file itself and scans only its shard, and the partial sums are
+    combined exactly as Decimals before the final conversion to float.
+    The matched numbers are the same as with ``generator_numbers``.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        The path to the file.
+    max_workers : Optional[int], optional
+        The number of worker processes (default is None, one per CPU).
+    min_shard_size : int, optional
+        The smallest shard worth a separate process (default is 16 MiB).
+
+    Returns
+    -------
+    float
+        The total sum of the valid numbers in the text.
+    """
+    path = os.fspath(path)
+    size = os.path.getsize(path)
+    if size == 0:
+        return 0.0
+
+    workers = max_workers or os.cpu_count() or 1
+    shards = max(1, min(workers, size // max(min_shard_size, 1)))
+    with open(path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        bounds = _shard_bounds(mapped, shards)
+
+    if len(bounds) == 1:
+        return float(_aggregate_shard(path, *bounds[0]).total)
+
+    with ProcessPoolExecutor(max_workers=len(bounds)) as executor:
+        partials = executor.map(
+            _aggregate_shard,
+            [path] * len(bounds),
+            [start for start, _ in bounds],
+            [end for _, end in bounds],
+        )
+        return float(_merge_aggregates(partials).total)
+
+
 # Example usage
 if __name__ == "__main__":
     text = (
@@ -1,10 +1,84 @@
+import argparse
+import bz2
+import contextlib
+import glob
+import gzip
+import io
+import json
+import locale
+import lzma
+import mmap
+import os
+import re
+import shutil
 import sys
-from typing import List, Dict, Literal, NamedTuple, Optional
-from collections import Counter
+import tempfile
+import threading
+import zlib
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
+from collections import Counter, deque
 from datetime import datetime, date, time
+from time import monotonic
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up the columnar store
+    np = None
 
 EXPECTED_FORMAT = "YYYY-MM-DD HH:MM:SS LEVEL Message"
 LOG_LEVELS = {"INFO", "ERROR", "DEBUG", "WARNING"}
+# Leading bytes of the supported compressed formats
+COMPRESSION_MAGIC = ((b"\x1f\x8b", "gzip"), (b"BZh", "bz2"), (b"\xfd7zXZ\x00", "xz"))
+# Histogram bucket sizes, in seconds
+HISTOGRAM_BUCKETS = {"minute": 60, "hour": 3600}
+# Parsed dates and times are cached by their text; the caches are reset when full
+DATE_CACHE_SIZE = 1024
+TIME_CACHE_SIZE = 86400
+# Filtered entries are kept in memory up to this size, then spill to disk
+SPOOL_MAX_SIZE = 8 << 20
+# Parallel workers decode their byte range in blocks of about this size;
+# a range is never smaller than the minimum, and a file that would give a
+# single range is analyzed serially
+PARALLEL_BLOCK_SIZE = 8 << 20
+PARALLEL_MIN_RANGE_SIZE = 8 << 20
+# Sidecar index: file name suffix, format version, the size of the checked
+# head and tail of the indexed prefix, and the stride of the timestamp map
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 2
+INDEX_CHECKSUM_SPAN = 64 << 10
+INDEX_TIME_STRIDE = 1024
+# Follow mode: seconds between output refreshes and between polls for new data
+FOLLOW_INTERVAL = 2.0
+FOLLOW_POLL_INTERVAL = 0.5
+FOLLOW_READ_SIZE = 1 << 20
+# Message search: sidecar file name suffix and format version
+SEARCH_SUFFIX = ".search"
+SEARCH_VERSION = 2
+TOKEN_PATTERN = re.compile(r"\w+")
+# Output layer: formats, stdout buffer size, lines per write and the
+# number of invalid lines quoted in an error summary
+OUTPUT_FORMATS = ("text", "json", "ndjson")
+OUTPUT_BUFFER_SIZE = 1 << 20
+OUTPUT_BATCH_SIZE = 1024
+ERROR_SAMPLES = 5
 
 
 class LogEntry(NamedTuple):
@@ -14,7 +88,9 @@ class LogEntry(NamedTuple):
     message: str
 
 
-def error_message(message: str, line: str = "", details: str = ""):
+def error_message(
+    message: str, line: str = "", details: str = "", stream: Optional[TextIO] = None
+):
     """
     Display an error message with details.
 
@@ -26,23 +102,221 @@ def error_message(message: str, line: str = "", details: str = ""):
         The log line that caused the error (default is "").
     details : str, optional
         Additional details about the error (default is "").
+    stream : Optional[TextIO], optional
+        The stream to print to (default is None, stdout).
     """
-    print(f"Error: {message}")
+    stream = stream or sys.stdout
+    print(f"Error: {message}", file=stream)
     if details:
-        print(f"Details: {details}")
+        print(f"Details: {details}", file=stream)
     if line:
-        print(f"Line: {line.strip()}")
-    print(f"Expected format: {EXPECTED_FORMAT}\n")
+        print(f"Line: {line.strip()}", file=stream)
+    print(f"Expected format: {EXPECTED_FORMAT}\n", file=stream)
+
+
+class ParseErrorSummary:
+    """
+    Parse errors collected instead of printed one by one.
+
+    Keeps the number of invalid lines per kind of error and the first
+    ``max_samples`` of them as (message, line, details) samples.
+
+    Parameters
+    ----------
+    max_samples : int, optional
+        The number of invalid lines to keep (default is ERROR_SAMPLES).
+    """
+
+    def __init__(self, max_samples: int = ERROR_SAMPLES):
+        self.max_samples = max_samples
+        self.counts: Counter = Counter()
+        self.samples: List[Tuple[str, str, str]] = []
+
+    def add(self, message: str, line: str = "", details: str = ""):
+        """Record one invalid line."""
+        self.counts[message] += 1
+        if len(self.samples) < self.max_samples:
+            self.samples.append((message, line.strip(), details))
+
+    def update(self, other: "ParseErrorSummary"):
+        """Add the errors of a later part of the input."""
+        self.counts.update(other.counts)
+        self.samples.extend(other.samples[: self.max_samples - len(self.samples)])
+
+    def total(self) -> int:
+        """The number of invalid lines."""
+        return sum(self.counts.values())
+
+    def to_dict(self) -> Dict[str, object]:
+        """The summary as JSON-compatible data."""
+        return {
+            "total": self.total(),
+            "by_kind": dict(self.counts),
+            "samples": [
+                {"error": message, "line": line, "details": details}
+                for message, line, details in self.samples
+            ],
+        }
+
+    def display(self):
+        """Display the counts per kind of error and the sample lines."""
+        if not self.counts:
+            return
+        print(f"Skipped {self.total()} invalid lines:")
+        for message, count in self.counts.most_common():
+            print(f"  {message}: {count}")
+        if self.samples:
+            print(f"First {len(self.samples)} of them:\n")
+        for message, line, details in self.samples:
+            error_message(message, line, details)
+
+
+class AnalysisOutput(NamedTuple):
+    """
+    The output settings of one analysis run.
+
+    They are passed down to every function that reports errors or writes
+    results, so that runs with different settings, such as those of pool
+    workers or of tests, share no state. ``output_layer`` creates them.
+
+    Parameters
+    ----------
+    format : str, optional
+        One of OUTPUT_FORMATS (default is 'text').
+    errors : Optional[ParseErrorSummary], optional
+        The summary that collects the parse errors (default is None: print
+        every parse error as it is found).
+    """
+
+    format: str = "text"
+    errors: Optional[ParseErrorSummary] = None
+
+    @property
+    def messages(self) -> TextIO:
+        """The stream for error messages, which keeps JSON output clean."""
+        return sys.stdout if self.format == "text" else sys.stderr
+
+    def error(self, message: str, line: str = "", details: str = ""):
+        """Display an error message on the messages stream."""
+        error_message(message, line, details, self.messages)
+
+    def warning(self, message: str):
+        """Display a warning on the messages stream."""
+        print(f"\nWarning: {message}", file=self.messages)
+
+
+def _quiet_output() -> AnalysisOutput:
+    """Output settings that discard the parse errors, for lines reported elsewhere."""
+    return AnalysisOutput(errors=ParseErrorSummary(0))
+
+
+def _report_parse_error(
+    output: Optional[AnalysisOutput], message: str, line: str, details: str = ""
+):
+    """Print a parse error, or add it to the summary of the output settings."""
+    output = output or AnalysisOutput()
+    if output.errors is None:
+        output.error(message, line, details)
+    else:
+        output.errors.add(message, line, details)
+
 
+_date_cache: Dict[str, date] = {}
+_time_cache: Dict[str, time] = {}
 
-def parse_log_line(line: str) -> Optional[LogEntry]:
+
+def _parse_fixed_date(text: str) -> date:
+    """
+    Parse a date in the fixed 'YYYY-MM-DD' layout by slicing.
+
+    Consecutive log lines almost always share a date, so parsed dates are
+    cached by their text.
+
+    Raises
+    ------
+    ValueError
+        If the text does not have the fixed layout or is not a valid date.
+    """
+    value = _date_cache.get(text)
+    if value is None:
+        if not (
+            len(text) == 10
+            and text.isascii()
+            and text[4] == "-"
+            and text[7] == "-"
+            and text[:4].isdecimal()
+            and text[5:7].isdecimal()
+            and text[8:].isdecimal()
+        ):
+            raise ValueError(f"'{text}' is not in the YYYY-MM-DD layout")
+        value = date(int(text[:4]), int(text[5:7]), int(text[8:]))
+        if len(_date_cache) >= DATE_CACHE_SIZE:
+            _date_cache.clear()
+        _date_cache[text] = value
+    return value
+
+
+def _parse_fixed_time(text: str) -> time:
+    """
+    Parse a time in the fixed 'HH:MM:SS' layout by slicing.
+
+    Raises
+    ------
+    ValueError
+        If the text does not have the fixed layout or is not a valid time.
+    """
+    value = _time_cache.get(text)
+    if value is None:
+        if not (
+            len(text) == 8
+            and text.isascii()
+            and text[2] == ":"
+            and text[5] == ":"
+            and text[:2].isdecimal()
+            and text[3:5].isdecimal()
+            and text[6:].isdecimal()
+        ):
+            raise ValueError(f"'{text}' is not in the HH:MM:SS layout")
+        value = time(int(text[:2]), int(text[3:5]), int(text[6:]))
+        if len(_time_cache) >= TIME_CACHE_SIZE:
+            _time_cache.clear()
+        _time_cache[text] = value
+    return value
+
+
+def _parse_datetime_strptime(date_text: str, time_text: str) -> Tuple[date, time]:
+    """
+    Parse the date and time with ``datetime.strptime``.
+
+    This is the reference parser: it also accepts layouts without zero
+    padding and produces the detailed error messages.
+
+    Raises
+    ------
+    ValueError
+        If the date or the time is invalid.
+    """
+    log_date = datetime.strptime(date_text, "%Y-%m-%d").date()
+    log_time = datetime.strptime(time_text, "%H:%M:%S").time()
+    return log_date, log_time
+
+
+def parse_log_line(
+    line: str, output: Optional[AnalysisOutput] = None
+) -> Optional[LogEntry]:
     """
     Parse a log line into its components.
 
+    The date and time are parsed from fixed offsets; anything that does not
+    fit the fixed layout goes through ``datetime.strptime``, so exactly the
+    same lines are accepted and rejected.
+
     Parameters
     ----------
     line : str
         A single line from the log file.
+    output : Optional[AnalysisOutput], optional
+        The settings an invalid line is reported with (default is None, text).
 
     Returns
     -------
@@ -51,19 +325,26 @@ def parse_log_line(line: str) -> Optional[LogEntry]:
     """
     parts = line.split(" ", 3)
     if len(parts) < 4:
-        error_message("Invalid log string format", line)
+        _report_parse_error(output, "Invalid log string format", line)
         return None
 
     try:
-        log_date = datetime.strptime(parts[0], "%Y-%m-%d").date()
-        log_time = datetime.strptime(parts[1], "%H:%M:%S").time()
-    except ValueError as e:
-        error_message("Date or time format error", line, str(e))
-        return None
+        log_date = _parse_fixed_date(parts[0])
+        log_time = _parse_fixed_time(parts[1])
+    except ValueError:
+        try:
+            log_date, log_time = _parse_datetime_strptime(parts[0], parts[1])
+        except ValueError as e:
+            _report_parse_error(output, "Date or time format error", line, str(e))
+            return None
 
     log_level = parts[2].upper()
     if log_level not in LOG_LEVELS:
-        error_message("Invalid log level", line, f"'{log_level}' not in {LOG_LEVELS}")
+        # Sorted, so that messages from different processes are identical
+        levels = "{" + ", ".join(map(repr, LEVEL_NAMES)) + "}"
+        _report_parse_error(
+            output, "Invalid log level", line, f"'{log_level}' not in {levels}"
+        )
         return None
 
     return LogEntry(
@@ -74,49 +355,714 @@ def parse_log_line(line: str) -> Optional[LogEntry]:
     )
 
 
-def load_logs(file_path: str) -> List[LogEntry]:
+def detect_compression(file_path: str) -> Optional[str]:
     """
-    Load and parse logs from a file.
+    Detect the compression of a file from its leading bytes.
 
     Parameters
     ----------
     file_path : str
-        The path to the log file.
+        The path to the file.
 
     Returns
     -------
-    List[LogEntry]
-        A list of dictionaries, each representing a parsed log line.
+    Optional[str]
+        'gzip', 'bz2' or 'xz', or None for an uncompressed file.
+    """
+    with open(file_path, "rb") as file:
+        head = file.read(6)
+    for magic, compression in COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def open_log_file(file_path: str, encoding: Optional[str] = None) -> TextIO:
+    """
+    Open a log file for reading text, decompressing it on the fly if needed.
+
+    Compressed files are decompressed as a stream, block by block, without
+    temporary files.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to a plain, gzip, bz2 or xz log file.
+    encoding : Optional[str], optional
+        The text encoding (default is None, the locale's).
+
+    Returns
+    -------
+    TextIO
+        The file opened in text mode with universal newlines.
+    """
+    compression = detect_compression(file_path)
+    if compression is None:
+        return open(file_path, "r", encoding=encoding)
+    opener = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}[compression]
+    return opener(file_path, "rt", encoding=encoding)
+
+
+def iter_log_entries(
+    file_path: str, output: Optional[AnalysisOutput] = None
+) -> Iterator[LogEntry]:
+    """
+    Read a log file and yield its parsed entries one at a time.
+
+    Invalid lines are reported and skipped; only the current line is kept
+    in memory. Compressed files are read transparently.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the log file.
+    output : Optional[AnalysisOutput], optional
+        The settings errors are reported with (default is None, text).
+
+    Yields
+    ------
+    LogEntry
+        The parsed log entries in file order.
     """
-    logs = []
+    output = output or AnalysisOutput()
     try:
-        with open(file_path, "r") as file:
+        with open_log_file(file_path) as file:
             for line in file:
-                parsed_line = parse_log_line(line.strip())
+                parsed_line = parse_log_line(line.strip(), output)
                 if parsed_line:
-                    logs.append(parsed_line)
+                    yield parsed_line
     except FileNotFoundError:
-        error_message(f"The file {file_path} does not exist.")
+        output.error(f"The file {file_path} does not exist.")
         sys.exit(1)
     except Exception as e:
-        error_message("An error occurred while reading the file", "", str(e))
+        output.error("An error occurred while reading the file", "", str(e))
         sys.exit(1)
 
+
+def load_logs(
+    file_path: str,
+    message_index: Optional["MessageIndex"] = None,
+    output: Optional[AnalysisOutput] = None,
+) -> List[LogEntry]:
+    """
+    Load and parse logs from a file.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the log file.
+    message_index : Optional[MessageIndex], optional
+        An empty index to fill with the messages while loading; entry ids
+        are positions in the returned list (default is None).
+    output : Optional[AnalysisOutput], optional
+        The settings errors are reported with (default is None, text).
+
+    Returns
+    -------
+    List[LogEntry]
+        A list of dictionaries, each representing a parsed log line.
+    """
+    output = output or AnalysisOutput()
+    entries = iter_log_entries(file_path, output)
+    if message_index is not None:
+        entries = message_index.index_entries(entries)
+    logs = list(entries)
+
     if not logs:
-        error_message("No valid log entries found. Please check the log file format.")
+        output.error("No valid log entries found. Please check the log file format.")
+        sys.exit(1)
+
+    return logs
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+# Level codes of the columnar store, in the order of LEVEL_NAMES
+LEVEL_NAMES = tuple(sorted(LOG_LEVELS))
+LEVEL_CODES = {level: code for code, level in enumerate(LEVEL_NAMES)}
+
+
+def to_epoch_seconds(log_date: date, log_time: time) -> int:
+    """
+    Convert a log date and time to seconds since 1970-01-01 00:00:00.
+
+    The log timestamps carry no time zone, so no conversion is applied.
+    """
+    return (
+        (log_date.toordinal() - _EPOCH_ORDINAL) * 86400
+        + log_time.hour * 3600
+        + log_time.minute * 60
+        + log_time.second
+    )
+
+
+def from_epoch_seconds(seconds: int) -> Tuple[date, time]:
+    """Convert seconds since 1970-01-01 00:00:00 back to a date and a time."""
+    days, seconds = divmod(seconds, 86400)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return date.fromordinal(_EPOCH_ORDINAL + days), time(hours, minutes, seconds)
+
+
+def parse_time_bound(text: str) -> datetime:
+    """
+    Parse a time window bound given on the command line.
+
+    Parameters
+    ----------
+    text : str
+        A date ('YYYY-MM-DD') or a date and a time ('YYYY-MM-DD HH:MM' or
+        'YYYY-MM-DD HH:MM:SS', optionally with 'T' as the separator).
+
+    Returns
+    -------
+    datetime
+        The bound, without a time zone like the log timestamps.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        If the text is not a valid date and time.
+    """
+    try:
+        bound = datetime.fromisoformat(text.strip())
+    except ValueError:
+        bound = None
+    if bound is None or bound.tzinfo is not None:
+        raise argparse.ArgumentTypeError(
+            f"invalid time '{text}', expected YYYY-MM-DD[ HH:MM[:SS]]"
+        )
+    return bound
+
+
+class TimeWindow(NamedTuple):
+    """
+    A half-open time interval [since, until) in epoch seconds.
+
+    A bound of None leaves that side of the window open.
+    """
+
+    since: Optional[int] = None
+    until: Optional[int] = None
+
+    @classmethod
+    def from_datetimes(
+        cls, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> "TimeWindow":
+        """Build a window from naive datetimes, like those of parse_time_bound."""
+        return cls(
+            None if since is None else to_epoch_seconds(since.date(), since.time()),
+            None if until is None else to_epoch_seconds(until.date(), until.time()),
+        )
+
+    def contains(self, seconds: int) -> bool:
+        """Check whether a timestamp in epoch seconds falls into the window."""
+        return (self.since is None or seconds >= self.since) and (
+            self.until is None or seconds < self.until
+        )
+
+    def bisect(self, timestamps: Sequence[int]) -> Tuple[int, int]:
+        """
+        Find the window in sorted timestamps by binary search.
+
+        Returns
+        -------
+        Tuple[int, int]
+            The start and the end of the slice of timestamps in the window.
+        """
+        start = 0 if self.since is None else bisect_left(timestamps, self.since)
+        end = len(timestamps) if self.until is None else bisect_left(timestamps, self.until)
+        return start, max(start, end)
+
+
+class LogColumns:
+    """
+    Parsed log entries stored column by column.
+
+    Timestamps are kept as int64 epoch seconds, levels as uint8 codes and
+    all messages in one shared UTF-8 buffer with an offsets array, which
+    takes a fraction of the memory of a list of ``LogEntry`` tuples.
+    Counting and filtering by level run over whole columns (with NumPy when
+    it is installed), and ``LogEntry`` views are built only on demand.
+    ``is_sorted`` tells whether the timestamps never decrease, which lets
+    time windows be found by binary search.
+    """
+
+    def __init__(self):
+        self.timestamps = array("q")
+        self.levels = array("B")
+        self.messages = bytearray()
+        self.offsets = array("Q", [0])
+        self.is_sorted = True
+
+    @classmethod
+    def from_entries(cls, logs: Iterable[LogEntry]) -> "LogColumns":
+        """Build the columns from a stream of parsed log entries."""
+        columns = cls()
+        columns.extend(logs)
+        return columns
+
+    def append(self, log: LogEntry):
+        seconds = to_epoch_seconds(log.date, log.time)
+        if self.timestamps and seconds < self.timestamps[-1]:
+            self.is_sorted = False
+        self.timestamps.append(seconds)
+        self.levels.append(LEVEL_CODES[log.level])
+        self.messages += log.message.encode("utf-8")
+        self.offsets.append(len(self.messages))
+
+    def extend(self, logs: Iterable[LogEntry]):
+        for log in logs:
+            self.append(log)
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def __getitem__(self, index: int) -> LogEntry:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("log entry index out of range")
+        log_date, log_time = from_epoch_seconds(self.timestamps[index])
+        message = self.messages[self.offsets[index] : self.offsets[index + 1]]
+        return LogEntry(
+            date=log_date,
+            time=log_time,
+            level=LEVEL_NAMES[self.levels[index]],
+            message=message.decode("utf-8"),
+        )
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def nbytes(self) -> int:
+        """The memory used by the column buffers, in bytes."""
+        return (
+            self.timestamps.itemsize * len(self.timestamps)
+            + self.levels.itemsize * len(self.levels)
+            + len(self.messages)
+            + self.offsets.itemsize * len(self.offsets)
+        )
+
+    def count_by_level(
+        self, histogram: Optional[Counter] = None, bucket: int = 60
+    ) -> Dict[str, int]:
+        """
+        Count the entries for each logging level over the level column.
+
+        Parameters
+        ----------
+        histogram : Optional[Counter], optional
+            A counter to update, in the same pass, with the number of entries
+            per (bucket start in epoch seconds, level) (default is None).
+        bucket : int, optional
+            The histogram bucket size in seconds (default is 60).
+
+        Returns
+        -------
+        Dict[str, int]
+            A dictionary with logging levels as keys and counts as values.
+        """
+        if histogram is not None:
+            buckets = self._count_by_bucket(bucket)
+            histogram.update(buckets)
+            totals: Counter = Counter()
+            for (_, level), count in buckets.items():
+                totals[level] += count
+            return {level: totals[level] for level in LEVEL_NAMES if totals[level]}
+        if np is not None:
+            codes = np.frombuffer(self.levels, dtype=np.uint8)
+            totals = np.bincount(codes, minlength=len(LEVEL_NAMES)).tolist()
+        else:
+            raw = self.levels.tobytes()
+            totals = [raw.count(code) for code in range(len(LEVEL_NAMES))]
+        return {level: total for level, total in zip(LEVEL_NAMES, totals) if total}
+
+    def _count_by_bucket(self, bucket: int) -> Counter:
+        """Count the entries per (bucket start, level) over both columns."""
+        if np is not None:
+            starts = np.frombuffer(self.timestamps, dtype=np.int64) // bucket
+            codes = np.frombuffer(self.levels, dtype=np.uint8)
+            keys, totals = np.unique(starts * len(LEVEL_NAMES) + codes, return_counts=True)
+            starts, codes = np.divmod(keys, len(LEVEL_NAMES))
+            return Counter(
+                {
+                    (start * bucket, LEVEL_NAMES[code]): total
+                    for start, code, total in zip(
+                        starts.tolist(), codes.tolist(), totals.tolist()
+                    )
+                }
+            )
+        return Counter(
+            (seconds - seconds % bucket, LEVEL_NAMES[code])
+            for seconds, code in zip(self.timestamps, self.levels)
+        )
+
+    def select_window(self, window: TimeWindow) -> "LogColumns":
+        """
+        Select the entries inside a time window.
+
+        Sorted columns are sliced at bounds found by binary search; unsorted
+        ones are scanned.
+
+        Parameters
+        ----------
+        window : TimeWindow
+            The time window to select.
+
+        Returns
+        -------
+        LogColumns
+            A new store with the matching entries, in file order.
+        """
+        if not self.is_sorted:
+            selected = LogColumns()
+            selected.extend(
+                self[index]
+                for index, seconds in enumerate(self.timestamps)
+                if window.contains(seconds)
+            )
+            return selected
+
+        start, end = window.bisect(self.timestamps)
+        base = self.offsets[start]
+        selected = LogColumns()
+        selected.timestamps = self.timestamps[start:end]
+        selected.levels = self.levels[start:end]
+        selected.messages = self.messages[base : self.offsets[end]]
+        selected.offsets = array("Q", (offset - base for offset in self.offsets[start : end + 1]))
+        return selected
+
+    def select_by_level(self, level: str) -> List[int]:
+        """
+        Find the positions of the entries of one logging level.
+
+        Parameters
+        ----------
+        level : str
+            The logging level to filter by (e.g., 'INFO', 'ERROR').
+
+        Returns
+        -------
+        List[int]
+            The indices of the matching entries, in file order.
+        """
+        code = LEVEL_CODES.get(level.upper())
+        if code is None:
+            return []
+        if np is not None:
+            codes = np.frombuffer(self.levels, dtype=np.uint8)
+            return np.flatnonzero(codes == code).tolist()
+        raw = self.levels.tobytes()
+        indices = []
+        index = raw.find(code)
+        while index != -1:
+            indices.append(index)
+            index = raw.find(code, index + 1)
+        return indices
+
+    def filter_by_level(self, level: str) -> List[LogEntry]:
+        """
+        Filter logs by logging level.
+
+        Parameters
+        ----------
+        level : str
+            The logging level to filter by (e.g., 'INFO', 'ERROR').
+
+        Returns
+        -------
+        List[LogEntry]
+            Views of the log entries that match the specified logging level.
+        """
+        return [self[index] for index in self.select_by_level(level)]
+
+
+def load_logs_columnar(
+    file_path: str,
+    message_index: Optional["MessageIndex"] = None,
+    output: Optional[AnalysisOutput] = None,
+) -> LogColumns:
+    """
+    Load and parse logs from a file into columnar storage.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the log file.
+    message_index : Optional[MessageIndex], optional
+        An empty index to fill with the messages while loading; entry ids
+        are positions in the returned store (default is None).
+    output : Optional[AnalysisOutput], optional
+        The settings errors are reported with (default is None, text).
+
+    Returns
+    -------
+    LogColumns
+        The parsed log entries, stored column by column.
+    """
+    output = output or AnalysisOutput()
+    entries = iter_log_entries(file_path, output)
+    if message_index is not None:
+        entries = message_index.index_entries(entries)
+    logs = LogColumns.from_entries(entries)
+
+    if not len(logs):
+        output.error("No valid log entries found. Please check the log file format.")
         sys.exit(1)
 
     return logs
 
 
-def filter_logs_by_level(logs: List[LogEntry], level: str) -> List[LogEntry]:
+def count_levels(
+    logs: Iterable[LogEntry],
+    counts: Counter,
+    histogram: Optional[Counter] = None,
+    bucket: int = 60,
+) -> Iterator[LogEntry]:
+    """
+    Count log entries by level as they pass through a pipeline.
+
+    Parameters
+    ----------
+    logs : Iterable[LogEntry]
+        A stream of parsed log entries.
+    counts : Counter
+        The counter to update with the level of every entry.
+    histogram : Optional[Counter], optional
+        A counter to update with the number of entries per (bucket start in
+        epoch seconds, level) (default is None).
+    bucket : int, optional
+        The histogram bucket size in seconds (default is 60).
+
+    Yields
+    ------
+    LogEntry
+        The same entries, unchanged.
+    """
+    if histogram is None:
+        for log in logs:
+            counts[log.level] += 1
+            yield log
+        return
+    for log in logs:
+        counts[log.level] += 1
+        seconds = to_epoch_seconds(log.date, log.time)
+        histogram[seconds - seconds % bucket, log.level] += 1
+        yield log
+
+
+def select_window(logs: Iterable[LogEntry], window: TimeWindow) -> Iterator[LogEntry]:
+    """
+    Pass on only the log entries inside a time window.
+
+    The stream is not assumed to be sorted, so every entry is checked.
+
+    Parameters
+    ----------
+    logs : Iterable[LogEntry]
+        A stream of parsed log entries.
+    window : TimeWindow
+        The time window to select.
+
+    Yields
+    ------
+    LogEntry
+        The entries whose timestamps fall into the window.
+    """
+    return (log for log in logs if window.contains(to_epoch_seconds(log.date, log.time)))
+
+
+def _line_start_at(mapped: mmap.mmap, offset: int) -> int:
+    """Return the start of the first line that begins at or after a byte offset."""
+    if offset == 0:
+        return 0
+    newline = mapped.find(b"\n", offset - 1)
+    return len(mapped) if newline == -1 else newline + 1
+
+
+def _timestamp_at(
+    mapped: mmap.mmap, offset: int, encoding: str, output: AnalysisOutput
+) -> Tuple[int, Optional[int]]:
+    """The start and the timestamp of the first valid line at or after an offset."""
+    start = _line_start_at(mapped, offset)
+    while start < len(mapped):
+        newline = mapped.find(b"\n", start)
+        end = len(mapped) if newline == -1 else newline + 1
+        log = parse_log_line(mapped[start:end].decode(encoding).strip(), output)
+        if log:
+            return start, to_epoch_seconds(log.date, log.time)
+        start = end
+    return start, None
+
+
+def _last_timestamp(
+    mapped: mmap.mmap, encoding: str, output: AnalysisOutput
+) -> Optional[Tuple[int, int]]:
+    """The start and the timestamp of the last valid line of a mapped file."""
+    end = len(mapped)
+    while end > 0:
+        start = mapped.rfind(b"\n", 0, end - 1) + 1
+        log = parse_log_line(mapped[start:end].decode(encoding).strip(), output)
+        if log:
+            return start, to_epoch_seconds(log.date, log.time)
+        end = start
+    return None
+
+
+def find_window_range(
+    mapped: mmap.mmap, window: TimeWindow, encoding: str
+) -> Optional[Tuple[int, int]]:
+    """
+    Find the byte range of a log in time order that holds a time window.
+
+    Every bound is found by binary search over byte offsets: a probe seeks
+    to an offset, moves on to the next line start and parses the first
+    valid line from there. The first and the last valid lines are probed as
+    well, so that a rotated or concatenated log is not taken for a sorted
+    one. Invalid lines met by the probes are not reported.
+
+    Parameters
+    ----------
+    mapped : mmap.mmap
+        The mapped log file.
+    window : TimeWindow
+        The time window to find.
+    encoding : str
+        The text encoding of the file.
+
+    Returns
+    -------
+    Optional[Tuple[int, int]]
+        The start and the end offsets of the lines to scan, or None if the
+        probed timestamps show that the log is not in time order.
+    """
+    probes: List[Tuple[int, int]] = []
+    quiet = _quiet_output()
+
+    def first_at_or_after(seconds: int) -> int:
+        low, high = 0, len(mapped)
+        while low < high:
+            middle = (low + high) // 2
+            start, timestamp = _timestamp_at(mapped, middle, encoding, quiet)
+            if timestamp is not None:
+                probes.append((start, timestamp))
+            if timestamp is not None and timestamp < seconds:
+                low = start + 1
+            else:
+                high = middle
+        return _line_start_at(mapped, low)
+
+    first = _timestamp_at(mapped, 0, encoding, quiet)
+    last = _last_timestamp(mapped, encoding, quiet)
+    if first[1] is not None and last is not None:
+        probes += [first, last]
+    start = 0 if window.since is None else first_at_or_after(window.since)
+    end = len(mapped) if window.until is None else first_at_or_after(window.until)
+    probes.sort()
+    if any(later[1] < earlier[1] for earlier, later in zip(probes, probes[1:])):
+        return None
+    return start, max(start, end)
+
+
+def window_byte_range(
+    mapped: mmap.mmap, window: Optional[TimeWindow], encoding: str
+) -> Tuple[int, int]:
+    """
+    Find the byte range of a mapped log file that an analysis scans.
+
+    It is the range found by ``find_window_range`` for a time window on a
+    log in time order, otherwise the whole file. Every analysis mode scans,
+    and reports the invalid lines of, this range only, so that they all
+    give the same output.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The start and the end offsets of the lines to scan.
+    """
+    byte_range = None if window is None else find_window_range(mapped, window, encoding)
+    return byte_range or (0, len(mapped))
+
+
+def iter_window_entries(
+    file_path: str, window: TimeWindow, output: Optional[AnalysisOutput] = None
+) -> Iterator[LogEntry]:
+    """
+    Read the parsed entries of the part of a log file that holds a time window.
+
+    Logs are written in time order, so on a plain file the window bounds
+    are found by binary search over byte offsets (see ``window_byte_range``)
+    and only the lines between them are parsed; invalid lines outside that
+    range are not reported, in any analysis mode. If the probed timestamps
+    are out of order, or the file is compressed and cannot be seeked, every
+    entry is read. The caller still selects the window from the entries.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the log file.
+    window : TimeWindow
+        The time window of the entries to read.
+    output : Optional[AnalysisOutput], optional
+        The settings errors are reported with (default is None, text).
+
+    Yields
+    ------
+    LogEntry
+        The parsed log entries of the range in file order.
+    """
+    output = output or AnalysisOutput()
+    encoding = locale.getpreferredencoding(False)
+    try:
+        with open(file_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size and not detect_compression(file_path):
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    byte_range = window_byte_range(mapped, window, encoding)
+                    for line in _iter_range_lines(mapped, *byte_range, encoding):
+                        parsed_line = parse_log_line(line.strip(), output)
+                        if parsed_line:
+                            yield parsed_line
+                    return
+    except FileNotFoundError:
+        output.error(f"The file {file_path} does not exist.")
+        sys.exit(1)
+    except Exception as e:
+        output.error("An error occurred while reading the file", "", str(e))
+        sys.exit(1)
+    yield from iter_log_entries(file_path, output)
+
+
+def select_level(logs: Iterable[LogEntry], level: str) -> Iterator[LogEntry]:
+    """
+    Pass on only the log entries of one logging level.
+
+    Parameters
+    ----------
+    logs : Iterable[LogEntry]
+        A stream of parsed log entries.
+    level : str
+        The logging level to filter by (e.g., 'INFO', 'ERROR').
+
+    Yields
+    ------
+    LogEntry
+        The entries that match the specified logging level.
+    """
+    level = level.upper()
+    return (log for log in logs if log.level == level)
+
+
+def filter_logs_by_level(
+    logs: Union[List[LogEntry], LogColumns], level: str
+) -> List[LogEntry]:
     """
     Filter logs by logging level.
 
     Parameters
     ----------
-    logs : List[LogEntry]
-        A list of parsed log entries.
+    logs : Union[List[LogEntry], LogColumns]
+        A list of parsed log entries or their columnar storage.
     level : str
         The logging level to filter by (e.g., 'INFO', 'ERROR').
 
@@ -125,25 +1071,42 @@ def filter_logs_by_level(logs: List[LogEntry], level: str) -> List[LogEntry]:
     List[LogEntry]
         A list of log entries that match the specified logging level.
     """
+    if isinstance(logs, LogColumns):
+        return logs.filter_by_level(level)
     return [log for log in logs if log.level == level.upper()]
 
 
-def count_logs_by_level(logs: List[LogEntry]) -> Dict[str, int]:
+def count_logs_by_level(
+    logs: Union[List[LogEntry], LogColumns],
+    histogram: Optional[Counter] = None,
+    bucket: int = 60,
+) -> Dict[str, int]:
     """
     Count the number of log entries for each logging level.
 
     Parameters
     ----------
-    logs : List[LogEntry]
-        A list of parsed log entries.
+    logs : Union[List[LogEntry], LogColumns]
+        A list of parsed log entries or their columnar storage.
+    histogram : Optional[Counter], optional
+        A counter to update, in the same pass, with the number of entries per
+        (bucket start in epoch seconds, level) (default is None).
+    bucket : int, optional
+        The histogram bucket size in seconds (default is 60).
 
     Returns
     -------
     Dict[str, int]
         A dictionary with logging levels as keys and counts as values.
     """
-    levels = [log.level for log in logs]
-    return dict(Counter(levels))
+    if isinstance(logs, LogColumns):
+        return logs.count_by_level(histogram, bucket)
+    if histogram is None:
+        levels = [log.level for log in logs]
+        return dict(Counter(levels))
+    counts: Counter = Counter()
+    deque(count_levels(logs, counts, histogram, bucket), maxlen=0)
+    return dict(counts)
 
 
 def display_log_counts(counts: Dict[str, int]):
@@ -162,14 +1125,71 @@ def display_log_counts(counts: Dict[str, int]):
         print(f"{level:<13} │ {count}")
 
 
-def display_filtered_logs(logs: List[LogEntry], level: str):
+def display_histogram(histogram: Dict[Tuple[int, str], int]):
     """
-    Display the details of filtered logs for a specific level.
+    Display the counts per time bucket and logging level in a table.
 
     Parameters
     ----------
-    logs : List[LogEntry]
-        A list of log entries to display.
+    histogram : Dict[Tuple[int, str], int]
+        The number of entries per (bucket start in epoch seconds, level).
+    """
+    levels = sorted({level for _, level in histogram})
+    starts = sorted({start for start, _ in histogram})
+    print()
+    print("Time             │ " + " │ ".join(f"{level:>7}" for level in levels))
+    print("─────────────────┼─" + "─┼─".join("─" * 7 for _ in levels))
+    for start in starts:
+        start_date, start_time = from_epoch_seconds(start)
+        cells = " │ ".join(f"{histogram.get((start, level), 0):>7}" for level in levels)
+        print(f"{start_date} {start_time:%H:%M} │ {cells}")
+
+
+def format_log_entry(log: LogEntry) -> str:
+    """
+    Format a log entry for display.
+
+    Parameters
+    ----------
+    log : LogEntry
+        The log entry to format.
+
+    Returns
+    -------
+    str
+        The date, time and message of the entry.
+    """
+    return f"{log.date} {log.time} - {log.message}"
+
+
+def write_lines(lines: Iterable[str]):
+    """
+    Write lines to stdout in blocks of OUTPUT_BATCH_SIZE lines.
+
+    One write per block instead of one ``print`` per line keeps the output
+    of millions of entries from dominating the run time.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines to write, without line endings.
+    """
+    lines = iter(lines)
+    while True:
+        block = list(islice(lines, OUTPUT_BATCH_SIZE))
+        if not block:
+            return
+        sys.stdout.write("\n".join(block) + "\n")
+
+
+def display_filtered_logs(logs: List[LogEntry], level: str):
+    """
+    Display the details of filtered logs for a specific level.
+
+    Parameters
+    ----------
+    logs : List[LogEntry]
+        A list of log entries to display.
     level : str
         The logging level of the entries to display.
     """
@@ -178,34 +1198,1775 @@ def display_filtered_logs(logs: List[LogEntry], level: str):
         return
 
     print(f"\nLog details for level '{level.upper()}':")
-    for log in logs:
-        print(f"{log.date} {log.time} - {log.message}")
+    write_lines(format_log_entry(log) for log in logs)
+
+
+def display_filtered_lines(lines: Iterable[str], level: str):
+    """
+    Display already formatted log entries for a specific level.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The formatted log entries to display, without line endings.
+    level : str
+        The logging level of the entries to display.
+    """
+    lines = iter(lines)
+    first = next(lines, None)
+    if first is None:
+        print(f"No log entries found for level '{level.upper()}'.")
+        return
+
+    print(f"\nLog details for level '{level.upper()}':")
+    write_lines(chain([first], lines))
+
+
+@contextlib.contextmanager
+def output_layer(
+    output_format: str = "text",
+    error_samples: Optional[int] = None,
+    buffer_size: int = OUTPUT_BUFFER_SIZE,
+) -> Iterator[AnalysisOutput]:
+    """
+    Route the analysis output through a buffered, formatted layer.
+
+    While the context is active, stdout is written in blocks of
+    ``buffer_size`` bytes instead of line by line. The yielded settings,
+    passed to the analysis, display the results in the given format and
+    collapse parse errors into a summary if ``error_samples`` is given. The
+    JSON formats always summarize errors, and other error messages go to
+    stderr, so the output stays parseable.
+
+    Parameters
+    ----------
+    output_format : str, optional
+        One of OUTPUT_FORMATS (default is 'text').
+    error_samples : Optional[int], optional
+        The number of invalid lines quoted in the error summary (default is
+        None: print every parse error as it is found).
+    buffer_size : int, optional
+        The stdout buffer size in bytes (default is OUTPUT_BUFFER_SIZE).
+
+    Yields
+    ------
+    AnalysisOutput
+        The output settings of the analysis.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"unknown output format '{output_format}'")
+    if output_format != "text" and error_samples is None:
+        error_samples = ERROR_SAMPLES
+    summary = None if error_samples is None else ParseErrorSummary(error_samples)
+
+    previous_stdout = sys.stdout
+    try:
+        fileno = previous_stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        fileno = None  # not a real file, e.g. captured output
+    if fileno is not None:
+        previous_stdout.flush()
+        sys.stdout = io.TextIOWrapper(
+            open(fileno, "wb", buffering=buffer_size, closefd=False),
+            encoding=previous_stdout.encoding,
+            errors=previous_stdout.errors,
+        )
+    try:
+        yield AnalysisOutput(output_format, summary)
+    finally:
+        if sys.stdout is not previous_stdout:
+            try:
+                sys.stdout.flush()
+            finally:
+                sys.stdout = previous_stdout
+
+
+def _print_worker_errors(errors_path: str, output: AnalysisOutput):
+    """Print the error messages a pool worker wrote to a file."""
+    with open(errors_path, encoding="utf-8") as errors:
+        shutil.copyfileobj(errors, output.messages)
+
+
+def _read_worker_matches(matches_paths: Iterable[str]) -> Iterator[str]:
+    """Yield the formatted entries pool workers wrote to files, in order."""
+    for path in matches_paths:
+        with open(path, encoding="utf-8", newline="\n") as matches:
+            for line in matches:
+                yield line[:-1]
+
+
+def _log_record(log: LogEntry) -> Dict[str, str]:
+    """A log entry as JSON-compatible data."""
+    return {
+        "date": str(log.date),
+        "time": str(log.time),
+        "level": log.level,
+        "message": log.message,
+    }
+
+
+def _entry_formatter(output_format: str) -> Callable[[LogEntry], str]:
+    """
+    The function that turns a log entry into a line of an output format.
+
+    The entries are serialized from their fields as soon as they are
+    selected, so spooled and worker files already hold the output lines.
+    """
+    if output_format == "text":
+        return format_log_entry
+    if output_format == "ndjson":
+        return lambda log: json.dumps(
+            {"type": "entry", **_log_record(log)}, ensure_ascii=False
+        )
+    return lambda log: json.dumps(_log_record(log), ensure_ascii=False)
+
+
+def _write_json(
+    counts: Dict[str, int],
+    histogram: Optional[Dict[Tuple[int, str], int]],
+    entries: Iterable[str],
+    output: AnalysisOutput,
+):
+    """
+    Write the results as one JSON document or as NDJSON records.
+
+    The entries, serialized by ``_entry_formatter``, come last and are
+    written as they are produced, so even the JSON document never holds all
+    of them in memory.
+    """
+    histogram_records = None
+    if histogram is not None:
+        histogram_records = []
+        for (start, level), count in sorted(histogram.items()):
+            start_date, start_time = from_epoch_seconds(start)
+            histogram_records.append(
+                {"start": f"{start_date} {start_time}", "level": level, "count": count}
+            )
+    errors = output.errors.to_dict() if output.errors is not None else None
+
+    if output.format == "ndjson":
+        write_lines([json.dumps({"type": "counts", "counts": counts})])
+        for record in histogram_records or ():
+            write_lines([json.dumps({"type": "histogram", **record})])
+        if errors is not None:
+            write_lines([json.dumps({"type": "errors", **errors}, ensure_ascii=False)])
+        write_lines(entries)
+        return
+
+    # The header fields are serialized one by one, so that the entries can
+    # follow them in the same object without being held in memory
+    header = {"counts": counts, "histogram": histogram_records, "errors": errors}
+    sys.stdout.write("{")
+    for key, value in header.items():
+        field = json.dumps(value, ensure_ascii=False)
+        sys.stdout.write(f"{json.dumps(key)}: {field}, ")
+    sys.stdout.write(f"{json.dumps('entries')}: [")
+    entries = iter(entries)
+    first = next(entries, None)
+    if first is not None:
+        sys.stdout.write("\n" + first)
+        while True:
+            block = list(islice(entries, OUTPUT_BATCH_SIZE))
+            if not block:
+                break
+            sys.stdout.write(",\n" + ",\n".join(block))
+    sys.stdout.write("]}\n")
+
+
+def display_analysis(
+    counts: Dict[str, int],
+    histogram: Optional[Dict[Tuple[int, str], int]],
+    level: Optional[str],
+    lines: Iterable[str],
+    window: Optional[TimeWindow] = None,
+    output: Optional[AnalysisOutput] = None,
+):
+    """
+    Display the results of a log analysis, or exit if nothing was found.
+
+    Parameters
+    ----------
+    counts : Dict[str, int]
+        The counts by logging level.
+    histogram : Optional[Dict[Tuple[int, str], int]]
+        The counts per time bucket and level, or None if not requested.
+    level : Optional[str]
+        The logging level whose entries to display, if any.
+    lines : Iterable[str]
+        The entries of that level, as lines of the output format.
+    window : Optional[TimeWindow], optional
+        The time window the entries were selected from (default is None).
+    output : Optional[AnalysisOutput], optional
+        The output settings (default is None, text).
+    """
+    output = output or AnalysisOutput()
+    if output.format != "text":
+        _write_json(counts, histogram, lines, output)
+        return
+    if output.errors is not None:
+        output.errors.display()
+    if not counts:
+        if window is not None:
+            print("No log entries found in the given time window.")
+            return
+        output.error("No valid log entries found. Please check the log file format.")
+        sys.exit(1)
+
+    display_log_counts(counts)
+    if histogram is not None:
+        display_histogram(histogram)
+    if level:
+        display_filtered_lines(lines, level)
+
+
+def _scan_lines(
+    lines: Iterable[str],
+    level: Optional[str],
+    window: Optional[TimeWindow] = None,
+    bucket: Optional[int] = None,
+    matches: Optional[TextIO] = None,
+    format_entry: Callable[[LogEntry], str] = format_log_entry,
+    output: Optional[AnalysisOutput] = None,
+) -> Tuple[Counter, List[str], Optional[Counter]]:
+    """
+    Parse, select and count log lines with the pipeline stages.
+
+    The entries of the requested level are formatted with ``format_entry``;
+    if ``matches`` is given, they are written to it, one per line, instead
+    of being returned. Invalid lines are reported with ``output``.
+
+    Returns
+    -------
+    Tuple[Counter, List[str], Optional[Counter]]
+        The counts by level, the formatted entries of the requested level and
+        the histogram (None unless a bucket size is given).
+    """
+    counts: Counter = Counter()
+    histogram = Counter() if bucket else None
+    logs = (
+        log for line in lines for log in [parse_log_line(line.strip(), output)] if log
+    )
+    if window is not None:
+        logs = select_window(logs, window)
+    logs = count_levels(logs, counts, histogram, bucket or 60)
+    matched: List[str] = []
+    if level and matches is not None:
+        for log in select_level(logs, level):
+            matches.write(format_entry(log) + "\n")
+    elif level:
+        matched = [format_entry(log) for log in select_level(logs, level)]
+    else:
+        deque(logs, maxlen=0)
+    return counts, matched, histogram
+
+
+def analyze_logs_streaming(
+    file_path: str,
+    level: Optional[str] = None,
+    window: Optional[TimeWindow] = None,
+    bucket: Optional[int] = None,
+    output: Optional[AnalysisOutput] = None,
+):
+    """
+    Count and filter a log file in a single pass with bounded memory.
+
+    Time window selection, counting (with the optional histogram) and level
+    filtering are stages over the stream of parsed entries; with a time
+    window, only the byte range found by iter_window_entries is read. The
+    counts table must be printed before the filtered entries, so the
+    formatted matches are buffered in a spooled temporary file that moves
+    to disk once it grows large.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the log file.
+    level : Optional[str], optional
+        The logging level whose entries to display (default is None).
+    window : Optional[TimeWindow], optional
+        The time window of the entries to analyze (default is None, all).
+    bucket : Optional[int], optional
+        The histogram bucket size in seconds (default is None, no histogram).
+    output : Optional[AnalysisOutput], optional
+        The output settings (default is None, text).
+    """
+    output = output or AnalysisOutput()
+    counts: Counter = Counter()
+    histogram = Counter() if bucket else None
+    if window is None:
+        logs = iter_log_entries(file_path, output)
+    else:
+        logs = select_window(iter_window_entries(file_path, window, output), window)
+    logs = count_levels(logs, counts, histogram, bucket or 60)
+
+    format_entry = _entry_formatter(output.format)
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode="w+") as spool:
+        if level:
+            for log in select_level(logs, level):
+                spool.write(format_entry(log) + "\n")
+        else:
+            deque(logs, maxlen=0)  # drain the pipeline, keeping nothing
+
+        spool.seek(0)
+        display_analysis(
+            dict(counts),
+            histogram,
+            level,
+            (line.rstrip("\n") for line in spool),
+            window,
+            output,
+        )
+
+
+def _line_ranges(
+    mapped: mmap.mmap, parts: int, start: int = 0, end: Optional[int] = None
+) -> List[Tuple[int, int]]:
+    """
+    Split a byte range of a mapped file into ranges that end after a newline.
+
+    Parameters
+    ----------
+    mapped : mmap.mmap
+        The mapped log file.
+    parts : int
+        The desired number of ranges.
+    start : int, optional
+        The start of the range to split, a line start (default is 0).
+    end : Optional[int], optional
+        The end of the range to split (default is None, the end of the file).
+
+    Returns
+    -------
+    List[Tuple[int, int]]
+        The (start, end) offsets of the ranges, in file order.
+    """
+    if end is None:
+        end = len(mapped)
+    ranges = []
+    position = start
+    for i in range(1, parts):
+        split = max(start + (end - start) * i // parts, position)
+        newline = mapped.find(b"\n", split, end)
+        if newline == -1:
+            break
+        ranges.append((position, newline + 1))
+        position = newline + 1
+    if position < end:
+        ranges.append((position, end))
+    return ranges
+
+
+def _iter_range_lines(
+    mapped: mmap.mmap, start: int, end: int, encoding: str
+) -> Iterator[str]:
+    """Decode a byte range block by block and yield its lines."""
+    while start < end:
+        stop = min(start + PARALLEL_BLOCK_SIZE, end)
+        if stop < end:
+            newline = mapped.find(b"\n", stop, end)
+            stop = end if newline == -1 else newline + 1
+        text = mapped[start:stop].decode(encoding)
+        # Universal newlines, as when the file is opened in text mode
+        yield from io.StringIO(text, newline=None)
+        start = stop
+
+
+@contextlib.contextmanager
+def _worker_outputs(part_path: str) -> Iterator[TextIO]:
+    """Send a worker's stdout to the errors file and yield the matches file."""
+    with open(f"{part_path}.errors", "w", encoding="utf-8") as errors, open(
+        f"{part_path}.matches", "w", encoding="utf-8", newline="\n"
+    ) as matches, contextlib.redirect_stdout(errors):
+        yield matches
+
+
+def _worker_output(error_samples: Optional[int]) -> AnalysisOutput:
+    """
+    The output settings of a pool worker.
+
+    Its messages go to its stdout, the errors file, whatever the format, as
+    the parent copies them to its own stream; the parse errors are collected
+    only if the parent summarizes them.
+    """
+    summary = None if error_samples is None else ParseErrorSummary(error_samples)
+    return AnalysisOutput(errors=summary)
+
+
+def _analyze_range(
+    file_path: str,
+    start: int,
+    end: int,
+    level: Optional[str],
+    encoding: str,
+    window: Optional[TimeWindow] = None,
+    bucket: Optional[int] = None,
+    error_samples: Optional[int] = None,
+    part_path: str = os.devnull,
+    output_format: str = "text",
+) -> Tuple[Counter, Optional[Counter], Optional[ParseErrorSummary]]:
+    """
+    Parse and count one byte range of a log file (a process pool worker).
+
+    The entries of the requested level, formatted for ``output_format``,
+    are written to
+    ``part_path + ".matches"`` and the error messages printed while parsing
+    to ``part_path + ".errors"``, so that only the counts travel back to the
+    parent process.
+
+    Returns
+    -------
+    Tuple[Counter, Optional[Counter], Optional[ParseErrorSummary]]
+        The counts by level, the histogram and, if ``error_samples`` is
+        given, the summary of the parse errors.
+    """
+    output = _worker_output(error_samples)
+    with open(file_path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped, _worker_outputs(part_path) as matches:
+        counts, _, histogram = _scan_lines(
+            _iter_range_lines(mapped, start, end, encoding),
+            level,
+            window,
+            bucket,
+            matches,
+            _entry_formatter(output_format),
+            output,
+        )
+    return counts, histogram, output.errors
+
+
+def analyze_logs_parallel(
+    file_path: str,
+    level: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    window: Optional[TimeWindow] = None,
+    bucket: Optional[int] = None,
+    min_range_size: int = PARALLEL_MIN_RANGE_SIZE,
+    output: Optional[AnalysisOutput] = None,
+):
+    """
+    Count and filter a log file on several CPU cores.
+
+    The memory-mapped file is split into byte ranges aligned to newlines;
+    every range is parsed and counted in a process pool. The workers write
+    their filtered entries and parse errors to temporary files, which are
+    read back in file order, so the output is the same as that of the
+    serial analysis and the parent's memory does not grow with the matches.
+    With a time window, only the ``window_byte_range`` is split.
+    A compressed file, or one too small for two ranges, is analyzed
+    serially.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the log file.
+    level : Optional[str], optional
+        The logging level whose entries to display (default is None).
+    max_workers : Optional[int], optional
+        The number of worker processes (default is None, one per CPU).
+    window : Optional[TimeWindow], optional
+        The time window of the entries to analyze (default is None, all).
+    bucket : Optional[int], optional
+        The histogram bucket size in seconds (default is None, no histogram).
+    min_range_size : int, optional
+        The smallest range worth a separate process (default is
+        PARALLEL_MIN_RANGE_SIZE).
+    output : Optional[AnalysisOutput], optional
+        The output settings (default is None, text).
+    """
+    output = output or AnalysisOutput()
+    encoding = locale.getpreferredencoding(False)
+    try:
+        ranges = []
+        if not detect_compression(file_path):
+            # A compressed stream cannot be split into independent ranges
+            with open(file_path, "rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                workers = max_workers or os.cpu_count() or 1
+                min_range_size = max(min_range_size, 1)
+                if min(workers, size // min_range_size) > 1:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        start, end = window_byte_range(mapped, window, encoding)
+                        parts = min(workers, (end - start) // min_range_size)
+                        if parts > 1:
+                            ranges = _line_ranges(mapped, parts, start, end)
+    except FileNotFoundError:
+        output.error(f"The file {file_path} does not exist.")
+        sys.exit(1)
+    except Exception as e:
+        output.error("An error occurred while reading the file", "", str(e))
+        sys.exit(1)
+
+    if len(ranges) < 2:
+        analyze_logs_streaming(file_path, level, window, bucket, output)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="log_analyzer_") as parts_dir:
+        part_paths = [os.path.join(parts_dir, str(i)) for i in range(len(ranges))]
+        try:
+            error_samples = None if output.errors is None else output.errors.max_samples
+            tasks = [
+                (file_path, start, end, level, encoding)
+                + (window, bucket, error_samples, part, output.format)
+                for (start, end), part in zip(ranges, part_paths)
+            ]
+            with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+                results = list(executor.map(_analyze_range, *zip(*tasks)))
+        except Exception as e:
+            output.error("An error occurred while reading the file", "", str(e))
+            sys.exit(1)
+
+        counts: Counter = Counter()
+        histogram = Counter() if bucket else None
+        for (range_counts, range_histogram, summary), part in zip(results, part_paths):
+            _print_worker_errors(f"{part}.errors", output)
+            counts.update(range_counts)
+            if histogram is not None:
+                histogram.update(range_histogram)
+            if summary is not None:
+                output.errors.update(summary)
+
+        display_analysis(
+            dict(counts),
+            histogram,
+            level,
+            _read_worker_matches(f"{part}.matches" for part in part_paths),
+            window,
+            output,
+        )
+
+
+def _natural_key(path: str) -> List[Union[int, str]]:
+    """Sort key that orders the numbers in file names numerically."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", path)]
+
+
+def expand_log_paths(patterns: Iterable[str]) -> List[str]:
+    """
+    Expand glob patterns into log file paths.
+
+    The matches of every pattern are sorted naturally (``app.log.2`` before
+    ``app.log.10``) and the patterns keep their order. A pattern without
+    matches is kept as is, so that a missing file is reported.
+
+    Parameters
+    ----------
+    patterns : Iterable[str]
+        File paths or glob patterns.
+
+    Returns
+    -------
+    List[str]
+        The file paths, each listed once.
+    """
+    paths: Dict[str, None] = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern), key=_natural_key) if glob.has_magic(pattern) else []
+        for path in matches or [pattern]:
+            paths.setdefault(path)
+    return list(paths)
+
+
+def _analyze_file(
+    file_path: str,
+    level: Optional[str],
+    window: Optional[TimeWindow] = None,
+    bucket: Optional[int] = None,
+    error_samples: Optional[int] = None,
+    part_path: str = os.devnull,
+    output_format: str = "text",
+) -> Tuple[Counter, Optional[Counter], Optional[ParseErrorSummary], bool]:
+    """
+    Parse and count one whole log file (a process pool worker).
+
+    As in ``_analyze_range``, the entries of the requested level, formatted
+    for ``output_format``, go to ``part_path + ".matches"`` and the error messages printed while
+    reading to ``part_path + ".errors"``.
+
+    Returns
+    -------
+    Tuple[Counter, Optional[Counter], Optional[ParseErrorSummary], bool]
+        The counts by level, the histogram, the summary of the parse errors
+        if ``error_samples`` is given, and whether the file could be read.
+    """
+    output = _worker_output(error_samples)
+    with _worker_outputs(part_path) as matches:
+        try:
+            with open_log_file(file_path) as file:
+                counts, _, histogram = _scan_lines(
+                    file,
+                    level,
+                    window,
+                    bucket,
+                    matches,
+                    _entry_formatter(output_format),
+                    output,
+                )
+            return counts, histogram, output.errors, True
+        except FileNotFoundError:
+            output.error(f"The file {file_path} does not exist.")
+        except Exception as e:
+            output.error(f"An error occurred while reading the file {file_path}", "", str(e))
+        matches.seek(0)
+        matches.truncate()
+    return Counter(), Counter() if bucket else None, output.errors, False
+
+
+def analyze_logs_files(
+    file_paths: List[str],
+    level: Optional[str] = None,
+    window: Optional[TimeWindow] = None,
+    bucket: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    output: Optional[AnalysisOutput] = None,
+):
+    """
+    Count and filter several log files as one set.
+
+    The files, plain or compressed, are independent, so they are read
+    concurrently in a process pool; their counts and histograms are merged,
+    and their entries and errors, passed through temporary files as in
+    ``analyze_logs_parallel``, are shown in the order of the paths. A file
+    that cannot be read is reported and skipped, and the exit status is 1
+    once the others are shown.
+
+    Parameters
+    ----------
+    file_paths : List[str]
+        The paths to the log files.
+    level : Optional[str], optional
+        The logging level whose entries to display (default is None).
+    window : Optional[TimeWindow], optional
+        The time window of the entries to analyze (default is None, all).
+    bucket : Optional[int], optional
+        The histogram bucket size in seconds (default is None, no histogram).
+    max_workers : Optional[int], optional
+        The number of worker processes (default is None, one per CPU).
+    output : Optional[AnalysisOutput], optional
+        The output settings (default is None, text).
+    """
+    output = output or AnalysisOutput()
+    with tempfile.TemporaryDirectory(prefix="log_analyzer_") as parts_dir:
+        part_paths = [os.path.join(parts_dir, str(i)) for i in range(len(file_paths))]
+        error_samples = None if output.errors is None else output.errors.max_samples
+        tasks = [
+            (file_path, level, window, bucket, error_samples, part, output.format)
+            for file_path, part in zip(file_paths, part_paths)
+        ]
+        workers = min(len(tasks), max_workers or os.cpu_count() or 1)
+        try:
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(_analyze_file, *zip(*tasks)))
+            else:
+                results = [_analyze_file(*task) for task in tasks]
+        except Exception as e:
+            output.error("An error occurred while reading the files", "", str(e))
+            sys.exit(1)
+
+        counts: Counter = Counter()
+        histogram = Counter() if bucket else None
+        for (file_counts, file_histogram, summary, _), part in zip(results, part_paths):
+            _print_worker_errors(f"{part}.errors", output)
+            counts.update(file_counts)
+            if histogram is not None:
+                histogram.update(file_histogram)
+            if summary is not None:
+                output.errors.update(summary)
+
+        display_analysis(
+            dict(counts),
+            histogram,
+            level,
+            _read_worker_matches(f"{part}.matches" for part in part_paths),
+            window,
+            output,
+        )
+    if not all(readable for _, _, _, readable in results):
+        sys.exit(1)
+
+
+class LogIndex:
+    """
+    A sidecar index of a log file for repeated queries.
+
+    It holds the counts by level, the byte offsets of the lines of every
+    level and of the invalid lines, and a sparse map from the timestamp of
+    every ``INDEX_TIME_STRIDE``-th entry to its offset. It covers the file up
+    to ``indexed_length`` (the end of the last complete line) and records
+    CRC32 checksums of the first and the last ``INDEX_CHECKSUM_SPAN`` bytes
+    of that prefix: if they still match, the log was only appended to and
+    just the new tail needs indexing; otherwise the index is rebuilt. When
+    the timestamps never decrease (``is_sorted``), a time window is mapped
+    to a byte range by binary search over the timestamp map.
+
+    On disk it is a JSON header line followed by the raw arrays.
+    """
+
+    def __init__(self):
+        self.indexed_length = 0
+        self.checksums = (0, 0)
+        self.counts: Counter = Counter()
+        self.level_offsets = {level: array("Q") for level in LEVEL_NAMES}
+        self.invalid_offsets = array("Q")
+        self.time_keys = array("q")
+        self.time_offsets = array("Q")
+        self.is_sorted = True
+        self.last_timestamp: Optional[int] = None
+
+    @staticmethod
+    def path_for(file_path: str) -> str:
+        """Return the path of the sidecar index of a log file."""
+        return file_path + INDEX_SUFFIX
+
+    def _arrays(self) -> List[array]:
+        return [
+            *(self.level_offsets[level] for level in LEVEL_NAMES),
+            self.invalid_offsets,
+            self.time_keys,
+            self.time_offsets,
+        ]
+
+    @classmethod
+    def load(cls, index_path: str) -> Optional["LogIndex"]:
+        """
+        Read an index file.
+
+        Returns
+        -------
+        Optional[LogIndex]
+            The index, or None if the file is missing, damaged or written by
+            another version.
+        """
+        index = cls()
+        try:
+            with open(index_path, "rb") as file:
+                header = json.loads(file.readline())
+                if header["version"] != INDEX_VERSION:
+                    return None
+                index.indexed_length = header["indexed_length"]
+                index.checksums = tuple(header["checksums"])
+                index.counts = Counter(header["counts"])
+                index.is_sorted = header["is_sorted"]
+                index.last_timestamp = header["last_timestamp"]
+                for values, length in zip(index._arrays(), header["lengths"]):
+                    values.fromfile(file, length)
+        except (OSError, ValueError, KeyError, TypeError, EOFError):
+            return None
+        return index
+
+    def save(self, index_path: str):
+        """Write the index atomically, replacing the previous file."""
+        header = {
+            "version": INDEX_VERSION,
+            "indexed_length": self.indexed_length,
+            "checksums": list(self.checksums),
+            "counts": dict(self.counts),
+            "is_sorted": self.is_sorted,
+            "last_timestamp": self.last_timestamp,
+            "lengths": [len(values) for values in self._arrays()],
+        }
+        temp_path = f"{index_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(json.dumps(header).encode("utf-8") + b"\n")
+                for values in self._arrays():
+                    values.tofile(file)
+            os.replace(temp_path, index_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def _checksums(file: BinaryIO, length: int) -> Tuple[int, int]:
+        """CRC32 of the first and the last INDEX_CHECKSUM_SPAN bytes of a prefix."""
+        file.seek(0)
+        head = zlib.crc32(file.read(min(INDEX_CHECKSUM_SPAN, length)))
+        tail_start = max(0, length - INDEX_CHECKSUM_SPAN)
+        file.seek(tail_start)
+        tail = zlib.crc32(file.read(length - tail_start))
+        return head, tail
+
+    def is_valid_for(self, file: BinaryIO) -> bool:
+        """Check that the indexed prefix of the log file is unchanged."""
+        if os.fstat(file.fileno()).st_size < self.indexed_length:
+            return False  # truncated or rotated
+        return self._checksums(file, self.indexed_length) == self.checksums
+
+    def extend(self, file: BinaryIO, encoding: str) -> bool:
+        """
+        Index the complete lines after the indexed prefix.
+
+        Returns
+        -------
+        bool
+            True if any line was added.
+        """
+        offset = self.indexed_length
+        entries = sum(self.counts.values())
+        file.seek(offset)
+        quiet = _quiet_output()  # invalid lines are reported at query time
+        for raw_line in iter(file.readline, b""):
+            if not raw_line.endswith(b"\n"):
+                break  # an incomplete last line is left for the next update
+            log = parse_log_line(raw_line.decode(encoding).strip(), quiet)
+            if log is None:
+                self.invalid_offsets.append(offset)
+            else:
+                seconds = to_epoch_seconds(log.date, log.time)
+                if self.last_timestamp is not None and seconds < self.last_timestamp:
+                    self.is_sorted = False
+                self.last_timestamp = seconds
+                if entries % INDEX_TIME_STRIDE == 0:
+                    self.time_keys.append(seconds)
+                    self.time_offsets.append(offset)
+                entries += 1
+                self.counts[log.level] += 1
+                self.level_offsets[log.level].append(offset)
+            offset += len(raw_line)
+
+        if offset == self.indexed_length:
+            return False
+        self.indexed_length = offset
+        self.checksums = self._checksums(file, offset)
+        return True
+
+    def byte_range(self, window: Optional[TimeWindow]) -> Tuple[int, int]:
+        """
+        Find the part of the indexed prefix that can hold a time window.
+
+        Returns
+        -------
+        Tuple[int, int]
+            The start and the end offsets of the lines to scan: the whole
+            prefix unless the log is sorted, otherwise the timestamp map
+            blocks that overlap the window.
+        """
+        if window is None or not self.is_sorted:
+            return 0, self.indexed_length
+        first, last = window.bisect(self.time_keys)
+        start = self.time_offsets[first - 1] if first else 0
+        end = self.time_offsets[last] if last < len(self.time_keys) else self.indexed_length
+        return start, max(start, end)
+
+
+def update_log_index(
+    file_path: str, output: Optional[AnalysisOutput] = None
+) -> LogIndex:
+    """
+    Bring the sidecar index of a log file up to date and return it.
+
+    A valid index is extended with the appended lines only; a missing,
+    damaged or outdated one is rebuilt from scratch.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the log file.
+    output : Optional[AnalysisOutput], optional
+        The settings a failed save is reported with (default is None, text).
+
+    Returns
+    -------
+    LogIndex
+        The up-to-date index.
+    """
+    encoding = locale.getpreferredencoding(False)
+    index_path = LogIndex.path_for(file_path)
+    with open(file_path, "rb") as file:
+        index = LogIndex.load(index_path)
+        rebuilt = index is None or not index.is_valid_for(file)
+        if rebuilt:
+            index = LogIndex()
+        if index.extend(file, encoding) or rebuilt:
+            try:
+                index.save(index_path)
+            except OSError as e:
+                # Without a saved index the next run just rebuilds it
+                (output or AnalysisOutput()).warning(
+                    f"the index could not be saved to '{index_path}': {e}"
+                )
+    return index
+
+
+def _read_line_at(file: BinaryIO, offset: int, encoding: str) -> str:
+    """Read the log line that starts at a byte offset."""
+    file.seek(offset)
+    return file.readline().decode(encoding).strip()
+
+
+def analyze_logs_indexed(
+    file_path: str,
+    level: Optional[str] = None,
+    window: Optional[TimeWindow] = None,
+    bucket: Optional[int] = None,
+    output: Optional[AnalysisOutput] = None,
+):
+    """
+    Count and filter a log file using its sidecar index.
+
+    Only the lines appended since the last run are parsed to update the
+    index; the counts come from the index, and the lines of the requested
+    level are read by seeking straight to their offsets. A time window or a
+    histogram needs the timestamps, so the lines are parsed then, but on a
+    sorted log only the byte range found by binary search over the
+    timestamp map. The output is the same as that of the serial analysis.
+    A compressed file is analyzed serially without an index.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the log file.
+    level : Optional[str], optional
+        The logging level whose entries to display (default is None).
+    window : Optional[TimeWindow], optional
+        The time window of the entries to analyze (default is None, all).
+    bucket : Optional[int], optional
+        The histogram bucket size in seconds (default is None, no histogram).
+    output : Optional[AnalysisOutput], optional
+        The output settings (default is None, text).
+    """
+    output = output or AnalysisOutput()
+    encoding = locale.getpreferredencoding(False)
+    try:
+        if detect_compression(file_path):
+            # Byte offsets into a compressed file cannot be seeked to
+            analyze_logs_streaming(file_path, level, window, bucket, output)
+            return
+        index = update_log_index(file_path, output)
+        file = open(file_path, "rb")
+    except FileNotFoundError:
+        output.error(f"The file {file_path} does not exist.")
+        sys.exit(1)
+    except Exception as e:
+        output.error("An error occurred while reading the file", "", str(e))
+        sys.exit(1)
+
+    with file, contextlib.ExitStack() as stack:
+        mapped = None
+        if os.fstat(file.fileno()).st_size:
+            mapped = stack.enter_context(
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+        # Report the invalid lines again, as the serial analysis would: those
+        # of its window_byte_range only
+        report_start, report_end = 0, len(mapped) if mapped is not None else 0
+        if window is not None and mapped is not None:
+            report_start, report_end = window_byte_range(mapped, window, encoding)
+        for offset in index.invalid_offsets:
+            if report_start <= offset < report_end:
+                parse_log_line(_read_line_at(file, offset, encoding), output)
+
+        format_entry = _entry_formatter(output.format)
+        # An incomplete last line is not indexed yet
+        file.seek(index.indexed_length)
+        tail = io.StringIO(file.read().decode(encoding), newline=None)
+        tail_output = output
+        if not report_start <= index.indexed_length < report_end:
+            tail_output = _quiet_output()
+        counts, tail_matched, histogram = _scan_lines(
+            tail, level, window, bucket, None, format_entry, tail_output
+        )
+
+        if window is None and bucket is None:
+            counts.update(index.counts)
+            matched: Iterable[str] = ()
+            if level:
+                indexed = (
+                    parse_log_line(_read_line_at(file, offset, encoding), output)
+                    for offset in index.level_offsets.get(level.upper(), ())
+                )
+                matched = (format_entry(log) for log in indexed if log)
+        else:
+            # The range may be the whole file: it is decoded block by block
+            # and the matches are spooled, as in the streaming analysis
+            start, end = index.byte_range(window)
+            lines: Iterable[str] = ()
+            if end > start:
+                lines = _iter_range_lines(mapped, start, end, encoding)
+            spool = stack.enter_context(
+                tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode="w+")
+            )
+            # The invalid lines were reported above
+            range_counts, _, range_histogram = _scan_lines(
+                lines, level, window, bucket, spool, format_entry, _quiet_output()
+            )
+            counts.update(range_counts)
+            if histogram is not None:
+                histogram.update(range_histogram)
+            spool.seek(0)
+            matched = (line.rstrip("\n") for line in spool)
+
+        display_analysis(
+            dict(counts), histogram, level, chain(matched, tail_matched), window, output
+        )
+
+
+class LogFollower:
+    """
+    Read the complete lines appended to a log file, like ``tail -F``.
+
+    The file stays open between reads. If it is truncated in place, reading
+    restarts from its beginning; if it is rotated (the path now names another
+    file), the rest of the old file is read and the new one is followed from
+    its start. An incomplete last line is held back until it is finished.
+    The file is read at most ``read_size`` bytes at a time (more only to
+    finish a longer line), so a large file takes several calls.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the log file.
+    encoding : Optional[str], optional
+        The encoding of the file (default is the locale's).
+    read_size : int, optional
+        The most bytes read by one call (default is FOLLOW_READ_SIZE).
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        encoding: Optional[str] = None,
+        read_size: int = FOLLOW_READ_SIZE,
+    ):
+        self.file_path = file_path
+        self.encoding = encoding or locale.getpreferredencoding(False)
+        self.read_size = read_size
+        self.file: Optional[BinaryIO] = None
+        self.partial = b""
+        self._more = False
+        self._open()
+
+    def _open(self):
+        try:
+            self.file = open(self.file_path, "rb")
+        except FileNotFoundError:
+            self.file = None  # between rotation and the new file's creation
+
+    def close(self):
+        """Close the followed file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def _decode(self, data: bytes) -> List[str]:
+        return list(io.StringIO(data.decode(self.encoding), newline=None))
+
+    def _read_available(self) -> List[str]:
+        while True:
+            data = self.file.read(self.read_size)
+            self._more = len(data) == self.read_size
+            if not data:
+                return []
+            data = self.partial + data
+            end = data.rfind(b"\n") + 1
+            self.partial = data[end:]
+            if end or not self._more:
+                return self._decode(data[:end])
+
+    def read_lines(self) -> List[str]:
+        """
+        Read the lines completed since the previous call.
+
+        Returns
+        -------
+        List[str]
+            The new lines, with their line endings; empty once all the
+            available lines have been read.
+        """
+        if self.file is None:
+            self._open()
+            if self.file is None:
+                return []
+
+        if os.fstat(self.file.fileno()).st_size < self.file.tell():
+            self.file.seek(0)  # truncated in place
+            self.partial = b""
+        lines = self._read_available()
+        if self._more:
+            return lines  # the rest of this file comes first
+
+        try:
+            current = os.stat(self.file_path)
+        except FileNotFoundError:
+            return lines  # rotated away; wait for the new file
+        opened = os.fstat(self.file.fileno())
+        if (current.st_ino, current.st_dev) != (opened.st_ino, opened.st_dev):
+            if self.partial:
+                lines += self._decode(self.partial)
+                self.partial = b""
+            self.close()
+            self._open()
+            if self.file is not None:
+                lines += self._read_available()
+        return lines
+
+
+def follow_logs(
+    file_path: str,
+    level: Optional[str] = None,
+    interval: float = FOLLOW_INTERVAL,
+    poll_interval: float = FOLLOW_POLL_INTERVAL,
+    stop: Optional[threading.Event] = None,
+    output: Optional[AnalysisOutput] = None,
+):
+    """
+    Follow a live log file and keep its level counts up to date.
+
+    The existing content is counted first, block by block, and only the
+    counts are shown for it; as with ``tail -f``, only the entries appended
+    afterwards are printed. Every ``interval`` seconds, if anything changed,
+    the counts table is printed again together with the new entries of the
+    requested level. Between polls the function sleeps, so an idle log costs
+    next to no CPU. It runs until interrupted or until ``stop`` is set.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the log file.
+    level : Optional[str], optional
+        The logging level whose new entries to display (default is None).
+    interval : float, optional
+        Seconds between refreshes of the output (default is FOLLOW_INTERVAL).
+    poll_interval : float, optional
+        Seconds between checks for new data (default is FOLLOW_POLL_INTERVAL).
+    stop : Optional[threading.Event], optional
+        An event that ends following once set (default is None).
+    output : Optional[AnalysisOutput], optional
+        The output settings; only the text format is supported (default is
+        None, text).
+    """
+    output = output or AnalysisOutput()
+    follower = LogFollower(file_path)
+    if follower.file is None:
+        output.error(f"The file {file_path} does not exist.")
+        sys.exit(1)
+
+    stop = stop or threading.Event()
+    level = level.upper() if level else None
+    counts: Counter = Counter()
+    new_lines: List[str] = []
+    changed = False
+    next_refresh = monotonic()
+
+    def count(lines: List[str], echo: bool = True):
+        nonlocal changed
+        for line in lines:
+            log = parse_log_line(line.strip(), output)
+            if log:
+                counts[log.level] += 1
+                changed = True
+                if echo and log.level == level:
+                    new_lines.append(format_log_entry(log))
+
+    def refresh():
+        display_log_counts(dict(counts))
+        if new_lines:
+            print(f"\nNew log details for level '{level}':")
+            write_lines(new_lines)
+            new_lines.clear()
+        sys.stdout.flush()  # the output layer may buffer stdout
+
+    def refresh_if_due():
+        nonlocal changed, next_refresh
+        now = monotonic()
+        if changed and now >= next_refresh:
+            refresh()
+            changed = False
+            next_refresh = now + interval
+
+    try:
+        for lines in iter(follower.read_lines, []):
+            count(lines, echo=False)
+        while True:
+            for lines in iter(follower.read_lines, []):
+                count(lines)
+                refresh_if_due()
+            refresh_if_due()
+            if stop.wait(poll_interval):
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        follower.close()
+
+    if changed:
+        refresh()
+    if output.errors is not None:
+        output.errors.display()
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase search tokens (runs of word characters).
+
+    Parameters
+    ----------
+    text : str
+        A log message or a search term.
+
+    Returns
+    -------
+    List[str]
+        The tokens in order of appearance, with repetitions.
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _encode_varint(value: int, buffer: bytearray):
+    """Append a non-negative integer in LEB128 (7 bits per byte)."""
+    while value >= 0x80:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _decode_postings(buffer: bytes) -> List[int]:
+    """Decode a posting list of gap-encoded varints back into entry ids."""
+    ids = []
+    entry_id = -1
+    value = shift = 0
+    for byte in buffer:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        entry_id += value + 1
+        ids.append(entry_id)
+        value = shift = 0
+    return ids
+
+
+class MessageIndex:
+    """
+    An inverted index from message tokens to log entry ids.
+
+    Entry ids are the positions of the entries in the order they were
+    indexed, and ``offsets`` maps every id to the byte offset of its line,
+    so the matching lines can be read without parsing the rest of the log.
+    Every posting list is stored compressed: the gaps between consecutive
+    ids as LEB128 varints, usually one byte per posting. The level of every
+    entry is kept as well, so searches can be restricted to a level without
+    the entries.
+
+    Like ``LogIndex``, a saved index covers its log up to ``indexed_length``
+    and records checksums of that prefix: while they match, the log was
+    only appended to and just the new lines are tokenized; otherwise the
+    index is rebuilt.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, bytearray] = {}
+        self.last_ids: Dict[str, int] = {}
+        self.levels = array("B")
+        self.offsets = array("Q")
+        self.invalid_offsets = array("Q")
+        self.indexed_length = 0
+        self.checksums = (0, 0)
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def add(self, log: LogEntry, offset: int = 0) -> int:
+        """
+        Index the message of the next log entry.
+
+        Parameters
+        ----------
+        log : LogEntry
+            The parsed log entry.
+        offset : int, optional
+            The byte offset of its line (default is 0, for entries that were
+            not read from a plain file).
+
+        Returns
+        -------
+        int
+            The id given to the entry.
+        """
+        entry_id = len(self.levels)
+        self.levels.append(LEVEL_CODES[log.level])
+        self.offsets.append(offset)
+        for token in set(tokenize(log.message)):
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = bytearray()
+            _encode_varint(entry_id - self.last_ids.get(token, -1) - 1, postings)
+            self.last_ids[token] = entry_id
+        return entry_id
+
+    def index_entries(self, logs: Iterable[LogEntry]) -> Iterator[LogEntry]:
+        """Index log entries as they pass through a pipeline."""
+        for log in logs:
+            self.add(log)
+            yield log
+
+    def is_valid_for(self, file: BinaryIO) -> bool:
+        """Check that the indexed prefix of the log file is unchanged."""
+        if os.fstat(file.fileno()).st_size < self.indexed_length:
+            return False  # truncated or rotated
+        return LogIndex._checksums(file, self.indexed_length) == self.checksums
+
+    def extend(self, file: BinaryIO, encoding: str) -> bool:
+        """
+        Index the complete lines after the indexed prefix.
+
+        Returns
+        -------
+        bool
+            True if any line was added.
+        """
+        offset = self.indexed_length
+        file.seek(offset)
+        quiet = _quiet_output()  # invalid lines are reported at search time
+        for raw_line in iter(file.readline, b""):
+            if not raw_line.endswith(b"\n"):
+                break  # an incomplete last line is left for the next update
+            log = parse_log_line(raw_line.decode(encoding).strip(), quiet)
+            if log is None:
+                self.invalid_offsets.append(offset)
+            else:
+                self.add(log, offset)
+            offset += len(raw_line)
+
+        if offset == self.indexed_length:
+            return False
+        self.indexed_length = offset
+        self.checksums = LogIndex._checksums(file, offset)
+        return True
+
+    def lookup(self, token: str) -> List[int]:
+        """Return the ids of the entries whose messages contain a token."""
+        postings = self.postings.get(token.lower())
+        return _decode_postings(postings) if postings else []
+
+    def search(
+        self, terms: Iterable[str], level: Optional[str] = None, match_all: bool = True
+    ) -> List[int]:
+        """
+        Find the entries whose messages contain the search terms.
+
+        A term of several words matches only entries containing all of
+        them. The shortest posting lists are intersected first.
+
+        Parameters
+        ----------
+        terms : Iterable[str]
+            The search terms.
+        level : Optional[str], optional
+            The only logging level to return (default is None, any).
+        match_all : bool, optional
+            Whether an entry must match every term (AND) or at least one (OR)
+            (default is True).
+
+        Returns
+        -------
+        List[int]
+            The ids of the matching entries, in ascending order.
+        """
+        groups = [sorted(set(tokenize(term))) for term in terms]
+        groups = [tokens for tokens in groups if tokens]
+        if not groups:
+            return []
+        if match_all:
+            groups = [[token for tokens in groups for token in tokens]]
+
+        found = set()
+        for tokens in groups:
+            lists = sorted((self.lookup(token) for token in tokens), key=len)
+            matched = set(lists[0])
+            for ids in lists[1:]:
+                if not matched:
+                    break
+                matched.intersection_update(ids)
+            found |= matched
+
+        if level is not None:
+            code = LEVEL_CODES.get(level.upper())
+            found = {entry_id for entry_id in found if self.levels[entry_id] == code}
+        return sorted(found)
+
+    @staticmethod
+    def path_for(file_path: str) -> str:
+        """Return the path of the saved message index of a log file."""
+        return file_path + SEARCH_SUFFIX
+
+    @classmethod
+    def load(cls, index_path: str) -> Optional["MessageIndex"]:
+        """
+        Read a saved index.
+
+        Returns
+        -------
+        Optional[MessageIndex]
+            The index, or None if the file is missing, damaged or written by
+            another version.
+        """
+        index = cls()
+        try:
+            with open(index_path, "rb") as file:
+                header = json.loads(file.readline())
+                if header["version"] != SEARCH_VERSION:
+                    return None
+                index.indexed_length = header["indexed_length"]
+                index.checksums = tuple(header["checksums"])
+                index.levels.fromfile(file, header["entries"])
+                index.offsets.fromfile(file, header["entries"])
+                index.invalid_offsets.fromfile(file, header["invalid"])
+                for token, length, last_id in header["tokens"]:
+                    postings = bytearray(file.read(length))
+                    if len(postings) != length:
+                        return None
+                    index.postings[token] = postings
+                    index.last_ids[token] = last_id
+        except (OSError, ValueError, KeyError, TypeError, EOFError):
+            return None
+        return index
+
+    def save(self, index_path: str):
+        """Write the index atomically, replacing the previous file."""
+        header = {
+            "version": SEARCH_VERSION,
+            "indexed_length": self.indexed_length,
+            "checksums": list(self.checksums),
+            "entries": len(self.levels),
+            "invalid": len(self.invalid_offsets),
+            "tokens": [
+                [token, len(postings), self.last_ids[token]]
+                for token, postings in self.postings.items()
+            ],
+        }
+        temp_path = f"{index_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(json.dumps(header).encode("utf-8") + b"\n")
+                self.levels.tofile(file)
+                self.offsets.tofile(file)
+                self.invalid_offsets.tofile(file)
+                for postings in self.postings.values():
+                    file.write(postings)
+            os.replace(temp_path, index_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+def update_search_index(
+    file_path: str, output: Optional[AnalysisOutput] = None
+) -> MessageIndex:
+    """
+    Bring the saved message index of a log file up to date and return it.
+
+    A valid index is extended with the appended lines only; a missing,
+    damaged or outdated one is rebuilt from scratch.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the log file.
+    output : Optional[AnalysisOutput], optional
+        The settings a failed save is reported with (default is None, text).
+
+    Returns
+    -------
+    MessageIndex
+        The up-to-date index.
+    """
+    encoding = locale.getpreferredencoding(False)
+    index_path = MessageIndex.path_for(file_path)
+    with open(file_path, "rb") as file:
+        index = MessageIndex.load(index_path)
+        rebuilt = index is None or not index.is_valid_for(file)
+        if rebuilt:
+            index = MessageIndex()
+        if index.extend(file, encoding) or rebuilt:
+            try:
+                index.save(index_path)
+            except OSError as e:
+                # Without a saved index the next search just rebuilds it
+                (output or AnalysisOutput()).warning(
+                    f"the index could not be saved to '{index_path}': {e}"
+                )
+    return index
+
+
+def _search_entries(
+    file_path: str,
+    terms: List[str],
+    level: Optional[str],
+    match_all: bool,
+    output: AnalysisOutput,
+) -> List[LogEntry]:
+    """Find the matching entries of a log file in file order."""
+    encoding = locale.getpreferredencoding(False)
+    if detect_compression(file_path):
+        # Byte offsets into a compressed file cannot be seeked to
+        index = MessageIndex()
+        logs = load_logs(file_path, index, output)
+        return [logs[entry_id] for entry_id in index.search(terms, level, match_all)]
+
+    index = update_search_index(file_path, output)
+    with open(file_path, "rb") as file:
+        # Report the invalid lines again, as a full scan would
+        for offset in index.invalid_offsets:
+            parse_log_line(_read_line_at(file, offset, encoding), output)
+        matches = [
+            parse_log_line(
+                _read_line_at(file, index.offsets[entry_id], encoding), output
+            )
+            for entry_id in index.search(terms, level, match_all)
+        ]
+
+        # An incomplete last line is not indexed yet
+        file.seek(index.indexed_length)
+        tail = io.StringIO(file.read().decode(encoding), newline=None)
+        tail_index = MessageIndex()
+        logs = (
+            log
+            for line in tail
+            for log in [parse_log_line(line.strip(), output)]
+            if log
+        )
+        tail_logs = list(tail_index.index_entries(logs))
+    if not index and not tail_logs:
+        output.error("No valid log entries found. Please check the log file format.")
+        sys.exit(1)
+    tail_ids = tail_index.search(terms, level, match_all)
+    return matches + [tail_logs[entry_id] for entry_id in tail_ids]
+
+
+def analyze_logs_search(
+    file_path: str,
+    terms: List[str],
+    level: Optional[str] = None,
+    match_all: bool = True,
+    window: Optional[TimeWindow] = None,
+    output: Optional[AnalysisOutput] = None,
+):
+    """
+    Search the log messages and display the matching entries.
+
+    The message index is brought up to date, so only the lines appended
+    since the last search are tokenized, and only the matching lines are
+    read and parsed, by seeking to their offsets.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the log file.
+    terms : List[str]
+        The search terms.
+    level : Optional[str], optional
+        The only logging level to display (default is None, any).
+    match_all : bool, optional
+        Whether an entry must match every term or any of them (default is True).
+    window : Optional[TimeWindow], optional
+        The time window of the entries to display (default is None, all).
+    output : Optional[AnalysisOutput], optional
+        The output settings (default is None, text).
+    """
+    output = output or AnalysisOutput()
+    try:
+        matches: Iterable[LogEntry] = _search_entries(
+            file_path, terms, level, match_all, output
+        )
+    except FileNotFoundError:
+        output.error(f"The file {file_path} does not exist.")
+        sys.exit(1)
+    except Exception as e:
+        output.error("An error occurred while reading the file", "", str(e))
+        sys.exit(1)
+    if window is not None:
+        matches = select_window(matches, window)
+    matches = list(matches)
+
+    if output.format != "text":
+        entries = map(_entry_formatter(output.format), matches)
+        _write_json(count_logs_by_level(matches), None, entries, output)
+        return
+    if output.errors is not None:
+        output.errors.display()
+
+    query = (" AND " if match_all else " OR ").join(f"'{term}'" for term in terms)
+    if level:
+        query += f" at level '{level.upper()}'"
+    if not matches:
+        print(f"No log entries match {query}.")
+        return
+
+    display_log_counts(count_logs_by_level(matches))
+    print(f"\nLog entries matching {query}:")
+    write_lines(format_log_entry(log) for log in matches)
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse the command-line arguments.
+
+    Parameters
+    ----------
+    argv : List[str]
+        The arguments without the program name.
+
+    Returns
+    -------
+    argparse.Namespace
+        The log file paths, the first of them as ``file_path``, the optional
+        level and the analysis options. The last positional argument is the
+        level if it names a logging level (in any case), or if it follows a
+        single path and names no existing files, so that a mistyped level is
+        warned about; any other last argument is a path too.
+    """
+    parser = argparse.ArgumentParser(
+        prog="log_analyzer.py", description="Analyze a log file by logging level."
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        metavar="file_path [level]",
+        help="paths or globs of the log files (plain, gzip, bz2 or xz), "
+        "optionally followed by the logging level to display",
+    )
+    parser.add_argument(
+        "--parallel",
+        nargs="?",
+        type=int,
+        const=0,
+        metavar="WORKERS",
+        help="analyze the file on several cores (default: one worker per CPU)",
+    )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help=f"answer from a sidecar index ({INDEX_SUFFIX}), updating it first",
+    )
+    parser.add_argument(
+        "--follow",
+        nargs="?",
+        type=float,
+        const=FOLLOW_INTERVAL,
+        metavar="SECONDS",
+        help=f"follow the growing file, refreshing every SECONDS (default: {FOLLOW_INTERVAL:g})",
+    )
+    parser.add_argument(
+        "--since",
+        type=parse_time_bound,
+        metavar="TIME",
+        help="only analyze entries at or after TIME (YYYY-MM-DD[ HH:MM[:SS]])",
+    )
+    parser.add_argument(
+        "--until",
+        type=parse_time_bound,
+        metavar="TIME",
+        help="only analyze entries before TIME (YYYY-MM-DD[ HH:MM[:SS]])",
+    )
+    parser.add_argument(
+        "--histogram",
+        choices=sorted(HISTOGRAM_BUCKETS),
+        help="also show the counts per minute or per hour",
+    )
+    parser.add_argument(
+        "--search",
+        nargs="+",
+        metavar="TERM",
+        help="show the entries whose messages contain all the terms",
+    )
+    parser.add_argument(
+        "--any",
+        action="store_true",
+        help="with --search, match entries containing any of the terms",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="output format (json and ndjson imply --error-summary)",
+    )
+    parser.add_argument(
+        "--error-summary",
+        nargs="?",
+        type=int,
+        const=ERROR_SAMPLES,
+        metavar="SAMPLES",
+        help=f"summarize invalid lines, quoting the first SAMPLES (default: {ERROR_SAMPLES})",
+    )
+    args = parser.parse_args(argv)
+    args.level = None
+    if len(args.paths) > 1 and (
+        args.paths[-1].upper() in LOG_LEVELS
+        or (len(args.paths) == 2 and not glob.glob(args.paths[-1]))
+    ):
+        args.level = args.paths.pop()
+    args.file_path = args.paths[0] if args.paths else None
+    if args.follow is not None and args.format != "text":
+        parser.error("--follow supports only the text format")
+    if args.follow is not None and (args.since or args.until or args.histogram):
+        parser.error("--follow cannot be combined with --since, --until or --histogram")
+    if args.search and (
+        args.follow is not None or args.parallel is not None or args.index or args.histogram
+    ):
+        parser.error(
+            "--search cannot be combined with --follow, --parallel, --index or --histogram"
+        )
+    return args
 
 
 def main():
     """
     Main function to run the log file analysis.
     """
-    if len(sys.argv) < 2:
+    args = parse_arguments(sys.argv[1:])
+    if not args.file_path:
         error_message("Usage: python3 log_analyzer.py /path/to/logfile.log [level]")
         sys.exit(1)
 
-    log_file_path = sys.argv[1]
-    log_level = sys.argv[2].upper() if len(sys.argv) > 2 else None
-
+    log_file_paths = expand_log_paths(args.paths)
+    log_file_path = log_file_paths[0]
+    log_level = args.level.upper() if args.level else None
     if log_level and log_level not in LOG_LEVELS:
         print(
-            f"\nWarning: '{log_level}' is not a valid log level!\nValid levels are: {', '.join(LOG_LEVELS)}\n"
+            f"\nWarning: '{log_level}' is not a valid log level!\nValid levels are: {', '.join(LOG_LEVELS)}\n",
+            file=sys.stdout if args.format == "text" else sys.stderr,
         )
         log_level = None
 
-    logs = load_logs(log_file_path)
-    counts = count_logs_by_level(logs)
-    display_log_counts(counts)
+    window = None
+    if args.since or args.until:
+        window = TimeWindow.from_datetimes(args.since, args.until)
+    bucket = HISTOGRAM_BUCKETS[args.histogram] if args.histogram else None
 
-    if log_level:
-        filtered_logs = filter_logs_by_level(logs, log_level)
-        display_filtered_logs(filtered_logs, log_level)
+    with output_layer(args.format, args.error_summary) as output:
+        if len(log_file_paths) > 1:
+            if args.search or args.follow is not None or args.index:
+                output.error("--search, --follow and --index need a single log file.")
+                sys.exit(1)
+            analyze_logs_files(
+                log_file_paths, log_level, window, bucket, args.parallel or None, output
+            )
+        elif args.search:
+            analyze_logs_search(
+                log_file_path, args.search, log_level, not args.any, window, output
+            )
+        elif args.follow is not None:
+            if os.path.exists(log_file_path) and detect_compression(log_file_path):
+                output.error(f"Cannot follow the compressed file {log_file_path}.")
+                sys.exit(1)
+            follow_logs(log_file_path, log_level, args.follow, output=output)
+        elif args.index:
+            analyze_logs_indexed(log_file_path, log_level, window, bucket, output)
+        elif args.parallel is not None:
+            analyze_logs_parallel(
+                log_file_path,
+                log_level,
+                args.parallel or None,
+                window,
+                bucket,
+                output=output,
+            )
+        else:
+            analyze_logs_streaming(log_file_path, log_level, window, bucket, output)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,383 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add project root directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.assistant_bot import (
+    CommandProtocol,
+    ContactIndex,
+    ContactStore,
+    Instrumentation,
+    add_contact,
+    change_contact,
+    find_contacts,
+    handle_command,
+    make_command_handlers,
+    parse_input,
+    reply_text,
+    run_batch,
+    serve,
+)
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance by the full dynamic programming table."""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            substitution = previous[j - 1] + (char_a != char_b)
+            current.append(min(current[j - 1] + 1, previous[j] + 1, substitution))
+        previous = current
+    return previous[-1]
+
+
+class TestContactStore(unittest.TestCase):
+    def setUp(self):
+        """Create an empty data directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_a1_journal_is_replayed(self):
+        """Test that added and changed contacts survive a restart."""
+        with ContactStore(self.directory) as contacts:
+            add_contact(contacts, "john", "123")
+            add_contact(contacts, "jane", "456")
+            change_contact(contacts, "john", "789")
+            del contacts["jane"]
+        with ContactStore(self.directory) as contacts:
+            self.assertEqual(contacts, {"john": "789"})
+
+    def test_a2_snapshot_and_journal(self):
+        """Test the compaction into a snapshot and the journal replayed after it."""
+        with ContactStore(self.directory, snapshot_min_records=10) as contacts:
+            contacts.update((f"user{i}", str(i)) for i in range(25))
+            contacts["user3"] = "changed"
+            journal = os.path.join(self.directory, ContactStore.JOURNAL_NAME)
+            self.assertLess(os.path.getsize(journal), 200)
+            expected = dict(contacts)
+        with ContactStore(self.directory) as contacts:
+            self.assertEqual(contacts, expected)
+            self.assertEqual(contacts["user3"], "changed")
+
+    def test_a3_torn_journal_record_is_dropped(self):
+        """Test that an incomplete last record from a crash is ignored."""
+        with ContactStore(self.directory) as contacts:
+            contacts["john"] = "123"
+        with open(os.path.join(self.directory, ContactStore.JOURNAL_NAME), "ab") as file:
+            file.write(b"jane\t45")
+        with ContactStore(self.directory) as contacts:
+            self.assertEqual(contacts, {"john": "123"})
+            contacts["jane"] = "456"
+        with ContactStore(self.directory) as contacts:
+            self.assertEqual(contacts, {"john": "123", "jane": "456"})
+
+    def test_a4_invalid_values_are_rejected(self):
+        """Test that values which would break the file formats are refused."""
+        contacts = ContactStore()
+        with self.assertRaises(ValueError):
+            contacts["john\tdoe"] = "123"
+        with self.assertRaises(TypeError):
+            contacts.pop("john")
+        self.assertEqual(contacts, {})
+
+    def test_a5_changes_are_flushed_before_the_fsync(self):
+        """Test that a change reaches the journal file before the batched fsync."""
+        with ContactStore(self.directory, sync_every=10, sync_interval=60) as contacts:
+            contacts["john"] = "123"
+            self.assertEqual(contacts.unsynced, 1)
+            # Another store reads the journal as a restarted process would
+            with ContactStore(self.directory) as restarted:
+                self.assertEqual(restarted, {"john": "123"})
+            contacts.sync()
+            self.assertEqual(contacts.unsynced, 0)
+
+
+class TestContactIndex(unittest.TestCase):
+    def setUp(self):
+        """Create a store with a few contacts and build its index."""
+        self.contacts = ContactStore()
+        self.contacts.update(
+            {"john": "123", "johnny": "456", "jane": "123", "joan": "789", "bob": "000"}
+        )
+        self.index = self.contacts.index
+
+    def test_b1_prefix_and_phone_lookups(self):
+        """Test the prefix ranges and the reverse phone index."""
+        self.assertEqual(self.index.prefix("jo"), ["joan", "john", "johnny"])
+        self.assertEqual(self.index.prefix("jo", limit=2), ["joan", "john"])
+        self.assertEqual(self.index.count_prefix("j"), 4)
+        self.assertEqual(sorted(self.index.by_phone("123")), ["jane", "john"])
+        self.assertEqual(self.index.by_phone("999"), [])
+
+    def test_b2_indexes_follow_changes(self):
+        """Test that add and change update the built index incrementally."""
+        add_contact(self.contacts, "jo", "555")
+        change_contact(self.contacts, "john", "555")
+        del self.contacts["bob"]
+        self.assertEqual(self.index.prefix("jo"), ["jo", "joan", "john", "johnny"])
+        self.assertEqual(sorted(self.index.by_phone("555")), ["jo", "john"])
+        self.assertEqual(self.index.by_phone("123"), ["jane"])
+        self.assertEqual(self.index.prefix("b"), [])
+
+    def test_b3_fuzzy_matches_brute_force(self):
+        """Test the pruned fuzzy search against the distance to every name."""
+        names = [
+            "anna", "ann", "annie", "hannah", "joan", "john", "johnny", "jon",
+            "jonathan", "joanna", "bob", "rob", "robert", "roberta", "",
+        ]
+        index = ContactIndex({name: "1" for name in names})
+        for query in ("jhon", "ana", "robrt", "x", "", "johnathan"):
+            for max_distance in range(4):
+                expected = sorted(
+                    (edit_distance(query, name), name)
+                    for name in names
+                    if edit_distance(query, name) <= max_distance
+                )
+                self.assertEqual(index.fuzzy(query, max_distance), expected)
+
+    def test_b4_find_command(self):
+        """Test the output of the find command, with suggestions for typos."""
+        text = "\n".join(
+            reply_text(find_contacts(self.contacts, "johnn"))
+            + reply_text(find_contacts(self.contacts, "jhon"))
+        )
+        self.assertIn("johnny: ", text)
+        self.assertIn("Did you mean:", text)
+        self.assertIn("john: ", text.split("Did you mean:")[1])
+
+
+class TestBatchMode(unittest.TestCase):
+    def setUp(self):
+        """Create an empty in-memory store to run the batches on."""
+        self.contacts = ContactStore()
+        self.handlers = make_command_handlers(self.contacts)
+
+    def run_lines(self, lines):
+        """Run a batch without colors, as batch mode does for a pipe."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            report = run_batch(lines, self.handlers, colored=False)
+        return report, output.getvalue()
+
+    def test_c1_totals_and_failures(self):
+        """Test the counts, skipped lines and failed line numbers."""
+        report, text = self.run_lines(
+            [
+                "add john 123\n",
+                "# a comment\n",
+                "\n",
+                "phone john\n",
+                "phone jane\n",
+                "bogus\n",
+                "add bob\n",
+            ]
+        )
+        self.assertEqual(report.commands, 5)
+        self.assertEqual(report.failures, 3)
+        self.assertEqual(report.failed_lines, [5, 6, 7])
+        self.assertEqual(self.contacts, {"john": "123"})
+        self.assertIn('Phone number of "john": 123', text)
+
+    def test_c2_plain_output_without_help(self):
+        """Test that errors print no color codes and no help text."""
+        report, text = self.run_lines(["bogus", "add"])
+        self.assertEqual(report.failures, 2)
+        self.assertNotIn("\x1b[", text)
+        self.assertNotIn("You can use the following commands", text)
+
+    def test_c3_exit_ends_the_batch(self):
+        """Test that an exit command stops the batch without raising."""
+        report, text = self.run_lines(["add john 123", "exit", "add bob 456"])
+        self.assertEqual(report.commands, 2)
+        self.assertEqual(report.failures, 0)
+        self.assertNotIn("bob", self.contacts)
+
+
+async def read_reply(reader):
+    """Read one framed reply: the status words and the text lines."""
+    status = (await reader.readline()).decode().split()
+    lines = []
+    for _ in range(int(status[-1])):
+        lines.append((await reader.readline()).decode().rstrip("\n"))
+    return status[:-1], lines
+
+
+class FakeTransport:
+    """Records what the protocol writes and whether reading is paused."""
+
+    def __init__(self):
+        self.written = []
+        self.paused = self.closed = False
+
+    def write(self, data):
+        self.written.append(data)
+
+    def pause_reading(self):
+        self.paused = True
+
+    def resume_reading(self):
+        self.paused = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestCommandServer(unittest.TestCase):
+    def setUp(self):
+        """Create an empty in-memory store to serve."""
+        self.contacts = ContactStore()
+
+    def run_clients(self, *clients):
+        """Serve the store and run the client coroutines against it."""
+
+        async def main():
+            server = await serve(self.contacts)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await asyncio.gather(*(client(port) for client in clients))
+
+        return asyncio.run(main())
+
+    def test_d1_pipelined_replies_in_order(self):
+        """Test that commands sent at once are answered one by one in order."""
+
+        async def client(port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"add john 123\nphone john\nphone jane\nbogus\nall\n")
+            replies = [await read_reply(reader) for _ in range(5)]
+            writer.close()
+            await writer.wait_closed()
+            return replies
+
+        [replies] = self.run_clients(client)
+        self.assertEqual(
+            replies,
+            [
+                (["OK"], ['Contact "john" added with phone number "123".']),
+                (["OK"], ['Phone number of "john": 123']),
+                (
+                    ["ERROR", "KeyError"],
+                    ["Error: Contact not found.", "\"Name 'jane' not found.\""],
+                ),
+                (
+                    ["ERROR", "TypeError"],
+                    ["Error: Incorrect command.", "Unknown command 'bogus'"],
+                ),
+                (["OK"], ["john: 123"]),
+            ],
+        )
+
+    def test_d2_concurrent_clients_share_the_store(self):
+        """Test that the changes of concurrent clients all reach the store."""
+
+        def make_client(number):
+            async def client(port):
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                for i in range(50):
+                    writer.write(f"add c{number}u{i} {i}\n".encode())
+                    await writer.drain()
+                statuses = [(await read_reply(reader))[0] for _ in range(50)]
+                writer.write(b"exit\n")
+                await read_reply(reader)
+                closed = await reader.read() == b""
+                writer.close()
+                return statuses, closed
+
+            return client
+
+        results = self.run_clients(*(make_client(n) for n in range(10)))
+        self.assertEqual(results, [([["OK"]] * 50, True)] * 10)
+        self.assertEqual(len(self.contacts), 500)
+        self.assertEqual(self.contacts.index.count_prefix("c3u"), 50)
+
+    def test_d3_backpressure_and_exit(self):
+        """Test that a full write buffer pauses reading, and exit closes."""
+        protocol = CommandProtocol(make_command_handlers(self.contacts))
+        transport = FakeTransport()
+        protocol.connection_made(transport)
+        protocol.data_received(b"add john 1")
+        self.assertEqual(transport.written, [])
+        protocol.data_received(b"23\nphone john\n")
+        self.assertEqual(len(transport.written), 1)
+        self.assertTrue(transport.written[0].startswith(b"OK 1\nContact"))
+        protocol.pause_writing()
+        self.assertTrue(transport.paused)
+        protocol.resume_writing()
+        self.assertFalse(transport.paused)
+        protocol.data_received(b"exit\nphone john\n")
+        self.assertEqual(transport.written[-1], b"OK 1\nGood bye!\n")
+        self.assertTrue(transport.closed)
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        """Turn the command statistics on, dumping to a temporary file."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dump_path = os.path.join(self.tmp.name, "stats.json")
+        self.instrumentation = Instrumentation(True, self.dump_path)
+        self.stats = self.instrumentation.stats
+        self.addCleanup(self.tmp.cleanup)
+        self.handlers = make_command_handlers(ContactStore(), self.instrumentation)
+
+    def run_commands(self, *lines):
+        return [handle_command(self.handlers, *parse_input(line)) for line in lines]
+
+    def test_e1_counts_errors_and_latencies(self):
+        """Test the call counts, the errors by type and the histograms."""
+        self.run_commands(
+            "add john 123", "add jane", "phone jane", "phone john", "oops"
+        )
+        stats = self.stats.to_dict()["commands"]
+        self.assertEqual(sorted(stats), ["?", "add", "phone"])
+        self.assertEqual(stats["add"]["calls"], 2)
+        self.assertEqual(stats["add"]["errors"], {"ValueError": 1})
+        self.assertEqual(stats["phone"]["errors"], {"KeyError": 1})
+        self.assertEqual(stats["?"]["errors"], {"TypeError": 1})
+        self.assertEqual(sum(stats["phone"]["histogram_us"].values()), 2)
+        self.assertLessEqual(stats["add"]["p50_us"], stats["add"]["p99_us"])
+
+    def test_e2_stats_command_and_dump(self):
+        """Test the stats command, turning it off, and the JSON dump."""
+        replies = self.run_commands("add john 123", "stats", "stats off", "phone john")
+        text = "\n".join(reply_text(replies[1]))
+        self.assertIn("add", text.split("\n")[1])
+        self.stats.dump()
+        with open(self.dump_path) as file:
+            dumped = json.load(file)["commands"]
+        self.assertEqual(sorted(dumped), ["add", "stats"])
+        # "stats off" itself is no longer recorded
+        self.assertEqual(dumped["stats"]["calls"], 1)
+
+    def test_e3_profile_toggle(self):
+        """Test that profiling covers only the commands run while it is on."""
+        replies = self.run_commands("profile on", "add john 123", "profile off")
+        text = "\n".join(reply_text(replies[-1]))
+        self.assertIn("add_contact", text)
+        self.assertNotIn("pstats", text)
+        [reply] = self.run_commands("profile off")
+        self.assertEqual(reply.error, "ValueError")
+
+    def test_e4_handlers_keep_their_own_instrumentation(self):
+        """Test that other handlers neither record nor see these statistics."""
+        other = make_command_handlers(ContactStore())
+        handle_command(other, *parse_input("stats on"))
+        handle_command(other, *parse_input("add jane 456"))
+        self.run_commands("add john 123")
+        self.assertEqual(self.stats.to_dict()["commands"]["add"]["calls"], 1)
+        other_stats = other.instrumentation.stats.to_dict()["commands"]
+        self.assertEqual(other_stats["add"]["calls"], 1)
+        self.assertIsNone(self.instrumentation.profiler)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,44 +1,28 @@
 from typing import Callable
 
 import unittest
-import time
-import tracemalloc
+import tempfile
+import threading
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root directory to sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from src.caching_fibonacci import caching_fibonacci
-
-
-def measure_performance(func):
-    def wrapper(*args, **kwargs):
-        # Measure time
-        start_time = time.time()
-
-        # Measure memory usage
-        tracemalloc.start()
-        result = func(*args, **kwargs)
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-        # Calculate execution time
-        end_time = time.time()
-        duration = (end_time - start_time) * 1000  # convert to milliseconds
-
-        # Convert memory usage to kilobytes
-        current_kb = current / 1024
-        peak_kb = peak / 1024
-
-        # Print performance results
-        print(
-            f"\n{func.__name__.replace('test_', '').ljust(35, '.')}: Duration: {duration:>7.3f} ms;  Mem.Curr.: {current_kb:>7.3f} KB, Peak: {peak_kb:>7.3f} KB",
-            end="",
-        )
-
-        return result
-
-    return wrapper
+from src.caching_fibonacci import (
+    FibonacciStore,
+    caching_fibonacci,
+    fib_many,
+    fib_many_parallel,
+    fib_mod,
+    fib_mod_array,
+    fib_range,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestCachingFibonacci(unittest.TestCase):
@@ -46,22 +30,18 @@ class TestCachingFibonacci(unittest.TestCase):
         """Initialize the Fibonacci function."""
         self.fib: Callable[[int], int] = caching_fibonacci()
 
-    @measure_performance
     def test_a1_base_case_zero(self):
         """Test the base case when n = 0."""
         self.assertEqual(self.fib(0), 0)
 
-    @measure_performance
     def test_a2_base_case_one(self):
         """Test the base case when n = 1."""
         self.assertEqual(self.fib(1), 1)
 
-    @measure_performance
     def test_a3_small_positive_number(self):
         """Test with a small positive number."""
         self.assertEqual(self.fib(5), 5)
 
-    @measure_performance
     def test_b1_consecutive_calls(self):
         """Test consecutive calls."""
         self.assertEqual(self.fib(16), 987)
@@ -75,18 +55,15 @@ class TestCachingFibonacci(unittest.TestCase):
         self.assertEqual(self.fib(10), 55)
         self.assertEqual(self.fib(5), 5)
 
-    @measure_performance
     def test_b2_repeated_calls_same_value(self):
         """Test repeated calls for the same Fibonacci number."""
         for _ in range(20):
             self.assertEqual(self.fib(20), 6765)
 
-    @measure_performance
     def test_c1_large_input_100(self):
         """Test the function with a large input."""
         self.assertEqual(self.fib(100), 354224848179261915075)
 
-    @measure_performance
     def test_c2_large_input_978(self):
         """Test the function with a large input."""
         self.assertEqual(
@@ -94,19 +71,142 @@ class TestCachingFibonacci(unittest.TestCase):
             1097557198057001938453841363644415006374573595389643436520255061711780089392489003778952798974711705543381888276590315395738796138788161499726039945177057123749403326820574003343599955000130556475552464664,
         )
 
-    @measure_performance
+    def test_c3_very_large_input(self):
+        """Test a cold call far beyond the recursion limit."""
+        a, b = 0, 1
+        for _ in range(100_000):
+            a, b = b, a + b
+        self.assertEqual(self.fib(100_000), a)
+
+    def test_c4_cached_values_reused(self):
+        """Test that values computed for a large input serve smaller ones."""
+        self.fib(1_000_000)
+        self.assertEqual(self.fib(250_000), caching_fibonacci()(250_000))
+        self.assertEqual(self.fib(30), 832040)
+
+    def test_c5_cache_info_and_clear(self):
+        """Test hit/miss statistics and clearing the cache."""
+        self.fib(50)
+        self.fib(50)
+        info = self.fib.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        self.assertGreater(info.currsize, 0)
+        self.fib.cache_clear()
+        self.assertEqual(self.fib.cache_info()[:4], (0, 0, None, 0))
+
+    def test_c6_bounded_caches(self):
+        """Test that the entry and byte limits hold and results stay correct."""
+        by_size = caching_fibonacci(maxsize=8)
+        by_bytes = caching_fibonacci(max_bytes=4096)
+        for n in (978, 10_000, 977, 5, 100):
+            self.assertEqual(by_size(n), self.fib(n))
+            self.assertEqual(by_bytes(n), self.fib(n))
+        self.assertLessEqual(by_size.cache_info().currsize, 8)
+        self.assertLessEqual(by_bytes.cache_info().nbytes, 4096)
+
+    def test_c7_checkpoint_cache(self):
+        """Test that checkpoint mode keeps every k-th pair and rebuilds the rest."""
+        fib = caching_fibonacci(checkpoint=16)
+        for n in range(200):
+            self.assertEqual(fib(n), self.fib(n))
+        self.assertEqual(fib(978), self.fib(978))
+        self.assertLessEqual(fib.cache_info().currsize, 2 * (978 // 16 + 1))
+
+    def test_c8_invalid_cache_options(self):
+        """Test that invalid cache limits are rejected."""
+        with self.assertRaises(ValueError):
+            caching_fibonacci(maxsize=-1)
+        with self.assertRaises(ValueError):
+            caching_fibonacci(checkpoint=0)
+
+    def test_e1_fib_range(self):
+        """Test that fib_range yields consecutive values from any start."""
+        self.assertEqual(list(fib_range(0, 8)), [0, 1, 1, 2, 3, 5, 8, 13])
+        self.assertEqual(
+            list(fib_range(970, 980)), [self.fib(n) for n in range(970, 980)]
+        )
+        self.assertEqual(list(fib_range(10, 10)), [])
+
+    def test_e2_fib_many(self):
+        """Test that fib_many answers scattered indices in the requested order."""
+        indices = [978, 5, 0, 5000, 20, 5, 1, 4999]
+        self.assertEqual(fib_many(indices), [self.fib(n) for n in indices])
+        with self.assertRaises(ValueError):
+            fib_many([3, -1])
+
+    def test_f1_fib_mod(self):
+        """Test modular Fibonacci numbers against the exact values."""
+        for m in (1, 2, 10, 1_000_000_007):
+            for n in (0, 1, 2, 50, 978):
+                self.assertEqual(fib_mod(n, m), self.fib(n) % m)
+        with self.assertRaises(ValueError):
+            fib_mod(10, 0)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_f2_fib_mod_array(self):
+        """Test the vectorized modular evaluation over an index array."""
+        indices = np.array([[0, 1, 2], [978, 12_345, 10**15]], dtype=np.int64)
+        m = 2**32
+        expected = [[fib_mod(int(n), m) for n in row] for row in indices]
+        self.assertEqual(fib_mod_array(indices, m).tolist(), expected)
+        with self.assertRaises(ValueError):
+            fib_mod_array(indices, 2**32 + 1)
+
+    def test_g1_persistent_store(self):
+        """Test that a persistent store is shared and survives a torn tail."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "fib.cache")
+            writer = caching_fibonacci(path=path)
+            self.assertEqual(writer(978), self.fib(978))
+            with open(path, "ab") as file:
+                file.write(b"\x07\x00\x00\x00\x00\x00\x00\x00\xff\x00")
+            reader = caching_fibonacci(path=path)
+            self.assertEqual(reader(978), self.fib(978))
+            self.assertEqual(reader.cache_info().hits, 1)
+            self.assertEqual(reader(2000), self.fib(2000))
+            with FibonacciStore(path) as store:
+                self.assertEqual(store.get(2000), self.fib(2000))
+
+    def test_h1_thread_safe_hammering(self):
+        """Test many threads hitting shared and distinct indices at once."""
+        fib = caching_fibonacci(maxsize=64, thread_safe=True)
+        indices = [n % 700 + 300 for n in range(4_000)]
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            results = list(executor.map(fib, indices))
+        self.assertEqual(results, [self.fib(n) for n in indices])
+        info = fib.cache_info()
+        self.assertEqual(info.hits + info.misses, len(indices))
+        self.assertLessEqual(info.currsize, 64)
+
+    def test_h2_concurrent_requests_coalesced(self):
+        """Test that simultaneous requests for one n compute it only once."""
+        fib = caching_fibonacci(thread_safe=True)
+        barrier = threading.Barrier(16)
+
+        def request(_):
+            barrier.wait()
+            return fib(200_000)
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = set(executor.map(request, range(16)))
+        self.assertEqual(len(results), 1)
+        self.assertEqual(fib.cache_info().misses, 1)
+
+    def test_h3_fib_many_parallel(self):
+        """Test the process pool evaluator against the serial sweep."""
+        indices = [50_000, 3, 978, 20_000, 978, 0, 49_999]
+        self.assertEqual(fib_many_parallel(indices, max_workers=2), fib_many(indices))
+
     def test_d1_negative_input(self):
         """Validate the function's behavior with a negative input."""
         with self.assertRaises(ValueError):
             self.fib(-5)
 
-    @measure_performance
     def test_d2_float_input(self):
         """Check the function's response to non-integer input."""
         with self.assertRaises(ValueError):
             self.fib(5.5)
 
-    @measure_performance
     def test_d3_string_input(self):
         """Check the function's response to string input."""
         with self.assertRaises(TypeError):
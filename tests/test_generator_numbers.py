@@ -0,0 +1,82 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from decimal import Decimal
+
+# Add project root directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.generator_numbers import (
+    NumberAggregate,
+    aggregate_numbers_stream,
+    generator_numbers,
+    generator_numbers_stream,
+    sum_profit,
+    sum_profit_parallel,
+    sum_profit_stream,
+    scan_numbers,
+)
+
+TEXT = (
+    "The total income of the employee consists of several parts: 1000.01 as the main income, "
+    "supplemented by additional receipts of 27,45 , 324.00 and 100 dollars."
+)
+
+
+class TestGeneratorNumbers(unittest.TestCase):
+    def test_a1_sum_profit(self):
+        """Test the example from the task description."""
+        self.assertAlmostEqual(sum_profit(TEXT, generator_numbers), 1451.46)
+
+    def test_a2_adjacent_numbers(self):
+        """Test that numbers sharing a delimiting space are all found."""
+        self.assertEqual(list(generator_numbers(" 10 20 30 x 4,5 ")), [10, 20, 30, 4.5])
+
+    def test_a3_scan_numbers_is_exact(self):
+        """Test the exact aggregate over a bytes buffer."""
+        aggregate = scan_numbers(memoryview(b" 0.1 0.2 7 0,30 x 12. "))
+        self.assertEqual(
+            aggregate,
+            NumberAggregate(Decimal("7.6"), 4, Decimal("0.1"), Decimal("7")),
+        )
+        self.assertEqual(scan_numbers(b"no numbers"), (0, 0, None, None))
+
+    def test_b1_stream_matches_serial_at_every_chunk_size(self):
+        """Test that numbers split between chunks are matched exactly once."""
+        expected = list(generator_numbers(TEXT))
+        for chunk_size in (1, 2, 3, 7, 64, 4096):
+            stream = io.BytesIO(TEXT.encode())
+            self.assertEqual(
+                list(generator_numbers_stream(stream, chunk_size)), expected
+            )
+            stream = io.BytesIO(TEXT.encode())
+            self.assertEqual(
+                aggregate_numbers_stream(stream, chunk_size).total,
+                Decimal("1451.46"),
+            )
+
+    def test_b2_stream_from_file(self):
+        """Test the memory-mapped path for a file on disk."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "report.txt")
+            with open(path, "w") as file:
+                file.write(TEXT * 100)
+            self.assertAlmostEqual(sum_profit_stream(path), 145146.0, places=6)
+            empty = os.path.join(tmp, "empty.txt")
+            open(empty, "w").close()
+            self.assertEqual(sum_profit_stream(empty), 0)
+
+    def test_c1_parallel_matches_serial(self):
+        """Test that sharding keeps the space-delimited matching rule."""
+        text = " 10 20 x 1,5 " * 1000 + TEXT
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "report.txt")
+            with open(path, "w") as file:
+                file.write(text)
+            total = sum_profit_parallel(path, max_workers=3, min_shard_size=64)
+        self.assertAlmostEqual(total, sum_profit(text, generator_numbers), places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
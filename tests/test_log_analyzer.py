@@ -0,0 +1,639 @@
+import argparse
+import bz2
+import contextlib
+import gzip
+import io
+import json
+import lzma
+import mmap
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from collections import Counter
+from datetime import date, datetime, time
+
+# Add project root directory to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.log_analyzer import (
+    AnalysisOutput,
+    LogColumns,
+    LogEntry,
+    LogFollower,
+    LogIndex,
+    MessageIndex,
+    ParseErrorSummary,
+    TimeWindow,
+    analyze_logs_files,
+    analyze_logs_indexed,
+    analyze_logs_parallel,
+    analyze_logs_search,
+    analyze_logs_streaming,
+    count_levels,
+    count_logs_by_level,
+    display_filtered_logs,
+    display_log_counts,
+    expand_log_paths,
+    filter_logs_by_level,
+    find_window_range,
+    follow_logs,
+    iter_log_entries,
+    iter_window_entries,
+    load_logs,
+    load_logs_columnar,
+    output_layer,
+    parse_arguments,
+    parse_log_line,
+    parse_time_bound,
+    select_level,
+    select_window,
+    update_log_index,
+    update_search_index,
+)
+
+SAMPLE_LOG = """\
+2024-01-22 08:30:01 INFO User logged in successfully.
+2024-01-22 08:45:23 DEBUG Attempting to connect to the database.
+2024-01-22 09:00:45 ERROR Database connection failed.
+2024-01-22 09:15:10 INFO Data export completed.
+2024-01-22 10:30:55 WARNING Disk usage above 80%.
+2024-01-22 11:05:00 DEBUG Starting data backup process.
+2024-01-22 11:30:15 ERROR Backup process failed.
+2024-01-22 12:00:00 INFO User logged out.
+2024-01-22 12:45:05 DEBUG Checking system health.
+2024-01-22 13:30:30 INFO Scheduled maintenance.
+"""
+
+
+class TestLogAnalyzer(unittest.TestCase):
+    def setUp(self):
+        """Write the sample log to a temporary file."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sample.log")
+        with open(self.path, "w") as file:
+            file.write(SAMPLE_LOG + "not a log line\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_quietly(self, func, *args):
+        """Call a function and return what it printed."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            func(*args)
+        return output.getvalue()
+
+    def test_a1_parse_valid_line(self):
+        """Test parsing a well-formed line."""
+        self.assertEqual(
+            parse_log_line("2024-01-22 09:00:45 error Database connection failed."),
+            LogEntry(
+                date(2024, 1, 22), time(9, 0, 45), "ERROR", "Database connection failed."
+            ),
+        )
+
+    def test_a2_parse_invalid_lines(self):
+        """Test that malformed lines are rejected."""
+        for line in (
+            "not a log line",
+            "2024-13-22 09:00:45 INFO Bad month.",
+            "2024-01-22 25:00:45 INFO Bad hour.",
+            "2024-01-22 09:00:45 FATAL Unknown level.",
+        ):
+            with self.subTest(line=line):
+                with contextlib.redirect_stdout(io.StringIO()) as output:
+                    self.assertIsNone(parse_log_line(line))
+                self.assertIn("Error:", output.getvalue())
+
+    def test_a3_parse_matches_strptime_rules(self):
+        """Test that layouts outside the fast path are still judged by strptime."""
+        entry = parse_log_line("2024-1-22 8:05:09 INFO Unpadded fields.")
+        self.assertEqual((entry.date, entry.time), (date(2024, 1, 22), time(8, 5, 9)))
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertIsNone(parse_log_line("2024-02-30 08:05:09 INFO No such day."))
+        self.assertIn("day is out of range for month", output.getvalue())
+
+    def test_b1_streaming_pipeline(self):
+        """Test that counting and filtering stages see every entry once."""
+        counts = Counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            logs = count_levels(iter_log_entries(self.path), counts)
+            errors = list(select_level(logs, "error"))
+        self.assertEqual(counts, {"INFO": 4, "DEBUG": 3, "ERROR": 2, "WARNING": 1})
+        self.assertEqual(
+            [log.time for log in errors], [time(9, 0, 45), time(11, 30, 15)]
+        )
+
+    def test_b2_streaming_output_matches_list_based(self):
+        """Test that the single-pass analysis prints what the list-based path prints."""
+
+        def list_based():
+            logs = load_logs(self.path)
+            display_log_counts(count_logs_by_level(logs))
+            display_filtered_logs(filter_logs_by_level(logs, "error"), "error")
+
+        self.assertEqual(
+            self.run_quietly(analyze_logs_streaming, self.path, "ERROR"),
+            self.run_quietly(list_based),
+        )
+
+    def test_b3_parallel_output_matches_serial(self):
+        """Test that merging the ranges in file order reproduces the serial output."""
+        with open(self.path, "a") as file:
+            file.write(SAMPLE_LOG * 20 + "2024-01-22 bad-time INFO Broken.\n")
+        for level in ("ERROR", None):
+            self.assertEqual(
+                self.run_quietly(
+                    lambda: analyze_logs_parallel(self.path, level, 3, min_range_size=1)
+                ),
+                self.run_quietly(analyze_logs_streaming, self.path, level),
+            )
+        # A file smaller than two ranges is analyzed serially
+        self.assertEqual(
+            self.run_quietly(analyze_logs_parallel, self.path, "ERROR", 3),
+            self.run_quietly(analyze_logs_streaming, self.path, "ERROR"),
+        )
+
+    def test_b4_indexed_output_matches_serial(self):
+        """Test the sidecar index before and after the log grows or is rewritten."""
+        for content in ("", "2024-01-23 08:00:00 ERROR Late entry.\n", None):
+            if content is None:
+                with open(self.path, "w") as file:
+                    file.write("".join(SAMPLE_LOG.splitlines(True)[:5]))
+            else:
+                with open(self.path, "a") as file:
+                    file.write(content)
+            for level in ("ERROR", "debug", None):
+                self.assertEqual(
+                    self.run_quietly(analyze_logs_indexed, self.path, level),
+                    self.run_quietly(analyze_logs_streaming, self.path, level),
+                )
+        index = LogIndex.load(LogIndex.path_for(self.path))
+        self.assertEqual(index.indexed_length, os.path.getsize(self.path))
+        self.assertEqual(sum(index.counts.values()), 5)
+
+    def test_b5_follower_survives_truncation_and_rotation(self):
+        """Test that only complete new lines are read, across truncation and rotation."""
+        follower = LogFollower(self.path, "utf-8")
+        self.assertEqual(len(follower.read_lines()), 11)
+        self.assertEqual(follower.read_lines(), [])
+
+        with open(self.path, "a") as file:
+            file.write("2024-01-23 08:00:00 INFO One.\n2024-01-23 08:00:01 INFO Tw")
+        self.assertEqual(follower.read_lines(), ["2024-01-23 08:00:00 INFO One.\n"])
+        with open(self.path, "a") as file:
+            file.write("o.\n")
+        self.assertEqual(follower.read_lines(), ["2024-01-23 08:00:01 INFO Two.\n"])
+
+        with open(self.path, "w") as file:
+            file.write("2024-01-23 09:00:00 DEBUG Truncated.\n")
+        self.assertEqual(follower.read_lines(), ["2024-01-23 09:00:00 DEBUG Truncated.\n"])
+
+        os.rename(self.path, self.path + ".1")
+        with open(self.path + ".1", "a") as file:
+            file.write("2024-01-23 09:00:01 DEBUG Last old.")
+        with open(self.path, "w") as file:
+            file.write("2024-01-23 10:00:00 ERROR Rotated.\n")
+        self.assertEqual(
+            follower.read_lines(),
+            ["2024-01-23 09:00:01 DEBUG Last old.", "2024-01-23 10:00:00 ERROR Rotated.\n"],
+        )
+        follower.close()
+
+    def test_b6_follow_counts_existing_entries_without_echoing_them(self):
+        """Test one poll of follow mode."""
+        stop = threading.Event()
+        stop.set()
+        output = self.run_quietly(follow_logs, self.path, "error", 0, 0, stop)
+        self.assertEqual(output, self.run_quietly(analyze_logs_streaming, self.path))
+
+    def test_c1_columnar_store(self):
+        """Test that the columnar store answers like the list of entries."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            logs = load_logs(self.path)
+            columns = load_logs_columnar(self.path)
+        self.assertEqual(len(columns), len(logs))
+        self.assertEqual(list(columns), logs)
+        self.assertEqual(columns[-1], logs[-1])
+        self.assertEqual(count_logs_by_level(columns), count_logs_by_level(logs))
+        for level in ("info", "ERROR", "Warning", "debug"):
+            self.assertEqual(
+                filter_logs_by_level(columns, level), filter_logs_by_level(logs, level)
+            )
+
+    def test_c2_columnar_store_is_compact(self):
+        """Test that an entry takes far less than a LogEntry tuple with its objects."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            columns = LogColumns.from_entries(load_logs(self.path))
+        message_bytes = len(columns.messages)
+        self.assertLessEqual(columns.nbytes() - message_bytes, 8 * 3 * len(columns))
+
+    def test_b7_unwritable_index_is_not_fatal(self):
+        """Test that an index that cannot be saved is still used in memory."""
+        index_path = LogIndex.path_for(self.path)
+        os.mkdir(index_path)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            index = update_log_index(self.path)
+        self.assertIn("Warning: the index could not be saved", output.getvalue())
+        self.assertEqual(index.indexed_length, os.path.getsize(self.path))
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["sample.log", "sample.log.idx"])
+
+    def test_b8_follow_prints_only_appended_entries(self):
+        """Test that following an existing file prints just the new entries."""
+        follower = LogFollower(self.path, "utf-8", read_size=64)
+        reads = list(iter(follower.read_lines, []))
+        follower.close()
+        self.assertGreater(len(reads), 1)
+        self.assertEqual(sum(map(len, reads)), 11)
+
+        stop = threading.Event()
+        output = io.StringIO()
+
+        def follow():
+            with contextlib.redirect_stdout(output):
+                follow_logs(self.path, "error", 0, 0.01, stop)
+
+        def wait_for(text):
+            for _ in range(500):
+                if text in output.getvalue():
+                    return
+                stop.wait(0.01)
+            self.fail(f"{text!r} was not printed")
+
+        thread = threading.Thread(target=follow)
+        thread.start()
+        try:
+            wait_for("ERROR")
+            with open(self.path, "a") as file:
+                file.write("2024-01-23 08:00:00 ERROR Appended.\n")
+            wait_for("New log details")
+        finally:
+            stop.set()
+            thread.join()
+        text = output.getvalue()
+        self.assertIn("2024-01-23 08:00:00 - Appended.", text)
+        self.assertNotIn("Database connection failed.", text)
+        self.assertEqual(text.count("New log details"), 1)
+
+
+class TestTimeWindows(unittest.TestCase):
+    def setUp(self):
+        """Write the sample log to a temporary file."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sample.log")
+        with open(self.path, "w") as file:
+            file.write(SAMPLE_LOG)
+        self.window = TimeWindow.from_datetimes(
+            parse_time_bound("2024-01-22 09:00"), parse_time_bound("2024-01-22T12:00:00")
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_d1_window_bounds(self):
+        """Test that the window includes its start and excludes its end."""
+        self.assertEqual(parse_time_bound("2024-01-22"), datetime(2024, 1, 22))
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_time_bound("22.01.2024")
+        logs = list(iter_log_entries(self.path))
+        selected = list(select_window(logs, self.window))
+        self.assertEqual(str(selected[0].time), "09:00:45")
+        self.assertEqual(str(selected[-1].time), "11:30:15")
+        self.assertEqual(len(selected), 5)
+
+    def test_d2_columnar_window_and_histogram(self):
+        """Test the binary search over sorted timestamps and the one-pass histogram."""
+        columns = load_logs_columnar(self.path)
+        self.assertTrue(columns.is_sorted)
+        selected = columns.select_window(self.window)
+        self.assertEqual(list(selected), list(select_window(columns, self.window)))
+
+        histogram = Counter()
+        counts = count_logs_by_level(selected, histogram, 3600)
+        self.assertEqual(counts, {"DEBUG": 1, "ERROR": 2, "INFO": 1, "WARNING": 1})
+        hour = TimeWindow.from_datetimes(datetime(2024, 1, 22, 11)).since
+        self.assertEqual(histogram[hour, "ERROR"], 1)
+        self.assertEqual(histogram[hour, "DEBUG"], 1)
+
+        list_histogram = Counter()
+        self.assertEqual(count_logs_by_level(list(selected), list_histogram, 3600), counts)
+        self.assertEqual(list_histogram, histogram)
+
+    def test_d3_all_modes_agree(self):
+        """Test the window and histogram in the streaming, parallel and indexed modes."""
+        lines = SAMPLE_LOG.splitlines(True)
+        with open(self.path, "w") as file:
+            for i, line in enumerate(lines):
+                file.write(line + (f"bad line {i}\n" if i % 3 == 0 else ""))
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            analyze_logs_streaming(self.path, "ERROR", self.window, 60)
+        expected = output.getvalue()
+        self.assertIn("2024-01-22 10:30 │", expected)
+        # Only the invalid line among the entries of the window is reported
+        self.assertEqual(expected.count("Line: bad line"), 1)
+        self.assertIn("Line: bad line 3", expected)
+        for analyze in (
+            lambda: analyze_logs_parallel(
+                self.path, "ERROR", 2, self.window, 60, min_range_size=1
+            ),
+            lambda: analyze_logs_indexed(self.path, "ERROR", self.window, 60),
+        ):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                analyze()
+            self.assertEqual(output.getvalue(), expected)
+
+    def test_d4_window_found_by_bisecting_offsets(self):
+        """Test that only the window's byte range is read, unless out of order."""
+        with open(self.path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            start, end = find_window_range(mapped, self.window, "utf-8")
+            self.assertTrue(mapped[start:].startswith(b"2024-01-22 09:00:45"))
+            self.assertTrue(mapped[end:].startswith(b"2024-01-22 12:00:00"))
+        entries = list(iter_window_entries(self.path, self.window))
+        self.assertEqual(entries, list(select_window(iter_log_entries(self.path), self.window)))
+
+        lines = SAMPLE_LOG.splitlines(True)
+        with open(self.path, "w") as file:
+            file.write("".join(lines[len(lines) // 2 :] + lines[: len(lines) // 2]))
+        with open(self.path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            self.assertIsNone(find_window_range(mapped, self.window, "utf-8"))
+        self.assertEqual(
+            list(select_window(iter_window_entries(self.path, self.window), self.window)),
+            list(select_window(iter_log_entries(self.path), self.window)),
+        )
+
+
+class TestMessageSearch(unittest.TestCase):
+    def setUp(self):
+        """Write the sample log to a temporary file."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sample.log")
+        with open(self.path, "w") as file:
+            file.write(SAMPLE_LOG)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_e1_search_terms_and_levels(self):
+        """Test AND/OR searches with a level filter over the postings."""
+        index = MessageIndex()
+        logs = load_logs(self.path, index)
+        self.assertEqual(len(index), len(logs))
+        self.assertEqual(index.lookup("Backup"), [5, 6])
+        self.assertEqual(index.search(["process", "failed"]), [6])
+        self.assertEqual(
+            index.search(["database", "backup process"], match_all=False), [1, 2, 5, 6]
+        )
+        self.assertEqual(index.search(["database"], level="error"), [2])
+        self.assertEqual(index.search(["missing"]), [])
+
+        # Gaps between ids are stored as one-byte varints here
+        self.assertEqual(len(index.postings["user"]), 2)
+
+    def test_e2_index_is_saved_and_extended(self):
+        """Test that the saved index is extended on append and rebuilt on rewrite."""
+        index = update_search_index(self.path)
+        saved = MessageIndex.load(MessageIndex.path_for(self.path))
+        self.assertEqual(saved.postings, index.postings)
+        self.assertEqual(saved.offsets, index.offsets)
+        self.assertEqual(saved.search(["data"]), index.search(["data"]))
+
+        size = os.path.getsize(self.path)
+        with open(self.path, "a") as file:
+            file.write("2024-01-23 08:00:00 ERROR Data lost.\n")
+        extended = update_search_index(self.path)
+        self.assertEqual(extended.offsets[: len(index)], index.offsets)
+        self.assertEqual(extended.offsets[-1], size)
+        self.assertEqual(extended.search(["data"], level="ERROR"), [len(index)])
+
+        with open(self.path, "w") as file:
+            file.write("2024-01-23 08:00:00 INFO Data restored.\n")
+        rebuilt = update_search_index(self.path)
+        self.assertEqual(list(rebuilt.offsets), [0])
+        self.assertEqual(rebuilt.search(["data"]), [0])
+
+    def test_e3_search_reads_only_matching_lines(self):
+        """Test the output with an invalid line and an incomplete last line."""
+        with open(self.path, "a") as file:
+            file.write("not a log line\n2024-01-23 08:00:00 ERROR Backup retried")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            analyze_logs_search(self.path, ["backup"], "error")
+        text = output.getvalue()
+        self.assertEqual(text.count("Line: not a log line"), 1)
+        self.assertIn("2024-01-22 11:30:15 - Backup process failed.", text)
+        self.assertIn("2024-01-23 08:00:00 - Backup retried", text)
+        self.assertNotIn("Starting data backup", text)
+        index = MessageIndex.load(MessageIndex.path_for(self.path))
+        self.assertEqual(len(index.invalid_offsets), 1)
+        self.assertEqual(index.indexed_length, len(SAMPLE_LOG) + len("not a log line\n"))
+
+    def test_e4_unwritable_search_index_is_reported(self):
+        """Test that a search index that cannot be saved is warned about and used."""
+        os.mkdir(MessageIndex.path_for(self.path))
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            index = update_search_index(self.path)
+        self.assertIn("Warning: the index could not be saved", output.getvalue())
+        self.assertEqual(index.search(["backup", "failed"]), [6])
+
+
+class TestMultipleFiles(unittest.TestCase):
+    def setUp(self):
+        """Write the sample log plain and compressed, as rotated files."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = os.path.join(self.tmp.name, "app.log")
+        data = SAMPLE_LOG.encode()
+        with open(self.base, "wb") as file:
+            file.write(data)
+        for suffix, compress in (
+            (".1.gz", gzip.compress),
+            (".2.bz2", bz2.compress),
+            (".10.xz", lzma.compress),
+        ):
+            with open(self.base + suffix, "wb") as file:
+                file.write(compress(data))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_f1_compressed_files_are_read_transparently(self):
+        """Test that gzip, bz2 and xz logs parse like the plain one."""
+        expected = load_logs(self.base)
+        for suffix in (".1.gz", ".2.bz2", ".10.xz"):
+            self.assertEqual(load_logs(self.base + suffix), expected)
+
+    def test_f2_files_are_merged_in_order(self):
+        """Test the glob expansion and the merged analysis of several files."""
+        paths = expand_log_paths([self.base + "*"])
+        self.assertEqual(
+            [os.path.basename(path) for path in paths],
+            ["app.log", "app.log.1.gz", "app.log.2.bz2", "app.log.10.xz"],
+        )
+
+        combined = os.path.join(self.tmp.name, "combined.txt")
+        with open(combined, "w") as file:
+            file.write(SAMPLE_LOG * 4)
+        outputs = []
+        for analyze in (
+            lambda: analyze_logs_files(paths, "ERROR", None, 3600, 2),
+            lambda: analyze_logs_streaming(combined, "ERROR", None, 3600),
+        ):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                analyze()
+            outputs.append(output.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertIn("ERROR         │ 8", outputs[0])
+
+    def test_f3_level_follows_the_paths(self):
+        """Test that the last positional argument is the level unless it is a file."""
+        args = parse_arguments([self.base + "*", "error"])
+        self.assertEqual((args.paths, args.level), ([self.base + "*"], "error"))
+        args = parse_arguments([self.base, self.base + ".1.gz"])
+        self.assertEqual((args.file_path, args.level), (self.base, None))
+        self.assertEqual(parse_arguments(["missing.log", "info"]).level, "info")
+        args = parse_arguments([self.base, "eror"])
+        self.assertEqual((args.paths, args.level), ([self.base], "eror"))
+        args = parse_arguments([self.base, self.base + ".1.gz", "eror"])
+        self.assertEqual((args.paths[-1], args.level), ("eror", None))
+
+    def test_f4_missing_file_is_reported_with_nonzero_exit(self):
+        """Test that the readable files are shown before exiting with status 1."""
+        missing = os.path.join(self.tmp.name, "errors")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), self.assertRaises(SystemExit) as exit:
+            analyze_logs_files([self.base, missing], "ERROR", max_workers=1)
+        self.assertEqual(exit.exception.code, 1)
+        text = output.getvalue()
+        self.assertIn(f"The file {missing} does not exist.", text)
+        self.assertIn("2024-01-22 11:30:15 - Backup process failed.", text)
+
+
+class TestOutputLayer(unittest.TestCase):
+    def setUp(self):
+        """Write a sample log with invalid lines of every kind."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sample.log")
+        with open(self.path, "w") as file:
+            for _ in range(30):
+                file.write(SAMPLE_LOG)
+                file.write("bad line\n2024-01-22 25:00:00 INFO Late.\n")
+                file.write("2024-01-22 08:00:00 TRACE Noise.\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_output(self, func, *args, **layer):
+        """Call an analysis inside the output layer and return what it printed."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), output_layer(**layer) as settings:
+            func(*args, output=settings)
+        return output.getvalue()
+
+    def test_g1_errors_are_summarized(self):
+        """Test the counts per kind and the samples, also when merged from workers."""
+        summary = ParseErrorSummary(2)
+        load_logs(self.path, output=AnalysisOutput(errors=summary))
+        self.assertEqual(
+            summary.counts,
+            {
+                "Invalid log string format": 30,
+                "Date or time format error": 30,
+                "Invalid log level": 30,
+            },
+        )
+        self.assertEqual(
+            [line for _, line, _ in summary.samples],
+            ["bad line", "2024-01-22 25:00:00 INFO Late."],
+        )
+
+        output = self.run_output(
+            analyze_logs_streaming, self.path, "ERROR", error_samples=3
+        )
+        self.assertIn("Skipped 90 invalid lines:", output)
+        self.assertEqual(output.count("Error: "), 3)
+        self.assertEqual(
+            self.run_output(
+                lambda output: analyze_logs_parallel(
+                    self.path, "ERROR", 3, min_range_size=1, output=output
+                ),
+                error_samples=3,
+            ),
+            output,
+        )
+
+    def test_g2_json_and_ndjson(self):
+        """Test that the machine-readable formats carry the same results."""
+        document = json.loads(
+            self.run_output(
+                analyze_logs_streaming, self.path, "ERROR", output_format="json"
+            )
+        )
+        self.assertEqual(document["counts"]["ERROR"], 60)
+        self.assertEqual(document["errors"]["total"], 90)
+        self.assertEqual(
+            document["entries"][0],
+            {
+                "date": "2024-01-22",
+                "time": "09:00:45",
+                "level": "ERROR",
+                "message": "Database connection failed.",
+            },
+        )
+
+        records = [
+            json.loads(line)
+            for line in self.run_output(
+                analyze_logs_streaming, self.path, "ERROR", output_format="ndjson"
+            ).splitlines()
+        ]
+        self.assertEqual(records[0], {"type": "counts", "counts": document["counts"]})
+        self.assertEqual(records[1]["total"], 90)
+        entries = [record for record in records if record.pop("type") == "entry"]
+        self.assertEqual(entries, document["entries"])
+
+    def test_g3_json_entries_keep_their_fields(self):
+        """Test that the entries are serialized from their fields in every mode."""
+        with open(self.path, "a") as file:
+            file.write("2024-01-23 08:00:00 ERROR Retry 2 - failed again.\n")
+        last = {
+            "date": "2024-01-23",
+            "time": "08:00:00",
+            "level": "ERROR",
+            "message": "Retry 2 - failed again.",
+        }
+        for analyze in (
+            lambda output: analyze_logs_streaming(self.path, "error", output=output),
+            lambda output: analyze_logs_parallel(
+                self.path, "error", 3, min_range_size=1, output=output
+            ),
+            lambda output: analyze_logs_indexed(self.path, "error", output=output),
+            lambda output: analyze_logs_files(
+                [self.path], "error", max_workers=1, output=output
+            ),
+        ):
+            document = json.loads(self.run_output(analyze, output_format="json"))
+            self.assertEqual(document["entries"][-1], last)
+            self.assertEqual(len(document["entries"]), 61)
+
+    def test_g4_output_settings_are_per_call(self):
+        """Test that an analysis without settings is unaffected by an active layer."""
+        text = io.StringIO()
+        with contextlib.redirect_stdout(text), output_layer("json"):
+            with contextlib.redirect_stdout(io.StringIO()) as inner:
+                analyze_logs_streaming(self.path, "ERROR")
+        self.assertEqual(text.getvalue(), "")
+        self.assertEqual(inner.getvalue().count("Error: Invalid log level"), 30)
+        self.assertIn("Log details for level 'ERROR':", inner.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()